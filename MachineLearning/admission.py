@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Kabul Kontrolü - çıkarım aşamasının önünde sınırlı kuyruk ve eşzamanlılık
+
+Aynı anda en fazla max_concurrency istek modelleri çalıştırır, en fazla
+max_queue istek sırada bekler. Kuyruk doluysa istek hemen reddedilir
+(Overloaded) ve Retry-After değeri kuyruğun güncel boşalma hızından
+hesaplanır. Sırası gelen isteğin istemcisi bağlantıyı kapatmışsa model hiç
+çalıştırılmaz (ClientDisconnected).
+
+Bekleyen istekler şeritlere (interactive, batch, background; isteğe bağlı
+olarak API anahtarı başına kiracı alt şeritleri) ayrılır ve ağırlıklı adil
+kuyruk (WFQ) ile sıraya girer: her istek maliyet/ağırlık kadar sanal bitiş
+zamanı alır, en küçük bitiş zamanlı istek önce çalışır. Böylece büyük
+işlerin dilimleri etkileşimli isteklerle araya girerek çalışır.
+
+Kiracı alt şeritleri yalnızca sırada isteği varken izlenir; kuyruğu boşalan
+kiracının kaydı silinir ve aynı anda en fazla max_tenants kiracı izlenir
+(fazlası şeridin ortak alt şeridini paylaşır). Sayaçlar kiracısız şerit
+başına tutulur.
+"""
+
+import asyncio
+import heapq
+import itertools
+import math
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from fastapi.concurrency import run_in_threadpool
+
+DEFAULT_MAX_CONCURRENCY = 2
+DEFAULT_MAX_QUEUE = 64
+EWMA_ALPHA = 0.2
+DEFAULT_LANE_WEIGHTS = {"interactive": 8.0, "batch": 2.0, "background": 1.0}
+DEFAULT_MAX_TENANTS = 256
+
+
+class Overloaded(Exception):
+    """Kuyruk dolu - retry_after saniye sonra tekrar denenmeli"""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"Sunucu yoğun, {retry_after} sn sonra tekrar deneyin")
+        self.retry_after = retry_after
+
+
+class ClientDisconnected(Exception):
+    """İstemci sıra beklerken bağlantıyı kapattı"""
+
+
+class LatencyEstimator:
+    """Aşama başına canlı gecikme tahmini (yorum başına saniye, EWMA)"""
+
+    def __init__(self, alpha: float = EWMA_ALPHA):
+        self.alpha = alpha
+        self._per_item: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, stage: str, seconds: float, items: int = 1) -> None:
+        per_item = seconds / max(items, 1)
+        with self._lock:
+            current = self._per_item.get(stage)
+            self._per_item[stage] = per_item if current is None else current + self.alpha * (per_item - current)
+
+    def estimate(self, stage: str, items: int = 1) -> Optional[float]:
+        """items yorum için tahmini süre (henüz ölçüm yoksa None)"""
+        per_item = self._per_item.get(stage)
+        return per_item * items if per_item is not None else None
+
+    def stats(self) -> Dict[str, float]:
+        return {stage: round(value * 1000, 3) for stage, value in self._per_item.items()}
+
+
+def parse_lane_weights(spec: str) -> Dict[str, float]:
+    """"interactive=8,batch=2,background=1" biçimindeki ağırlıkları oku"""
+    weights = dict(DEFAULT_LANE_WEIGHTS)
+    for part in spec.split(","):
+        if "=" not in part:
+            continue
+        lane, value = part.split("=", 1)
+        weights[lane.strip()] = float(value)
+    return weights
+
+
+class _LaneStats:
+    """Şerit başına kuyruk ve gecikme sayaçları"""
+
+    def __init__(self):
+        self.queued = 0
+        self.queued_cost = 0
+        self.active = 0
+        self.admitted = 0
+        self.completed = 0
+        self.rejected = 0
+        self.dropped = 0
+        self.wait_ms: Optional[float] = None
+        self.service_ms: Optional[float] = None
+
+    def observe(self, attribute: str, value: float) -> None:
+        current = getattr(self, attribute)
+        setattr(self, attribute, value if current is None else current + EWMA_ALPHA * (value - current))
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "queued": self.queued,
+            "queued_comments": self.queued_cost,
+            "active": self.active,
+            "admitted": self.admitted,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "dropped_disconnected": self.dropped,
+            "wait_ms": round(self.wait_ms, 2) if self.wait_ms is not None else None,
+            "service_ms": round(self.service_ms, 2) if self.service_ms is not None else None
+        }
+
+
+class _Waiter:
+    """Sırada bekleyen istek (asyncio görevi veya iş parçacığı)"""
+
+    __slots__ = ("lane", "cost", "start", "finish", "seq", "enqueued_at", "wake", "granted", "cancelled")
+
+    def __init__(self, lane: str, cost: int, start: float, finish: float, seq: int, wake: Callable[[], None]):
+        self.lane = lane
+        self.cost = cost
+        self.start = start
+        self.finish = finish
+        self.seq = seq
+        self.enqueued_at = time.perf_counter()
+        self.wake = wake
+        self.granted = False
+        self.cancelled = False
+
+    def __lt__(self, other: "_Waiter") -> bool:
+        return (self.finish, self.seq) < (other.finish, other.seq)
+
+
+class AdmissionController:
+    """Sınırlı kuyruklu, şerit ağırlıklı, boşalma hızını ölçen eşzamanlılık sınırlayıcı
+
+    Maliyet (cost) işteki yorum sayısıdır; Retry-After, bekleyen ve çalışan
+    yorumların yorum/saniye cinsinden ölçülen hızla ne zaman biteceğinden
+    hesaplanır. Hem asyncio görevleri (run) hem de iş parçacıkları (run_sync)
+    aynı kuyruğu paylaşır.
+    """
+
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 max_queue: int = DEFAULT_MAX_QUEUE,
+                 lane_weights: Optional[Dict[str, float]] = None,
+                 max_tenants: int = DEFAULT_MAX_TENANTS):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.lane_weights = dict(lane_weights or DEFAULT_LANE_WEIGHTS)
+        self.max_tenants = max_tenants
+        self._lock = threading.Lock()
+        self._heap: List[_Waiter] = []
+        self._sequence = itertools.count()
+        self._virtual_time = 0.0
+        self._last_finish: Dict[str, float] = {}
+        self._tenant_queued: Dict[str, int] = {}       # kiracılı şerit anahtarı -> sıradaki istek
+        self._lanes: Dict[str, _LaneStats] = {}
+        self._queued = 0
+        self._active = 0
+        self._active_cost = 0
+        self._queued_cost = 0
+        self._items_per_second: Optional[float] = None  # çalışan istek başına EWMA
+
+    # ----- şeritler -----
+
+    @staticmethod
+    def lane_key(lane: str, tenant: Optional[str] = None) -> str:
+        return f"{lane}:{tenant}" if tenant else lane
+
+    @staticmethod
+    def _base_lane(lane_key: str) -> str:
+        return lane_key.split(":", 1)[0]
+
+    def _weight(self, lane_key: str) -> float:
+        return self.lane_weights.get(self._base_lane(lane_key), 1.0)
+
+    def _lane(self, lane_key: str) -> _LaneStats:
+        """Kiracısız şeridin sayaçları (kiracı başına sayaç tutulmaz)"""
+        lane = self._base_lane(lane_key)
+        stats = self._lanes.get(lane)
+        if stats is None:
+            stats = self._lanes[lane] = _LaneStats()
+        return stats
+
+    # ----- kuyruk -----
+
+    def drain_rate(self) -> Optional[float]:
+        """Tüm eşzamanlı yuvalar için yorum/saniye boşalma hızı"""
+        if self._items_per_second is None:
+            return None
+        return self._items_per_second * self.max_concurrency
+
+    def retry_after(self) -> int:
+        """Kuyruk boşalana kadar tahmini bekleme (saniye, en az 1)"""
+        rate = self.drain_rate()
+        if not rate:
+            return 1
+        return max(1, math.ceil((self._queued_cost + self._active_cost) / rate))
+
+    def check(self, lane: str = "interactive", tenant: Optional[str] = None) -> None:
+        """Kuyruk doluysa Overloaded fırlat"""
+        if self._queued >= self.max_queue:
+            with self._lock:
+                self._lane(self.lane_key(lane, tenant)).rejected += 1
+            raise Overloaded(self.retry_after())
+
+    def _enqueue(self, lane_key: str, cost: int, bounded: bool,
+                 wake: Callable[[], None]) -> Optional[_Waiter]:
+        """Yuva boşsa hemen al (None), değilse WFQ sırasına gir"""
+        with self._lock:
+            stats = self._lane(lane_key)
+            if self._active < self.max_concurrency and not self._queued:
+                self._active += 1
+                stats.active += 1
+                stats.observe("wait_ms", 0.0)
+                return None
+            if bounded and self._queued >= self.max_queue:
+                stats.rejected += 1
+                raise Overloaded(self.retry_after())
+            if lane_key != self._base_lane(lane_key):
+                if lane_key not in self._tenant_queued and len(self._tenant_queued) >= self.max_tenants:
+                    # İzlenen kiracı sınırı dolu: ortak alt şeride düş
+                    lane_key = self._base_lane(lane_key)
+                else:
+                    self._tenant_queued[lane_key] = self._tenant_queued.get(lane_key, 0) + 1
+            start = max(self._virtual_time, self._last_finish.get(lane_key, 0.0))
+            finish = start + max(cost, 1) / self._weight(lane_key)
+            self._last_finish[lane_key] = finish
+            waiter = _Waiter(lane_key, cost, start, finish, next(self._sequence), wake)
+            heapq.heappush(self._heap, waiter)
+            self._queued += 1
+            self._queued_cost += cost
+            stats.queued += 1
+            stats.queued_cost += cost
+            return waiter
+
+    def _dequeued(self, waiter: _Waiter) -> None:
+        self._queued -= 1
+        self._queued_cost -= waiter.cost
+        stats = self._lane(waiter.lane)
+        stats.queued -= 1
+        stats.queued_cost -= waiter.cost
+        remaining = self._tenant_queued.get(waiter.lane)
+        if remaining is not None:
+            if remaining > 1:
+                self._tenant_queued[waiter.lane] = remaining - 1
+            else:
+                # Boşta kalan kiracı unutulur; sonraki isteği güncel sanal zamandan başlar
+                del self._tenant_queued[waiter.lane]
+                self._last_finish.pop(waiter.lane, None)
+
+    def _cancel(self, waiter: _Waiter) -> bool:
+        """Bekleyeni iptal et; yuva zaten verilmişse True (serbest bırakılmalı)"""
+        with self._lock:
+            if waiter.granted:
+                return True
+            waiter.cancelled = True
+            self._dequeued(waiter)
+            return False
+
+    def _release(self, lane_key: str) -> None:
+        """Yuvayı bırak, en küçük sanal bitiş zamanlı bekleyene devret"""
+        with self._lock:
+            self._active -= 1
+            self._lane(lane_key).active -= 1
+            waiter = None
+            while self._heap:
+                candidate = heapq.heappop(self._heap)
+                if not candidate.cancelled:
+                    waiter = candidate
+                    break
+            if waiter is None:
+                return
+            self._dequeued(waiter)
+            waiter.granted = True
+            self._virtual_time = max(self._virtual_time, waiter.start)
+            self._active += 1
+            stats = self._lane(waiter.lane)
+            stats.active += 1
+            stats.observe("wait_ms", (time.perf_counter() - waiter.enqueued_at) * 1000)
+        waiter.wake()
+
+    async def _acquire(self, lane_key: str, cost: int, bounded: bool) -> None:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def grant():
+            if not future.done():
+                future.set_result(None)
+
+        waiter = self._enqueue(lane_key, cost, bounded, lambda: loop.call_soon_threadsafe(grant))
+        if waiter is None:
+            return
+        try:
+            await future
+        except asyncio.CancelledError:
+            if self._cancel(waiter):
+                # Yuva bize devredilmişti, sıradakine aktar
+                self._release(lane_key)
+            raise
+
+    def _acquire_sync(self, lane_key: str, cost: int) -> None:
+        event = threading.Event()
+        if self._enqueue(lane_key, cost, False, event.set) is not None:
+            event.wait()
+
+    def _observe(self, lane_key: str, seconds: float, cost: int) -> None:
+        rate = cost / max(seconds, 1e-6)
+        with self._lock:
+            if self._items_per_second is None:
+                self._items_per_second = rate
+            else:
+                self._items_per_second += EWMA_ALPHA * (rate - self._items_per_second)
+            stats = self._lane(lane_key)
+            stats.completed += 1
+            stats.observe("service_ms", seconds * 1000)
+
+    def _begin(self, lane_key: str, cost: int) -> float:
+        with self._lock:
+            self._lane(lane_key).admitted += 1
+            self._active_cost += cost
+        return time.perf_counter()
+
+    def _end(self, lane_key: str, cost: int, started: float, ok: bool) -> None:
+        with self._lock:
+            self._active_cost -= cost
+        if ok:
+            self._observe(lane_key, time.perf_counter() - started, cost)
+
+    # ----- çalıştırma -----
+
+    async def run(self, func: Callable[..., Any], *args, cost: int = 1,
+                  lane: str = "interactive", tenant: Optional[str] = None,
+                  is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None,
+                  bounded: bool = True) -> Any:
+        """func'u sıra geldiğinde iş parçacığı havuzunda çalıştır
+
+        bounded=False: kuyruk sınırı uygulanmaz (kabul edilmiş bir işin devam dilimleri için)
+        """
+        lane_key = self.lane_key(lane, tenant)
+        await self._acquire(lane_key, cost, bounded)
+        try:
+            if is_disconnected is not None and await is_disconnected():
+                with self._lock:
+                    self._lane(lane_key).dropped += 1
+                raise ClientDisconnected()
+            started = self._begin(lane_key, cost)
+            ok = False
+            try:
+                result = await run_in_threadpool(func, *args)
+                ok = True
+            finally:
+                self._end(lane_key, cost, started, ok)
+            return result
+        finally:
+            self._release(lane_key)
+
+    def run_sync(self, func: Callable[..., Any], *args, cost: int = 1,
+                 lane: str = "background", tenant: Optional[str] = None) -> Any:
+        """func'u sıra geldiğinde çağıran iş parçacığında çalıştır (kuyruk sınırı yok)"""
+        lane_key = self.lane_key(lane, tenant)
+        self._acquire_sync(lane_key, cost)
+        try:
+            started = self._begin(lane_key, cost)
+            ok = False
+            try:
+                result = func(*args)
+                ok = True
+            finally:
+                self._end(lane_key, cost, started, ok)
+            return result
+        finally:
+            self._release(lane_key)
+
+    def stats(self) -> Dict[str, Any]:
+        rate = self.drain_rate()
+        with self._lock:
+            lanes = {key: stats.as_dict() for key, stats in sorted(self._lanes.items())}
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "active": self._active,
+            "queued": self._queued,
+            "queued_comments": self._queued_cost,
+            "drain_rate_per_second": round(rate, 2) if rate else None,
+            "admitted": sum(lane["admitted"] for lane in lanes.values()),
+            "completed": sum(lane["completed"] for lane in lanes.values()),
+            "rejected": sum(lane["rejected"] for lane in lanes.values()),
+            "dropped_disconnected": sum(lane["dropped_disconnected"] for lane in lanes.values()),
+            "lane_weights": self.lane_weights,
+            "tracked_tenants": len(self._tenant_queued),
+            "lanes": lanes
+        }
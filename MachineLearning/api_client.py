@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Duygu Analizi API İstemcisi - istatistik analizörlerinin ortak istemcisi
+
+Tek bir httpx.Client bağlantı havuzu (keep-alive) tüm çağrılarda paylaşılır.
+Büyük dosyalar istemci tarafında /upload ile aynı kurallarla çözümlenir ve
+/analyze-batch'e parçalar halinde, sınırlı sayıda eşzamanlı istekle
+gönderilir. Geçici hatalar (bağlantı, zaman aşımı, 429/502/503/504) üstel
+geri çekilmeyle yeniden denenir; 429'da Retry-After başlığına uyulur.
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from upload_stream import CsvCommentParser, detect_format, iter_txt_comments
+
+DEFAULT_API_URL = "http://127.0.0.1:8000"
+DEFAULT_BATCH_SIZE = 64
+DEFAULT_CONCURRENCY = 4
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.5
+DEFAULT_TIMEOUT = 60.0
+RETRY_STATUSES = {429, 502, 503, 504}
+MAX_RETRY_AFTER = 30.0
+
+
+class APIError(Exception):
+    """API isteği yeniden denemelere rağmen başarısız oldu"""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def read_comments(file_path: str) -> List[str]:
+    """Dosyadaki yorumları /upload ile aynı kurallarla oku"""
+    fmt = detect_format(file_path)
+    if fmt is None:
+        raise ValueError("Sadece .csv ve .txt dosyaları desteklenir")
+    with open(file_path, "r", encoding="utf-8", newline="") as f:
+        if fmt == "txt":
+            return list(iter_txt_comments(f))
+        parser = CsvCommentParser()
+        return list(parser.feed(f)) + list(parser.close())
+
+
+class SentimentAPIClient:
+    """Bağlantı havuzlu, parçalayan ve yeniden deneyen istemci"""
+
+    def __init__(self, api_url: str = DEFAULT_API_URL, batch_size: int = DEFAULT_BATCH_SIZE,
+                 max_concurrency: int = DEFAULT_CONCURRENCY, retries: int = DEFAULT_RETRIES,
+                 backoff: float = DEFAULT_BACKOFF, timeout: float = DEFAULT_TIMEOUT):
+        self.api_url = api_url.rstrip("/")
+        self.batch_size = max(1, batch_size)
+        self.max_concurrency = max(1, max_concurrency)
+        self.retries = retries
+        self.backoff = backoff
+        self._client = httpx.Client(
+            base_url=self.api_url,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=self.max_concurrency,
+                                max_keepalive_connections=self.max_concurrency)
+        )
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    # ----- istek ve yeniden deneme -----
+
+    def _delay(self, attempt: int, response: Optional[httpx.Response]) -> float:
+        if response is not None and response.headers.get("Retry-After"):
+            try:
+                return min(float(response.headers["Retry-After"]), MAX_RETRY_AFTER)
+            except ValueError:
+                pass
+        # Tam titreşimli (full jitter) üstel geri çekilme
+        return random.uniform(0, self.backoff * (2 ** attempt))
+
+    def request(self, method: str, path: str, **kwargs) -> Any:
+        """İsteği gönder, JSON yanıtı döndür; geçici hatalarda yeniden dene"""
+        for attempt in range(self.retries + 1):
+            response = None
+            try:
+                response = self._client.request(method, path, **kwargs)
+            except httpx.TransportError as e:
+                if attempt == self.retries:
+                    raise APIError(f"Bağlantı hatası: {e}") from e
+            else:
+                if response.status_code == 200:
+                    return response.json()
+                if response.status_code not in RETRY_STATUSES or attempt == self.retries:
+                    raise APIError(f"HTTP {response.status_code}", response.status_code)
+            time.sleep(self._delay(attempt, response))
+        raise APIError("Yeniden deneme sınırı aşıldı")
+
+    # ----- endpoint'ler -----
+
+    def health(self) -> Dict[str, Any]:
+        return self.request("GET", "/health")
+
+    def statistics_summary(self) -> Dict[str, Any]:
+        """Sunucunun depo özetini al (/statistics/summary - yeniden analiz yok)"""
+        return self.request("GET", "/statistics/summary")["data"]
+
+    def analyze(self, text: str) -> Dict[str, Any]:
+        """Tek yorum analizi (/analyze - sonuç veritabanına kaydedilir)"""
+        return self.request("POST", "/analyze", json={"text": text})
+
+    def analyze_texts(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Yorumları batch_size'lık parçalarla /analyze-batch'e gönder, sırayı koru"""
+        chunks = [texts[start:start + self.batch_size] for start in range(0, len(texts), self.batch_size)]
+        if len(chunks) <= 1:
+            return self.request("POST", "/analyze-batch", json={"texts": texts}) if texts else []
+        results: List[Dict[str, Any]] = []
+        for chunk_results in self._pool().map(
+            lambda chunk: self.request("POST", "/analyze-batch", json={"texts": chunk}), chunks
+        ):
+            results.extend(chunk_results)
+        return results
+
+    def analyze_file(self, file_path: str) -> Dict[str, Any]:
+        """Dosyayı istemcide çözümle ve parçalar halinde analiz et (/upload yanıt biçiminde)"""
+        comments = read_comments(file_path)
+        if not comments:
+            raise APIError("Dosyada geçerli yorum bulunamadı")
+        return {
+            "dosya_adi": file_path,
+            "yorum_sayisi": len(comments),
+            "sonuclar": self.analyze_texts(comments)
+        }
+
+    # ----- yaşam döngüsü -----
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.max_concurrency, thread_name_prefix="api-client")
+            return self._executor
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
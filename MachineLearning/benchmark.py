@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sık Yol Mikro Benchmark'ları
+
+Kural kontrolü, metin temizleme, dosya çözümleme, tokenize, farklı batch
+boyutlarında forward, sonuç birleştirme ve depo ekleme/sorgu süreleri
+sentetik Türkçe yorumlar üzerinde ölçülür. startup.* benchmark'ları giriş
+noktalarını (--help, rapor üretimi, API açılışı) ayrı süreçte çalıştırıp
+içe aktarma dahil toplam açılış süresini ölçer. Sonuçlar JSON olarak saklanır;
+kayıtlı bir temel (baseline) ile karşılaştırıldığında eşiği aşan yavaşlama
+varsa süreç 1 ile çıkar.
+
+Kullanım:
+    python benchmark.py --save benchmarks/baseline.json       # temel oluştur
+    python benchmark.py --compare benchmarks/baseline.json    # karşılaştır
+    python benchmark.py --size 5000 --only forward --batch-sizes 1,16,64
+    python benchmark.py --only startup --repeat 3              # yalnızca açılış süreleri
+
+Varsayılan olarak stub modeller kullanılır (bkz. stub_backend.py); gerçek
+modeller için --backend hub.
+"""
+
+import argparse
+import atexit
+import csv
+import fnmatch
+import gc
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SIZE = 1000
+DEFAULT_REPEAT = 7
+DEFAULT_THRESHOLD = 0.20
+DEFAULT_BATCH_SIZES = (1, 8, 32)
+FIRST_TIMESTAMP = datetime(2024, 1, 1)
+
+# ----- sentetik yorumlar -----
+
+SUBJECTS = ["Yemekhane", "Lojman", "Oda", "Personel", "Kargo", "Ürün", "Otel", "Servis",
+            "İnternet", "Otopark", "Spor salonu", "Kahve makinesi", "Resepsiyon", "Havuz"]
+POSITIVE_PHRASES = ["çok iyi", "harika", "mükemmel", "temiz ve düzenli", "kaliteli", "sorunsuz"]
+NEGATIVE_PHRASES = ["berbat", "çok kötü", "kirli", "yetersiz", "gürültülü", "bozuk", "çok geç geldi"]
+REQUEST_PHRASES = ["eklenmesini talep ediyoruz", "yapılmasını rica ediyoruz",
+                   "düzeltilmesini istiyoruz", "için öneri olarak bir çözüm bekliyoruz"]
+FILLERS = ["Genel olarak deneyimimizi paylaşmak istedik.", "Geçen hafta ailemle birlikte kaldık.",
+           "Fiyat performans açısından değerlendirdiğimizde", "Çalışanlar ilgiliydi fakat yoğunluk vardı."]
+TEMPLATES = [
+    "{s} {p}, teşekkür ederiz.",
+    "{s} {n}, hiç memnun kalmadık.",
+    "{s} {p} ama {s2} {n}.",
+    "{s} için {r}.",
+    "{s} {p} fakat {s2} {r}.",
+    "{s} {n}!!! Bir daha asla gelmeyiz.",
+]
+
+
+def synthetic_corpus(size: int, seed: int = 42) -> List[str]:
+    """Kural, şikayet, talep ve karışık yorumlardan oluşan tekrarlanabilir derlem"""
+    rng = random.Random(seed)
+    comments = []
+    for _ in range(size):
+        comment = rng.choice(TEMPLATES).format(
+            s=rng.choice(SUBJECTS), s2=rng.choice(SUBJECTS).lower(), p=rng.choice(POSITIVE_PHRASES),
+            n=rng.choice(NEGATIVE_PHRASES), r=rng.choice(REQUEST_PHRASES)
+        )
+        # Uzunluk dağılımı: çoğu kısa, bir kısmı birkaç cümlelik
+        extra = rng.choice((0, 0, 0, 1, 2, 4))
+        if extra:
+            comment = " ".join(rng.choice(FILLERS) for _ in range(extra)) + " " + comment
+        comments.append(comment)
+    return comments
+
+
+def corpus_bytes(comments: List[str]) -> Dict[str, bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for comment in comments:
+        writer.writerow([comment])
+    return {"csv": buffer.getvalue().encode("utf-8"), "txt": "\n".join(comments).encode("utf-8")}
+
+
+# ----- ölçüm -----
+
+def measure(func: Callable[[], Any], repeat: int, setup: Optional[Callable[[], Any]] = None) -> List[float]:
+    """func'u repeat kez çalıştırıp süreleri döndür (setup ve GC ölçüme girmez)"""
+    timings = []
+    func() if setup is None else func(setup())  # ısınma
+    for _ in range(repeat):
+        argument = setup() if setup is not None else None
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            func() if setup is None else func(argument)
+            timings.append(time.perf_counter() - start)
+        finally:
+            if gc_enabled:
+                gc.enable()
+    return timings
+
+
+def summarize(timings: List[float], items: int) -> Dict[str, Any]:
+    median = statistics.median(timings)
+    return {
+        "median_s": median,
+        "min_s": min(timings),
+        "max_s": max(timings),
+        "items": items,
+        "per_item_us": median / items * 1e6 if items else None
+    }
+
+
+# ----- benchmark'lar -----
+
+def load_engine(backend: str):
+    """sentiment_api'yi geçici bir çalışma dizininde içe aktar ve modelleri yükle
+
+    Modül açılışta depo, iş ve static dizinlerine dokunur; gerçek veritabanı
+    etkilenmesin diye benchmark boş bir dizinde çalışır.
+    """
+    os.environ["SENTIMENT_BACKEND"] = backend
+    os.environ.setdefault("SENTIMENT_STUB_DIR", os.path.join(BASE_DIR, "stub_models"))
+    workdir = tempfile.mkdtemp(prefix="sentiment-bench-")
+    atexit.register(shutil.rmtree, workdir, ignore_errors=True)
+    os.makedirs(os.path.join(workdir, "static"))
+    os.chdir(workdir)
+    sys.path.insert(0, BASE_DIR)
+    import sentiment_api
+    sentiment_api.load_models()
+    return sentiment_api, workdir
+
+
+def build_benchmarks(api, comments: List[str], batch_sizes: List[int], workdir: str) -> Dict[str, Dict[str, Any]]:
+    """ad -> {"func", "items", "setup"} sözlüğü"""
+    from comment_store import CommentStore
+    import torch
+
+    raw = corpus_bytes(comments)
+    benchmarks: Dict[str, Dict[str, Any]] = {
+        "rules.is_neutral_comment": {
+            "func": lambda: [api.is_neutral_comment(comment) for comment in comments], "items": len(comments)},
+        "rules.clean_text": {
+            "func": lambda: [api.clean_text(comment) for comment in comments], "items": len(comments)},
+        "parse.csv": {"func": lambda: api.parse_csv_file(raw["csv"]), "items": len(comments)},
+        "parse.txt": {"func": lambda: api.parse_txt_file(raw["txt"]), "items": len(comments)},
+    }
+
+    cleaned = [api.clean_text(comment) for comment in comments]
+    for model_id, model_pipeline in api.pipelines.items():
+        tokenizer, model = model_pipeline.tokenizer, model_pipeline.model
+        benchmarks[f"tokenize.{model_id}"] = {
+            "func": lambda tokenizer=tokenizer: [
+                tokenizer(cleaned[start:start + api.INFERENCE_BATCH_SIZE], padding=True,
+                          truncation=True, return_tensors="pt")
+                for start in range(0, len(cleaned), api.INFERENCE_BATCH_SIZE)
+            ],
+            "items": len(cleaned)
+        }
+        for batch_size in batch_sizes:
+            encoded = tokenizer(cleaned[:batch_size], padding=True, truncation=True, return_tensors="pt")
+
+            def forward(model=model, encoded=encoded):
+                with torch.inference_mode():
+                    model(**encoded)
+
+            benchmarks[f"forward.{model_id}.b{batch_size}"] = {"func": forward, "items": len(cleaned[:batch_size])}
+
+    model_ids = list(api.pipelines)
+    sample = cleaned[:max(batch_sizes)]
+    per_model = [api.analyze_with_model_batch(sample, model_id) for model_id in model_ids]
+    rows = [[outputs[position] for outputs in per_model] for position in range(len(sample))]
+    benchmarks["combine_model_results"] = {
+        "func": lambda: [api.combine_model_results(row) for row in rows], "items": len(rows)}
+
+    sentiments = ["Olumlu", "Olumsuz", "Nötr"]
+    entries = [{
+        "text": comment,
+        "sentiment": sentiments[index % 3],
+        "confidence": 0.9,
+        "method": "multi_model",
+        "timestamp": (FIRST_TIMESTAMP + timedelta(minutes=index)).isoformat()
+    } for index, comment in enumerate(comments)]
+    counter = iter(range(sys.maxsize))
+
+    def fresh_store():
+        return CommentStore(os.path.join(workdir, f"store-{next(counter)}.jsonl"))
+
+    def insert(store):
+        for entry in entries:
+            store.add(entry)
+        store.close()
+
+    query_store = fresh_store()
+    for entry in entries:
+        query_store.add(entry)
+    benchmarks["store.insert"] = {"func": insert, "setup": fresh_store, "items": len(entries)}
+    benchmarks["store.query"] = {
+        "func": lambda: [query_store.query(limit=50, offset=offset, sentiment="Olumsuz")
+                         for offset in range(0, len(entries) // 3, 50)],
+        "items": max(1, len(range(0, len(entries) // 3, 50)))
+    }
+    # Zaman aralığı sayımı: derlemin ortadaki yarısı
+    since = (FIRST_TIMESTAMP + timedelta(minutes=len(entries) // 4)).isoformat()
+    until = (FIRST_TIMESTAMP + timedelta(minutes=len(entries) * 3 // 4)).isoformat()
+    benchmarks["store.count"] = {
+        "func": lambda: [query_store.count(since=since, until=until) for _ in range(100)],
+        "items": 100
+    }
+    return benchmarks
+
+
+def startup_benchmarks(comments: List[str], workdir: str) -> Dict[str, Dict[str, Any]]:
+    """Giriş noktalarının yeni bir Python sürecinde açılış süreleri
+
+    API komutları geçici dizinde çalışır (depo dosyaları orada oluşur);
+    ortam load_engine'in ayarladığı arka ucu devralır.
+    """
+    results_path = os.path.join(workdir, "startup_results.ndjson")
+    with open(results_path, "w", encoding="utf-8") as f:
+        for index, comment in enumerate(comments):
+            f.write(json.dumps({"yorum": comment, "analiz": ["Olumlu", "Olumsuz", "Nötr"][index % 3],
+                                "güven": 0.9, "yöntem": "multi_model"}, ensure_ascii=False) + "\n")
+
+    def script(name: str, *args: str) -> List[str]:
+        return [sys.executable, os.path.join(BASE_DIR, name), *args]
+
+    env = dict(os.environ, PYTHONPATH=BASE_DIR)
+    commands = {
+        "startup.sentiment_tr.help": script("sentiment_tr.py", "--help"),
+        "startup.statistics_analyzer.help": script("statistics_analyzer.py", "--help"),
+        "startup.visual_statistics.help": script("visual_statistics.py", "--help"),
+        "startup.statistics_stream.report": script("statistics_stream.py", results_path),
+        # Sunucuyu başlatan içe aktarma ve ilk istekten önceki model yüklemesi ayrı ölçülür
+        "startup.sentiment_api.import": [sys.executable, "-c", "import sentiment_api"],
+        "startup.sentiment_api.boot": [sys.executable, "-c", "import sentiment_api; sentiment_api.load_models()"],
+    }
+
+    def run(command: List[str]) -> None:
+        subprocess.run(command, cwd=workdir, env=env, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    return {name: {"func": lambda command=command: run(command), "items": 1} for name, command in commands.items()}
+
+
+def run_benchmarks(benchmarks: Dict[str, Dict[str, Any]], repeat: int,
+                   patterns: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+    results = {}
+    for name, spec in benchmarks.items():
+        if patterns and not any(fnmatch.fnmatch(name, f"*{pattern}*") for pattern in patterns):
+            continue
+        timings = measure(spec["func"], repeat, spec.get("setup"))
+        results[name] = summarize(timings, spec["items"])
+        print(f"⏱️  {name:<32} {results[name]['median_s'] * 1000:10.3f} ms  "
+              f"({results[name]['per_item_us']:.2f} µs/öğe)")
+    return results
+
+
+def environment_info(backend: str) -> Dict[str, Any]:
+    import torch
+    import transformers
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "torch": torch.__version__,
+        "transformers": transformers.__version__,
+        "torch_threads": torch.get_num_threads(),
+        "backend": backend
+    }
+
+
+# ----- temel karşılaştırma -----
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Eşiği aşan yavaşlamaların adlarını döndür"""
+    regressions = []
+    baseline_results = baseline.get("results", {})
+    print(f"\n📊 Temel ile karşılaştırma (eşik: %{threshold * 100:.0f})")
+    for name, current in results.items():
+        previous = baseline_results.get(name)
+        if previous is None:
+            print(f"🆕 {name:<32} temelde yok")
+            continue
+        ratio = current["median_s"] / previous["median_s"] if previous["median_s"] else 1.0
+        change = (ratio - 1) * 100
+        if ratio > 1 + threshold:
+            regressions.append(name)
+            marker = "❌"
+        else:
+            marker = "✅"
+        print(f"{marker} {name:<32} {previous['median_s'] * 1000:10.3f} ms → "
+              f"{current['median_s'] * 1000:10.3f} ms  ({change:+.1f}%)")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Sık yol mikro benchmark'ları")
+    parser.add_argument("--size", type=int, default=DEFAULT_SIZE, help="Sentetik yorum sayısı")
+    parser.add_argument("--seed", type=int, default=42, help="Derlem tohumu")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Her benchmark için tekrar")
+    parser.add_argument("--batch-sizes", type=str, default=",".join(map(str, DEFAULT_BATCH_SIZES)),
+                        help="Forward batch boyutları (virgülle)")
+    parser.add_argument("--backend", choices=["stub", "hub"], default="stub", help="Model arka ucu")
+    parser.add_argument("--only", action="append", help="Yalnızca adı bu deseni içeren benchmark'lar")
+    parser.add_argument("--save", type=str, help="Sonuçları bu JSON dosyasına yaz")
+    parser.add_argument("--compare", type=str, help="Bu temel dosyasıyla karşılaştır")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="İzin verilen yavaşlama oranı (0.2 = %%20)")
+    args = parser.parse_args()
+
+    save_path = os.path.abspath(args.save) if args.save else None
+    compare_path = os.path.abspath(args.compare) if args.compare else None
+    baseline = None
+    if compare_path:
+        with open(compare_path, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    batch_sizes = sorted({int(value) for value in args.batch_sizes.split(",") if value.strip()})
+    comments = synthetic_corpus(args.size, args.seed)
+    print(f"🔧 {len(comments)} sentetik yorum, {args.backend} arka ucu, {args.repeat} tekrar")
+    api, workdir = load_engine(args.backend)
+    benchmarks = build_benchmarks(api, comments, batch_sizes, workdir)
+    benchmarks.update(startup_benchmarks(comments, workdir))
+    results = run_benchmarks(benchmarks, args.repeat, args.only)
+
+    report = {
+        "created_at": datetime.now().isoformat(),
+        "config": {"size": args.size, "seed": args.seed, "repeat": args.repeat, "batch_sizes": batch_sizes},
+        "environment": environment_info(args.backend),
+        "results": results
+    }
+    if save_path:
+        os.makedirs(os.path.dirname(save_path) or ".", exist_ok=True)
+        with open(save_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"💾 Sonuçlar kaydedildi: {save_path}")
+
+    if baseline is not None:
+        if baseline.get("config", {}).get("size") != args.size:
+            print("⚠️  Temel farklı derlem boyutuyla alınmış; µs/öğe değerlerine bakın")
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} benchmark yavaşladı: {', '.join(regressions)}")
+            sys.exit(1)
+        print("\n✅ Yavaşlama yok")
+
+
+if __name__ == "__main__":
+    main()
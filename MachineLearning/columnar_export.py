@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sütunlu (Arrow/Parquet) Dışa Aktarma ve Anlık Görüntü Aracı
+
+Yorum deposunu tipli sütunlar halinde yazar: id, text, sentiment, confidence,
+method, timestamp ve her model için <model>_sentiment / <model>_confidence.
+Satırlar row-group'lar halinde işlenir, bellek kullanımı tek bir row-group
+ile sınırlıdır.
+
+Kullanım:
+    python columnar_export.py snapshot --out snapshots/                 # tek seferlik
+    python columnar_export.py snapshot --out snapshots/ --interval 3600 # saatlik
+"""
+
+import argparse
+import os
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+DEFAULT_MODEL_IDS = ("savasy", "dbmdz")
+DEFAULT_ROW_GROUP_SIZE = 65536
+DEFAULT_COMPRESSION = "zstd"
+SNAPSHOT_PREFIX = "sentiment_snapshot_"
+
+
+def require_pyarrow():
+    """pyarrow'u ilk gerçek kullanımda yükle"""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise RuntimeError("Parquet/Arrow dışa aktarma için pyarrow gerekli: pip install pyarrow")
+    return pyarrow
+
+
+def build_schema(model_ids: Sequence[str] = DEFAULT_MODEL_IDS):
+    """Dışa aktarma şemasını oluştur"""
+    pa = require_pyarrow()
+    category = pa.dictionary(pa.int32(), pa.string())
+    fields = [
+        pa.field("id", pa.int64(), nullable=False),
+        pa.field("text", pa.string()),
+        pa.field("sentiment", category),
+        pa.field("confidence", pa.float64()),
+        pa.field("method", category),
+        pa.field("timestamp", pa.timestamp("us")),
+        pa.field("model_used", category),
+        pa.field("consistency", pa.bool_()),
+    ]
+    for model_id in model_ids:
+        fields.append(pa.field(f"{model_id}_sentiment", category))
+        fields.append(pa.field(f"{model_id}_confidence", pa.float64()))
+    return pa.schema(fields)
+
+
+def model_scores(model_results: Optional[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Saklanan model sonuçlarını model_id -> sonuç sözlüğüne çevir"""
+    if not model_results:
+        return {}
+    if "all_results" in model_results:
+        results = model_results["all_results"]
+    elif "model_id" in model_results:
+        results = [model_results]
+    else:
+        results = []
+    return {r["model_id"]: r for r in results if "model_id" in r}
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(value) if value else None
+    except ValueError:
+        return None
+
+
+def record_batches(comments: Iterable[Dict[str, Any]], model_ids: Sequence[str] = DEFAULT_MODEL_IDS,
+                   batch_rows: int = DEFAULT_ROW_GROUP_SIZE) -> Iterator[Any]:
+    """Yorumları batch_rows büyüklüğünde Arrow RecordBatch'lere dönüştür"""
+    pa = require_pyarrow()
+    schema = build_schema(model_ids)
+    columns: Dict[str, List[Any]] = {name: [] for name in schema.names}
+
+    def flush():
+        batch = pa.RecordBatch.from_arrays(
+            [pa.array(columns[field.name], type=field.type) for field in schema],
+            schema=schema
+        )
+        for values in columns.values():
+            values.clear()
+        return batch
+
+    for comment in comments:
+        model_results = comment.get("model_results") or {}
+        scores = model_scores(model_results)
+        columns["id"].append(comment["id"])
+        columns["text"].append(comment.get("text"))
+        columns["sentiment"].append(comment.get("sentiment"))
+        columns["confidence"].append(comment.get("confidence"))
+        columns["method"].append(comment.get("method"))
+        columns["timestamp"].append(_parse_timestamp(comment.get("timestamp")))
+        columns["model_used"].append(model_results.get("model_used"))
+        columns["consistency"].append(model_results.get("consistency"))
+        for model_id in model_ids:
+            score = scores.get(model_id, {})
+            columns[f"{model_id}_sentiment"].append(score.get("sentiment"))
+            columns[f"{model_id}_confidence"].append(score.get("confidence"))
+        if len(columns["id"]) >= batch_rows:
+            yield flush()
+
+    if columns["id"]:
+        yield flush()
+
+
+class _ChunkSink:
+    """Yazılan baytları biriktiren, akış yanıtı için boşaltılabilen dosya nesnesi"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def write_parquet(comments: Iterable[Dict[str, Any]], where: Any,
+                  model_ids: Sequence[str] = DEFAULT_MODEL_IDS,
+                  row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+                  compression: str = DEFAULT_COMPRESSION) -> int:
+    """Yorumları Parquet dosyasına yaz, yazılan satır sayısını döndür"""
+    pa = require_pyarrow()
+    rows = 0
+    with pa.parquet.ParquetWriter(where, build_schema(model_ids), compression=compression) as writer:
+        for batch in record_batches(comments, model_ids, row_group_size):
+            writer.write_batch(batch, row_group_size=row_group_size)
+            rows += batch.num_rows
+    return rows
+
+
+def parquet_stream(comments: Iterable[Dict[str, Any]], model_ids: Sequence[str] = DEFAULT_MODEL_IDS,
+                   row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+                   compression: str = DEFAULT_COMPRESSION) -> Iterator[bytes]:
+    """Parquet dosyasını row-group row-group bayt parçaları olarak üret"""
+    pa = require_pyarrow()
+    sink = _ChunkSink()
+    writer = pa.parquet.ParquetWriter(sink, build_schema(model_ids), compression=compression)
+    try:
+        for batch in record_batches(comments, model_ids, row_group_size):
+            writer.write_batch(batch, row_group_size=row_group_size)
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def arrow_stream(comments: Iterable[Dict[str, Any]], model_ids: Sequence[str] = DEFAULT_MODEL_IDS,
+                 batch_rows: int = DEFAULT_ROW_GROUP_SIZE,
+                 compression: Optional[str] = DEFAULT_COMPRESSION) -> Iterator[bytes]:
+    """Arrow IPC akış formatında bayt parçaları üret (pyarrow.ipc.open_stream ile okunur)"""
+    pa = require_pyarrow()
+    import pyarrow.ipc
+    sink = _ChunkSink()
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    writer = pa.ipc.new_stream(sink, build_schema(model_ids), options=options)
+    try:
+        yield sink.drain()
+        for batch in record_batches(comments, model_ids, batch_rows):
+            writer.write_batch(batch)
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def read_snapshot(path: str, columns: Optional[List[str]] = None):
+    """Parquet anlık görüntüsünü (dosya veya dizin) Arrow tablosu olarak oku"""
+    pa = require_pyarrow()
+    return pa.parquet.read_table(path, columns=columns)
+
+
+def iter_snapshot_results(path: str) -> Iterator[Dict[str, Any]]:
+    """Anlık görüntü satırlarını API sonuç biçiminde (yorum/analiz/güven/...) üret"""
+    table = read_snapshot(path)
+    model_ids = [name[:-len("_confidence")] for name in table.column_names if name.endswith("_confidence")]
+    for batch in table.to_batches():
+        for row in batch.to_pylist():
+            all_results = [
+                {"model_id": m, "sentiment": row[f"{m}_sentiment"], "confidence": row[f"{m}_confidence"]}
+                for m in model_ids if row.get(f"{m}_sentiment") is not None
+            ]
+            model_results = None
+            if all_results:
+                model_results = {
+                    "final_sentiment": row["sentiment"],
+                    "final_confidence": row["confidence"],
+                    "model_used": row.get("model_used"),
+                    "consistency": row.get("consistency"),
+                    "all_results": all_results
+                }
+            yield {
+                "yorum": row["text"],
+                "analiz": row["sentiment"],
+                "güven": row["confidence"],
+                "yöntem": row["method"],
+                "model_sonuçları": model_results,
+                "comment_id": row["id"]
+            }
+
+
+def latest_snapshot(directory: str) -> Optional[str]:
+    """Dizindeki en yeni anlık görüntü dosyasını bul"""
+    if not os.path.isdir(directory):
+        return None
+    names = sorted(n for n in os.listdir(directory)
+                   if n.startswith(SNAPSHOT_PREFIX) and n.endswith(".parquet"))
+    return os.path.join(directory, names[-1]) if names else None
+
+
+def take_snapshot(db_path: str, out_dir: str, model_ids: Sequence[str] = DEFAULT_MODEL_IDS,
+                  row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+                  compression: str = DEFAULT_COMPRESSION, keep: int = 0) -> str:
+    """Yorum deposunun anlık görüntüsünü Parquet olarak al"""
+    from comment_store import CommentStore
+
+    # CommentStore olmayan dosyayı boş depo olarak açar; yanlış yol sessizce boş anlık görüntü üretmesin
+    if not os.path.exists(db_path):
+        raise FileNotFoundError(f"Yorum deposu bulunamadı: {db_path}")
+    os.makedirs(out_dir, exist_ok=True)
+    store = CommentStore(db_path)
+    try:
+        filename = f"{SNAPSHOT_PREFIX}{datetime.now().strftime('%Y%m%d_%H%M%S')}.parquet"
+        path = os.path.join(out_dir, filename)
+        tmp_path = path + ".tmp"
+        rows = write_parquet(store.iter_comments(), tmp_path, model_ids, row_group_size, compression)
+        # Okuyucular yarım dosya görmesin
+        os.replace(tmp_path, path)
+    finally:
+        store.close()
+
+    if keep > 0:
+        names = sorted(n for n in os.listdir(out_dir)
+                       if n.startswith(SNAPSHOT_PREFIX) and n.endswith(".parquet"))
+        for old in names[:-keep]:
+            os.remove(os.path.join(out_dir, old))
+
+    print(f"✅ Anlık görüntü: {path} ({rows} yorum)")
+    return path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Yorum deposunu Parquet anlık görüntüsü olarak kaydet")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    snapshot = subparsers.add_parser("snapshot", help="Depoyu Parquet dosyasına yaz")
+    snapshot.add_argument("--db", type=str, default="sentiment_database.jsonl", help="Yorum deposu günlük dosyası")
+    snapshot.add_argument("--out", type=str, default="snapshots", help="Anlık görüntü dizini")
+    snapshot.add_argument("--models", type=str, default=",".join(DEFAULT_MODEL_IDS), help="Virgülle ayrılmış model ID'leri")
+    snapshot.add_argument("--row-group-size", type=int, default=DEFAULT_ROW_GROUP_SIZE, help="Row-group başına satır")
+    snapshot.add_argument("--compression", type=str, default=DEFAULT_COMPRESSION, help="zstd, snappy, gzip veya none")
+    snapshot.add_argument("--interval", type=float, default=0, help="Saniye cinsinden tekrar aralığı (0 = tek seferlik)")
+    snapshot.add_argument("--keep", type=int, default=0, help="Saklanacak en yeni anlık görüntü sayısı (0 = hepsi)")
+    args = parser.parse_args()
+
+    model_ids = [m.strip() for m in args.models.split(",") if m.strip()]
+    while True:
+        try:
+            take_snapshot(args.db, args.out, model_ids, args.row_group_size, args.compression, args.keep)
+        except FileNotFoundError as e:
+            # Zamanlanmış çalışmada da tekrar denemek anlamsız
+            print(f"❌ {e}")
+            raise SystemExit(1)
+        except Exception as e:
+            print(f"❌ Anlık görüntü alınamadı: {e}")
+            if args.interval <= 0:
+                raise SystemExit(1)
+        if args.interval <= 0:
+            return
+        time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    main()
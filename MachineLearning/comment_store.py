@@ -0,0 +1,478 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Yorum Deposu - değişmez ID'ler, tombstone silme ve arka plan sıkıştırma
+
+Yorumlar eklenmeye açık (append-only) bir JSONL günlüğünde tutulur:
+    {"op": "meta", "next_id": 42}
+    {"op": "add", "comment": {...}}
+    {"op": "delete", "ids": [3, 7], "deleted_at": "..."}
+
+Silme işlemi satırı yerinde işaretler (tombstone) ve günlüğe tek bir kayıt
+ekler; diğer yorumların ID'leri asla değişmez. Arka plan sıkıştırma günlüğü
+yalnızca canlı satırlarla yeniden yazarak silinen satırları fiziksel olarak
+geri kazanır.
+"""
+
+import json
+import os
+import threading
+from bisect import bisect_left
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Sıkıştırma eşikleri
+COMPACT_MIN_TOMBSTONES = 1000
+COMPACT_TOMBSTONE_RATIO = 0.25
+COMPACT_INTERVAL_SECONDS = 60.0
+
+# İndekslenen eşitlik filtreleri (filtre adı -> yorum alanı)
+INDEXED_FIELDS = {"sentiment": "sentiment", "method": "method"}
+
+SENTIMENT_STAT_KEYS = {"Olumlu": "positive", "Olumsuz": "negative", "Nötr": "neutral"}
+
+
+class _FenwickTree:
+    """Canlı satır sayıları için büyüyebilen Fenwick ağacı (1 tabanlı)"""
+
+    def __init__(self):
+        self._tree = [0]
+
+    def __len__(self) -> int:
+        return len(self._tree) - 1
+
+    def append(self, value: int) -> None:
+        """Sona yeni bir pozisyon ekle - O(log n)"""
+        i = len(self._tree)
+        low = i - (i & -i)
+        self._tree.append(value + self.prefix(i - 1) - self.prefix(low))
+
+    def add(self, i: int, delta: int) -> None:
+        """i pozisyonuna delta ekle"""
+        n = len(self._tree)
+        while i < n:
+            self._tree[i] += delta
+            i += i & -i
+
+    def prefix(self, i: int) -> int:
+        """1..i pozisyonlarının toplamı"""
+        total = 0
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def select(self, k: int) -> int:
+        """Toplamı k'ya ulaşan en küçük pozisyon (yoksa len + 1)"""
+        pos = 0
+        step = 1 << len(self).bit_length()
+        while step:
+            nxt = pos + step
+            if nxt <= len(self) and self._tree[nxt] < k:
+                pos = nxt
+                k -= self._tree[nxt]
+            step >>= 1
+        return pos + 1
+
+
+def _empty_statistics() -> Dict[str, int]:
+    return {"total": 0, "positive": 0, "negative": 0, "neutral": 0, "invalid": 0}
+
+
+def normalize_timestamp(value: Optional[str]) -> Optional[str]:
+    """Tarih filtresini ISO biçimine çevir (geçersizse ValueError)"""
+    if value is None or value == "":
+        return None
+    return datetime.fromisoformat(value).isoformat()
+
+
+class CommentStore:
+    """Kalıcı, değişmez ID'li yorum deposu"""
+
+    def __init__(self, path: str, legacy_path: Optional[str] = None, fsync: bool = False):
+        self.path = path
+        self.fsync = fsync
+        self._lock = threading.RLock()
+        self._rows: Dict[int, Dict[str, Any]] = {}
+        self._ids: List[int] = []          # pozisyon -> id (artan)
+        self._timestamps: List[str] = []   # pozisyon -> zaman damgası
+        self._live = _FenwickTree()
+        self._indexes: Dict[str, Dict[Any, List[int]]] = {name: {} for name in INDEXED_FIELDS}
+        self._listeners: List[Tuple[Callable, Callable]] = []
+        self._statistics = _empty_statistics()
+        self._tombstones = 0
+        self._next_id = 1
+        self._pending: Optional[List[str]] = None
+        self._compactor: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.last_updated = datetime.now().isoformat()
+
+        if os.path.exists(path):
+            self._replay(path)
+        elif legacy_path and os.path.exists(legacy_path):
+            self._import_legacy(legacy_path)
+            live = [c for c in self._rows.values() if not c.get("deleted")]
+            os.replace(self._write_snapshot(live, self._next_id), path)
+        self._file = open(path, "a", encoding="utf-8")
+
+    # ----- yükleme -----
+
+    def _replay(self, path: str) -> None:
+        """Günlüğü baştan oynatarak bellekteki durumu kur"""
+        torn = False
+        unterminated = False
+        with open(path, "r", encoding="utf-8") as f:
+            for raw in f:
+                unterminated = not raw.endswith("\n")
+                line = raw.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                    torn = False
+                except ValueError:
+                    # Yarım yazılmış son satır (çökme) - atla
+                    torn = True
+                    continue
+                op = record.get("op")
+                if op == "add":
+                    self._apply_add(record["comment"])
+                elif op == "delete":
+                    self._apply_delete(record["ids"], record.get("deleted_at"))
+                elif op == "meta":
+                    self._next_id = max(self._next_id, int(record.get("next_id", 1)))
+        if unterminated:
+            self._repair_tail(path, torn)
+        self.last_updated = datetime.fromtimestamp(os.path.getmtime(path)).isoformat()
+
+    @staticmethod
+    def _repair_tail(path: str, torn: bool) -> None:
+        """Satır sonu olmadan biten günlüğü düzelt; sonraki kayıt son satıra yapışmasın
+
+        Yarım kayıt son satır sonuna kadar kesilir, tam (okunabilen) kayıt
+        satır sonuyla kapatılır.
+        """
+        with open(path, "rb+") as f:
+            if not torn:
+                f.seek(0, os.SEEK_END)
+                f.write(b"\n")
+                return
+            end = f.seek(0, os.SEEK_END)
+            position = end
+            while position > 0:
+                step = min(65536, position)
+                position -= step
+                f.seek(position)
+                newline = f.read(step).rfind(b"\n")
+                if newline != -1:
+                    f.truncate(position + newline + 1)
+                    return
+            f.truncate(0)
+
+    def _import_legacy(self, legacy_path: str) -> None:
+        """Eski tek-parça JSON veritabanını içe aktar (ID'ler korunur)"""
+        try:
+            with open(legacy_path, "r", encoding="utf-8") as f:
+                legacy = json.load(f)
+        except Exception:
+            return
+        for comment in sorted(legacy.get("comments", []), key=lambda c: c["id"]):
+            self._apply_add(comment)
+
+    # ----- bellek içi işlemler (kilit altında çağrılır) -----
+
+    def _apply_add(self, comment: Dict[str, Any]) -> None:
+        comment_id = comment["id"]
+        self._rows[comment_id] = comment
+        self._ids.append(comment_id)
+        # Aralık filtreleri zaman damgalarını ID sırasıyla azalmayan varsayar;
+        # eski günlüklerdeki geriye giden damgalar öncekine çekilir
+        timestamp = comment.get("timestamp") or ""
+        if self._timestamps and timestamp < self._timestamps[-1]:
+            timestamp = comment["timestamp"] = self._timestamps[-1]
+        self._timestamps.append(timestamp)
+        self._next_id = max(self._next_id, comment_id + 1)
+        if comment.get("deleted"):
+            self._live.append(0)
+            self._tombstones += 1
+            return
+        self._live.append(1)
+        for name, field in INDEXED_FIELDS.items():
+            self._indexes[name].setdefault(comment.get(field), []).append(comment_id)
+        self._count(comment, +1)
+
+    def _apply_delete(self, ids: List[int], deleted_at: Optional[str]) -> List[Dict[str, Any]]:
+        deleted = []
+        for comment_id in ids:
+            comment = self._rows.get(comment_id)
+            if comment is None or comment.get("deleted"):
+                continue
+            comment["deleted"] = True
+            comment["deleted_at"] = deleted_at
+            self._live.add(self._position(comment_id) + 1, -1)
+            self._tombstones += 1
+            self._count(comment, -1)
+            deleted.append(comment)
+        return deleted
+
+    def _count(self, comment: Dict[str, Any], delta: int) -> None:
+        self._statistics["total"] += delta
+        key = SENTIMENT_STAT_KEYS.get(comment.get("sentiment"), "invalid")
+        self._statistics[key] += delta
+
+    def _position(self, comment_id: int) -> int:
+        return bisect_left(self._ids, comment_id)
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, ensure_ascii=False)
+        if self._pending is not None:
+            self._pending.append(line)
+        self._file.write(line + "\n")
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self.last_updated = datetime.now().isoformat()
+
+    # ----- genel API -----
+
+    def add_listener(self, on_add: Callable[[Dict[str, Any]], None],
+                     on_delete: Callable[[Dict[str, Any]], None], replay: bool = False) -> None:
+        """Ekleme/silme olaylarını dinleyecek fonksiyonları kaydet
+
+        replay=True ise mevcut canlı yorumlar önce on_add'e verilir; kayıt aynı
+        kilit altında yapıldığından arada gelen hiçbir olay kaçmaz veya tekrarlanmaz.
+        """
+        with self._lock:
+            if replay:
+                for comment_id in self._ids:
+                    comment = self._rows[comment_id]
+                    if not comment.get("deleted"):
+                        on_add(comment)
+            self._listeners.append((on_add, on_delete))
+
+    def add(self, comment: Dict[str, Any]) -> int:
+        """Yorumu ekle ve yeni, değişmez ID'sini döndür"""
+        with self._lock:
+            # Zaman damgası normalize edilir ve son damganın gerisine düşmez (saat geri alınsa da)
+            timestamp = normalize_timestamp(comment.get("timestamp")) or datetime.now().isoformat()
+            if self._timestamps and timestamp < self._timestamps[-1]:
+                timestamp = self._timestamps[-1]
+            comment = dict(comment, id=self._next_id, timestamp=timestamp)
+            self._write({"op": "add", "comment": comment})
+            self._apply_add(comment)
+            for on_add, _ in self._listeners:
+                on_add(comment)
+            return comment["id"]
+
+    def get(self, comment_id: int) -> Optional[Dict[str, Any]]:
+        """ID ile canlı yorumu getir (silinmişse None)"""
+        comment = self._rows.get(comment_id)
+        if comment is None or comment.get("deleted"):
+            return None
+        return comment
+
+    def indexed_ids(self, name: str, value: Any) -> Sequence[int]:
+        """İndekslenmiş alanda değere sahip yorum ID'leri (artan, silinmişler dahil)
+
+        Liste yalnızca sona eklenerek büyür; sıkıştırmada yenisiyle değiştirilir.
+        """
+        return self._indexes[name].get(value, ())
+
+    def delete(self, comment_id: int) -> Optional[Dict[str, Any]]:
+        """Tek yorumu tombstone ile sil - O(log n)"""
+        deleted = self._delete_ids([comment_id])
+        return deleted[0] if deleted else None
+
+    def delete_where(self, sentiment: Optional[str] = None, method: Optional[str] = None,
+                     since: Optional[str] = None, until: Optional[str] = None) -> List[int]:
+        """Filtreye uyan tüm yorumları sil - eşleşen satır başına O(log n)"""
+        with self._lock:
+            ids = [c["id"] for c in self.iter_comments(sentiment, method, since, until)]
+            return [c["id"] for c in self._delete_ids(ids)]
+
+    def _delete_ids(self, ids: List[int]) -> List[Dict[str, Any]]:
+        with self._lock:
+            live_ids = [i for i in ids if self.get(i) is not None]
+            if not live_ids:
+                return []
+            deleted_at = datetime.now().isoformat()
+            self._write({"op": "delete", "ids": live_ids, "deleted_at": deleted_at})
+            deleted = self._apply_delete(live_ids, deleted_at)
+            for comment in deleted:
+                for _, on_delete in self._listeners:
+                    on_delete(comment)
+            return deleted
+
+    def _position_range(self, since: Optional[str], until: Optional[str]) -> Tuple[int, int]:
+        """Zaman aralığını pozisyon aralığına çevir (since dahil, until hariç)"""
+        lo = bisect_left(self._timestamps, since) if since else 0
+        hi = bisect_left(self._timestamps, until) if until else len(self._ids)
+        return lo, max(lo, hi)
+
+    def id_range(self, since: Optional[str] = None, until: Optional[str] = None) -> Tuple[int, int]:
+        """Zaman aralığına düşen ID aralığı [min, max)"""
+        with self._lock:
+            lo, hi = self._position_range(normalize_timestamp(since), normalize_timestamp(until))
+            start = self._ids[lo] if lo < len(self._ids) else self._next_id
+            end = self._ids[hi] if hi < len(self._ids) else self._next_id
+            return start, end
+
+    def iter_comments(self, sentiment: Optional[str] = None, method: Optional[str] = None,
+                      since: Optional[str] = None, until: Optional[str] = None,
+                      offset: int = 0) -> Iterator[Dict[str, Any]]:
+        """Filtreye uyan canlı yorumları ID sırasıyla üret"""
+        since, until = normalize_timestamp(since), normalize_timestamp(until)
+        # Sıkıştırma listeleri yerinde değiştirmez, yenisiyle değiştirir;
+        # yerel referanslar uzun süren dışa aktarımları tutarlı tutar
+        rows, ids, live = self._rows, self._ids, self._live
+        lo, hi = self._position_range(since, until)
+        equality = {name: value for name, value in (("sentiment", sentiment), ("method", method))
+                    if value is not None}
+
+        if not equality:
+            # Fenwick ile offset'e O(log n) atla
+            position = live.select(live.prefix(lo) + offset + 1) - 1
+            while position < hi:
+                comment = rows.get(ids[position])
+                if comment is None:
+                    break
+                if not comment.get("deleted"):
+                    yield comment
+                position += 1
+            return
+
+        # En seçici indeksi kullan, kalan filtreleri satırda kontrol et
+        candidates = min((self._indexes[name].get(value, []) for name, value in equality.items()), key=len)
+        start = bisect_left(candidates, ids[lo]) if lo < len(ids) else len(candidates)
+        end_id = ids[hi - 1] if hi > 0 else -1
+        skipped = 0
+        for index in range(start, len(candidates)):
+            comment_id = candidates[index]
+            if comment_id > end_id:
+                break
+            comment = rows.get(comment_id)
+            if comment is None or comment.get("deleted"):
+                continue
+            if any(comment.get(INDEXED_FIELDS[name]) != value for name, value in equality.items()):
+                continue
+            if skipped < offset:
+                skipped += 1
+                continue
+            yield comment
+
+    def query(self, limit: int = 50, offset: int = 0, sentiment: Optional[str] = None,
+              method: Optional[str] = None, since: Optional[str] = None,
+              until: Optional[str] = None) -> Tuple[List[Dict[str, Any]], int]:
+        """Sayfalı sorgu - (yorumlar, filtreye uyan toplam)"""
+        with self._lock:
+            page = []
+            for comment in self.iter_comments(sentiment, method, since, until, offset):
+                if len(page) >= limit:
+                    break
+                page.append(comment)
+            total = self.count(sentiment, method, since, until)
+            return page, total
+
+    def count(self, sentiment: Optional[str] = None, method: Optional[str] = None,
+              since: Optional[str] = None, until: Optional[str] = None) -> int:
+        """Filtreye uyan canlı yorum sayısı"""
+        with self._lock:
+            if sentiment is None and method is None:
+                lo, hi = self._position_range(normalize_timestamp(since), normalize_timestamp(until))
+                return self._live.prefix(hi) - self._live.prefix(lo)
+            return sum(1 for _ in self.iter_comments(sentiment, method, since, until))
+
+    @property
+    def statistics(self) -> Dict[str, int]:
+        return dict(self._statistics)
+
+    def __len__(self) -> int:
+        return self._statistics["total"]
+
+    def memory_containers(self) -> Dict[str, Any]:
+        """Bellek raporu için bellek içi yapılar"""
+        return {
+            "rows": self._rows,
+            "ids": self._ids,
+            "timestamps": self._timestamps,
+            "live_tree": self._live._tree,
+            "indexes": self._indexes
+        }
+
+    # ----- sıkıştırma -----
+
+    def _write_snapshot(self, rows: List[Dict[str, Any]], next_id: int) -> str:
+        """Canlı satırlarla geçici günlük dosyası yaz ve yolunu döndür"""
+        tmp_path = self.path + ".compact"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"op": "meta", "next_id": next_id}) + "\n")
+            for comment in rows:
+                f.write(json.dumps({"op": "add", "comment": comment}, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        return tmp_path
+
+    def compact(self) -> int:
+        """Silinen satırları diskten ve bellekten fiziksel olarak temizle"""
+        with self._lock:
+            if self._tombstones == 0:
+                return 0
+            rows = [dict(c) for c in self._rows.values() if not c.get("deleted")]
+            next_id = self._next_id
+            self._pending = []
+
+        # Büyük yazma işlemi kilit dışında; bu arada gelen kayıtlar _pending'e de yazılır
+        try:
+            tmp_path = self._write_snapshot(rows, next_id)
+        except Exception:
+            with self._lock:
+                self._pending = None
+            raise
+
+        with self._lock:
+            with open(tmp_path, "a", encoding="utf-8") as f:
+                for line in self._pending:
+                    f.write(line + "\n")
+            self._pending = None
+            self._file.close()
+            os.replace(tmp_path, self.path)
+            self._file = open(self.path, "a", encoding="utf-8")
+
+            reclaimed = self._tombstones
+            survivors = [c for c in self._rows.values() if not c.get("deleted")]
+            self._rows = {}
+            self._ids = []
+            self._timestamps = []
+            self._live = _FenwickTree()
+            self._indexes = {name: {} for name in INDEXED_FIELDS}
+            self._statistics = _empty_statistics()
+            self._tombstones = 0
+            for comment in survivors:
+                self._apply_add(comment)
+            return reclaimed
+
+    def needs_compaction(self) -> bool:
+        return self._tombstones >= max(COMPACT_MIN_TOMBSTONES,
+                                       COMPACT_TOMBSTONE_RATIO * len(self._ids))
+
+    def start_compaction(self, interval: float = COMPACT_INTERVAL_SECONDS) -> None:
+        """Eşik aşıldığında sıkıştıran arka plan iş parçacığını başlat"""
+        if self._compactor is not None:
+            return
+
+        def loop():
+            while not self._stop.wait(interval):
+                if self.needs_compaction():
+                    try:
+                        reclaimed = self.compact()
+                        print(f"🧹 Sıkıştırma: {reclaimed} silinmiş yorum temizlendi")
+                    except Exception as e:
+                        print(f"❌ Sıkıştırma hatası: {e}")
+
+        self._compactor = threading.Thread(target=loop, name="comment-store-compactor", daemon=True)
+        self._compactor.start()
+
+    def close(self) -> None:
+        self._stop.set()
+        with self._lock:
+            self._file.close()
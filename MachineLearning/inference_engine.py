@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ortak Çıkarım Motoru - sentiment_api ve sentiment_tr'nin model katmanı
+
+Metin grupları girer, tipli sonuçlar (Prediction) çıkar. Model yükleme
+arka uçlara, etiket eşleme map_label_to_tr'ye, tekrar eden metinler isteğe
+bağlı önbelleğe devredilir; batch, önbellek veya model değişiklikleri API ve
+komut satırı aracına aynı anda yansır.
+
+Arka uç, model_id (ve isteğe bağlı kaynak) alıp (tokenizer, model) döndüren
+bir fonksiyondur; register_backend ile yenisi eklenir. Modelden beklenen
+arayüz transformers sınıflandırıcılarınınkidir: tokenizer(metinler,
+padding=True, truncation=True, return_tensors="pt"), model(**girdi).logits
+ve model.config.id2label.
+
+torch/transformers yalnızca model yüklenirken ve çalıştırılırken içe
+aktarılır.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from stub_backend import ensure_stub_model
+
+# Bilinen modeller (sentiment_api bu iki modelin birleşimini kullanır)
+MODELS = {
+    "savasy": {
+        "name": "savasy/bert-base-turkish-sentiment-cased",
+        "description": "Türkçe için özel eğitilmiş sentiment modeli"
+    },
+    "dbmdz": {
+        "name": "dbmdz/bert-base-turkish-cased",
+        "description": "Genel Türkçe BERT modeli"
+    }
+}
+
+# Etiket eşleme - farklı modeller için
+MAPPINGS = {
+    "savasy": {"positive": "Olumlu", "negative": "Olumsuz", "neutral": "Nötr"},
+    "dbmdz": {"LABEL_0": "Olumsuz", "LABEL_1": "Olumlu", "LABEL_2": "Nötr"}  # Genel BERT için
+}
+
+# Eşlemesi olmayan modellerde LABEL_<n> etiketleri için varsayılan sıra
+LABEL_ID_TO_NAME = {0: "Olumsuz", 1: "Nötr", 2: "Olumlu"}
+
+DEFAULT_BATCH_SIZE = 32
+
+
+def map_label_to_tr(label: str, mapping: Optional[Dict[str, str]] = None) -> str:
+    """Model etiketini Türkçe 3 sınıfa çevir (önce modele özel eşleme, sonra genel kurallar)"""
+    if mapping and label in mapping:
+        return mapping[label]
+    ls = label.strip().lower()
+    if ls.startswith("label_"):
+        try:
+            return LABEL_ID_TO_NAME.get(int(ls.split("_")[-1]), "Nötr")
+        except ValueError:
+            return "Nötr"
+    # Bazı modeller 'negative/neutral/positive' döndürebilir
+    if "neg" in ls:
+        return "Olumsuz"
+    if "neu" in ls:
+        return "Nötr"
+    if "pos" in ls:
+        return "Olumlu"
+    # Yıldız temelli olursa
+    if "1" in ls or "2" in ls:
+        return "Olumsuz"
+    if "3" in ls:
+        return "Nötr"
+    if "4" in ls or "5" in ls:
+        return "Olumlu"
+    return "Nötr"
+
+
+@dataclass(frozen=True)
+class Prediction:
+    """Tek metin için tek modelin sonucu"""
+    model_id: str
+    sentiment: str
+    confidence: float
+    raw_label: str
+    # Türkçe etiket -> olasılık (aynı sınıfa düşen ham etiketler toplanır)
+    scores: Dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """API'nin model sonucu biçimi"""
+        return {
+            "model_id": self.model_id,
+            "sentiment": self.sentiment,
+            "confidence": self.confidence,
+            "raw_label": self.raw_label
+        }
+
+
+@dataclass
+class LoadedModel:
+    """Yüklenmiş model, tokenizer'ı ve etiket eşlemesi"""
+    tokenizer: Any
+    model: Any
+    mapping: Optional[Dict[str, str]] = None
+
+
+# ----- arka uçlar -----
+
+def load_transformers(source: str) -> Tuple[Any, Any]:
+    """Ad veya dizinden tokenizer ve sınıflandırıcıyı yükle"""
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
+    tokenizer = AutoTokenizer.from_pretrained(source)
+    model = AutoModelForSequenceClassification.from_pretrained(source)
+    return tokenizer, model
+
+
+def hub_backend(model_id: str, source: Optional[str] = None) -> Tuple[Any, Any]:
+    """Hugging Face Hub adı veya yerel dizin (kaynak verilmezse MODELS'teki ad)"""
+    return load_transformers(source or MODELS[model_id]["name"])
+
+
+def stub_backend(model_id: str, source: Optional[str] = None) -> Tuple[Any, Any]:
+    """Çevrimdışı küçük model (bkz. stub_backend.py); etiketler MAPPINGS'ten gelir"""
+    return load_transformers(ensure_stub_model(model_id, list(MAPPINGS[model_id])))
+
+
+BACKENDS: Dict[str, Callable[[str, Optional[str]], Tuple[Any, Any]]] = {
+    "hub": hub_backend,
+    "stub": stub_backend
+}
+
+
+def register_backend(name: str, loader: Callable[[str, Optional[str]], Tuple[Any, Any]]) -> None:
+    """Yeni bir arka uç ekle (ör. ONNX veya nicemlenmiş modeller)"""
+    BACKENDS[name] = loader
+
+
+# ----- motor -----
+
+# Her forward çağrısından sonra: (model_id, tokenize saniye, forward saniye, metin sayısı)
+BatchObserver = Callable[[str, float, float, int], None]
+
+
+class InferenceEngine:
+    """Batch öncelikli çıkarım: metin listesi girer, Prediction listesi çıkar
+
+    cache get/put arayüzlü herhangi bir nesne olabilir (ör. result_cache.LRUCache);
+    anahtar (model_id, metin) çiftidir. Aynı gruptaki tekrar eden metinler
+    modele bir kez verilir.
+    """
+
+    def __init__(self, backend: str = "hub", batch_size: int = DEFAULT_BATCH_SIZE,
+                 cache: Optional[Any] = None, on_batch: Optional[BatchObserver] = None):
+        if backend not in BACKENDS:
+            raise ValueError(f"Bilinmeyen model arka ucu: {backend} (seçenekler: {', '.join(BACKENDS)})")
+        self.backend = backend
+        self.batch_size = batch_size
+        self.cache = cache
+        self.on_batch = on_batch
+        self.models: Dict[str, LoadedModel] = {}
+        # predict'e model_id verilmezse kullanılan model (ilk yüklenen)
+        self.default_model: Optional[str] = None
+
+    def load(self, model_id: str, source: Optional[str] = None,
+             mapping: Optional[Dict[str, str]] = None) -> LoadedModel:
+        """Modeli arka uçtan yükle (eşleme verilmezse MAPPINGS'teki kullanılır)"""
+        tokenizer, model = BACKENDS[self.backend](model_id, source)
+        loaded = LoadedModel(tokenizer, model, mapping if mapping is not None else MAPPINGS.get(model_id))
+        self.models[model_id] = loaded
+        if self.default_model is None:
+            self.default_model = model_id
+        return loaded
+
+    def predict(self, texts: Sequence[str], model_id: Optional[str] = None,
+                batch_size: Optional[int] = None) -> List[Prediction]:
+        """Metinleri batch_size'lık forward çağrılarıyla analiz et (girdi sırasıyla)"""
+        model_id = model_id or self.default_model
+        loaded = self.models.get(model_id)
+        if loaded is None:
+            raise KeyError(f"Model {model_id} bulunamadı")
+        size = batch_size or self.batch_size
+
+        results: List[Optional[Prediction]] = [None] * len(texts)
+        # metin -> girdideki konumları (önbellekte olmayanlar)
+        pending: Dict[str, List[int]] = {}
+        for position, text in enumerate(texts):
+            cached = self.cache.get((model_id, text)) if self.cache is not None else None
+            if cached is not None:
+                results[position] = cached
+            else:
+                pending.setdefault(text, []).append(position)
+
+        unique = list(pending)
+        for start in range(0, len(unique), size):
+            chunk = unique[start:start + size]
+            for text, prediction in zip(chunk, self._forward(model_id, loaded, chunk)):
+                for position in pending[text]:
+                    results[position] = prediction
+                if self.cache is not None:
+                    self.cache.put((model_id, text), prediction)
+        return results
+
+    def _forward(self, model_id: str, loaded: LoadedModel, texts: List[str]) -> List[Prediction]:
+        import torch
+
+        tokenize_start = time.perf_counter()
+        encoded = loaded.tokenizer(texts, padding=True, truncation=True, return_tensors="pt")
+        forward_start = time.perf_counter()
+        with torch.inference_mode():
+            probabilities = loaded.model(**encoded).logits.softmax(dim=-1).tolist()
+        if self.on_batch is not None:
+            self.on_batch(model_id, forward_start - tokenize_start, time.perf_counter() - forward_start, len(texts))
+
+        id2label = loaded.model.config.id2label
+        raw_labels = [str(id2label[index]) for index in range(len(id2label))]
+        labels = [map_label_to_tr(raw, loaded.mapping) for raw in raw_labels]
+        predictions = []
+        for row in probabilities:
+            best = max(range(len(row)), key=row.__getitem__)
+            scores: Dict[str, float] = {}
+            for label, probability in zip(labels, row):
+                scores[label] = scores.get(label, 0.0) + probability
+            predictions.append(Prediction(model_id, labels[best], row[best], raw_labels[best], scores))
+        return predictions
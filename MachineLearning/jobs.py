@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Asenkron Analiz İşleri - ilerleme, kontrol noktası ve kaldığı yerden devam
+
+Her iş kendi dizininde tutulur:
+    jobs/<id>/input.jsonl    # satır başına bir yorum (JSON string)
+    jobs/<id>/results.jsonl  # satır başına bir analiz sonucu
+    jobs/<id>/meta.json      # durum, ilerleme ve kontrol noktası
+
+Çalışan iş parçacıkları girdiyi grup grup işler. Her grubun sonuçları diske
+yazılıp fsync edildikten sonra kontrol noktası (girdi bayt konumu, sonuç
+dosyası boyutu) atomik olarak güncellenir. Süreç çökerse ya da yeniden
+başlatılırsa iş son kontrol noktasından devam eder; yarım kalan grup atılıp
+yeniden işlenir.
+"""
+
+import json
+import os
+import queue
+import shutil
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+JOB_BATCH_SIZE = 64
+RESULT_INDEX_STRIDE = 256
+ACTIVE_STATUSES = ("queued", "running")
+FINAL_STATUSES = ("completed", "failed", "cancelled")
+
+
+class JobNotFound(KeyError):
+    """İş bulunamadı"""
+
+
+class _Job:
+    """Bir işin bellek içi durumu"""
+
+    def __init__(self, directory: str, meta: Dict[str, Any]):
+        self.directory = directory
+        self.meta = meta
+        self.cancel_requested = False
+        self.lock = threading.Lock()
+        # Sonuç dosyasında her RESULT_INDEX_STRIDE satırın bayt konumu (sayfalama için)
+        self.line_index: Optional[List[int]] = None
+
+    @property
+    def input_path(self) -> str:
+        return os.path.join(self.directory, "input.jsonl")
+
+    @property
+    def results_path(self) -> str:
+        return os.path.join(self.directory, "results.jsonl")
+
+    @property
+    def meta_path(self) -> str:
+        return os.path.join(self.directory, "meta.json")
+
+    def save(self) -> None:
+        """meta.json'u atomik olarak yaz"""
+        tmp_path = self.meta_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.meta, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.meta_path)
+
+
+class JobManager:
+    """Dosya tabanlı, kaldığı yerden devam edebilen analiz iş kuyruğu"""
+
+    def __init__(self, directory: str, analyze_batch: Callable[[List[str]], List[Dict[str, Any]]],
+                 persist: Optional[Callable[[Dict[str, Any]], Any]] = None,
+                 workers: int = 1, batch_size: int = JOB_BATCH_SIZE):
+        self.directory = directory
+        self.analyze_batch = analyze_batch
+        self.persist = persist
+        self.batch_size = batch_size
+        self._jobs: Dict[str, _Job] = {}
+        self._queue: "queue.Queue[str]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._workers = [
+            threading.Thread(target=self._worker_loop, name=f"job-worker-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        os.makedirs(directory, exist_ok=True)
+        self._load_existing()
+
+    # ----- başlatma ve kurtarma -----
+
+    def _load_existing(self) -> None:
+        """Diskteki işleri yükle, yarım kalanları kuyruğa geri koy"""
+        for job_id in sorted(os.listdir(self.directory)):
+            meta_path = os.path.join(self.directory, job_id, "meta.json")
+            try:
+                with open(meta_path, "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+            except (OSError, ValueError):
+                continue
+            job = _Job(os.path.join(self.directory, job_id), meta)
+            self._jobs[job_id] = job
+            if meta["status"] == "receiving":
+                # Yükleme tamamlanmadan süreç durdu - girdi eksik
+                meta["status"] = "failed"
+                meta["error"] = "Dosya yüklemesi tamamlanmadan sunucu durdu"
+                job.save()
+            elif meta["status"] in ACTIVE_STATUSES:
+                meta["status"] = "queued"
+                meta["resumed"] = meta.get("resumed", 0) + 1
+                job.save()
+                self._queue.put(job_id)
+
+    def start(self) -> None:
+        """Çalışan iş parçacıklarını başlat"""
+        for worker in self._workers:
+            if not worker.is_alive():
+                worker.start()
+
+    # ----- iş oluşturma -----
+
+    def create_job(self, filename: Optional[str] = None, persist: bool = False) -> str:
+        """Girdisi henüz yazılmamış yeni iş oluştur ("receiving" durumunda)"""
+        job_id = uuid.uuid4().hex[:12]
+        directory = os.path.join(self.directory, job_id)
+        os.makedirs(directory)
+        meta = {
+            "id": job_id,
+            "status": "receiving",
+            "filename": filename,
+            "persist": persist,
+            "created_at": datetime.now().isoformat(),
+            "started_at": None,
+            "finished_at": None,
+            "total": 0,
+            "processed": 0,
+            "checkpoint": {"input_offset": 0, "results_size": 0},
+            "active_seconds": 0.0,
+            "error": None,
+        }
+        job = _Job(directory, meta)
+        open(job.input_path, "w").close()
+        open(job.results_path, "w").close()
+        job.save()
+        with self._lock:
+            self._jobs[job_id] = job
+        return job_id
+
+    def open_input(self, job_id: str):
+        """İş girdisine yorum eklemek için dosya aç (satır başına bir JSON string)"""
+        return open(self._get(job_id).input_path, "a", encoding="utf-8")
+
+    def submit(self, job_id: str, total: int) -> None:
+        """Girdisi tamamlanan işi kuyruğa koy"""
+        job = self._get(job_id)
+        with job.lock:
+            job.meta["total"] = total
+            job.meta["status"] = "queued"
+            job.save()
+        self._queue.put(job_id)
+
+    def fail(self, job_id: str, error: str) -> None:
+        job = self._get(job_id)
+        with job.lock:
+            job.meta["status"] = "failed"
+            job.meta["error"] = error
+            job.meta["finished_at"] = datetime.now().isoformat()
+            job.save()
+
+    def create_from_texts(self, texts: List[str], persist: bool = False) -> str:
+        """Yorum listesinden iş oluştur ve kuyruğa koy"""
+        job_id = self.create_job(persist=persist)
+        total = 0
+        with self.open_input(job_id) as f:
+            for text in texts:
+                if text and text.strip():
+                    f.write(json.dumps(text.strip(), ensure_ascii=False) + "\n")
+                    total += 1
+        self.submit(job_id, total)
+        return job_id
+
+    # ----- sorgulama -----
+
+    def _get(self, job_id: str) -> _Job:
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise JobNotFound(job_id)
+        return job
+
+    def status(self, job_id: str) -> Dict[str, Any]:
+        """İş durumu, ilerleme ve işlem hızı"""
+        job = self._get(job_id)
+        with job.lock:
+            meta = dict(job.meta)
+        meta.pop("checkpoint", None)
+        total, processed = meta["total"], meta["processed"]
+        active = meta.pop("active_seconds")
+        if meta["status"] == "running" and meta.get("_run_started"):
+            active += time.time() - meta["_run_started"]
+        meta.pop("_run_started", None)
+        throughput = processed / active if active > 0 else 0.0
+        remaining = max(total - processed, 0)
+        meta["progress"] = round(processed / total * 100, 1) if total else 0.0
+        meta["throughput_per_second"] = round(throughput, 2)
+        meta["eta_seconds"] = round(remaining / throughput, 1) if throughput > 0 and meta["status"] == "running" else None
+        return meta
+
+    def status_counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for job in list(self._jobs.values()):
+            counts[job.meta["status"]] = counts.get(job.meta["status"], 0) + 1
+        return counts
+
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        return [self.status(job_id) for job_id in list(self._jobs)]
+
+    def cancel(self, job_id: str) -> None:
+        job = self._get(job_id)
+        job.cancel_requested = True
+        with job.lock:
+            if job.meta["status"] in ("queued", "receiving"):
+                job.meta["status"] = "cancelled"
+                job.meta["finished_at"] = datetime.now().isoformat()
+                job.save()
+
+    def delete(self, job_id: str) -> None:
+        """İşi iptal et ve dosyalarını sil"""
+        self.cancel(job_id)
+        job = self._get(job_id)
+        with job.lock:
+            if job.meta["status"] == "running":
+                raise RuntimeError("Çalışan iş silinemez, önce iptalin tamamlanmasını bekleyin")
+            with self._lock:
+                self._jobs.pop(job_id, None)
+            shutil.rmtree(job.directory, ignore_errors=True)
+
+    def _build_line_index(self, job: _Job) -> List[int]:
+        """Sonuç dosyasını bir kez tarayıp seyrek satır indeksini kur"""
+        offsets = []
+        limit = job.meta["checkpoint"]["results_size"]
+        with open(job.results_path, "rb") as f:
+            position, line_no = 0, 0
+            for line in f:
+                if position >= limit:
+                    break
+                if line_no % RESULT_INDEX_STRIDE == 0:
+                    offsets.append(position)
+                position += len(line)
+                line_no += 1
+        return offsets
+
+    def _index_results(self, job: _Job, start_line: int, start_position: int, lines: List[bytes]) -> None:
+        """Yeni yazılan sonuç satırlarını seyrek indekse ekle"""
+        if job.line_index is None:
+            return
+        position = start_position
+        for offset, line in enumerate(lines):
+            if (start_line + offset) % RESULT_INDEX_STRIDE == 0:
+                job.line_index.append(position)
+            position += len(line)
+
+    def results(self, job_id: str, offset: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """Kontrol noktasına kadar yazılmış sonuçlardan bir sayfa getir"""
+        job = self._get(job_id)
+        with job.lock:
+            if job.line_index is None:
+                job.line_index = self._build_line_index(job)
+            limit_size = job.meta["checkpoint"]["results_size"]
+            anchor = min(offset // RESULT_INDEX_STRIDE, len(job.line_index) - 1) if job.line_index else -1
+        if anchor < 0:
+            return []
+
+        page = []
+        line_no = anchor * RESULT_INDEX_STRIDE
+        with open(job.results_path, "rb") as f:
+            f.seek(job.line_index[anchor])
+            while len(page) < limit and f.tell() < limit_size:
+                line = f.readline()
+                if not line:
+                    break
+                if line_no >= offset:
+                    page.append(json.loads(line))
+                line_no += 1
+        return page
+
+    def iter_results(self, job_id: str, poll_interval: float = 0.5) -> Iterator[Optional[bytes]]:
+        """Sonuç satırlarını üret; iş sürüyorsa yeni satırları bekle (beklerken None)"""
+        job = self._get(job_id)
+        position = 0
+        f = open(job.results_path, "rb")
+        # Tüketici yarıda bırakıp close() çağırdığında dosya hemen bırakılır
+        try:
+            while True:
+                with job.lock:
+                    limit_size = job.meta["checkpoint"]["results_size"]
+                    finished = job.meta["status"] in FINAL_STATUSES
+                if position < limit_size:
+                    f.seek(position)
+                    data = f.read(limit_size - position)
+                    position = limit_size
+                    yield data
+                    continue
+                if finished:
+                    return
+                yield None
+                time.sleep(poll_interval)
+        finally:
+            f.close()
+
+    # ----- çalıştırma -----
+
+    def _worker_loop(self) -> None:
+        while True:
+            job_id = self._queue.get()
+            job = self._jobs.get(job_id)
+            if job is None or job.meta["status"] != "queued" or job.cancel_requested:
+                continue
+            try:
+                self._run(job)
+            except Exception as e:
+                with job.lock:
+                    job.meta["status"] = "failed"
+                    job.meta["error"] = str(e)
+                    job.meta["finished_at"] = datetime.now().isoformat()
+                    job.meta.pop("_run_started", None)
+                    job.save()
+                print(f"❌ İş {job_id} başarısız: {e}")
+
+    def _run(self, job: _Job) -> None:
+        """İşi son kontrol noktasından itibaren grup grup işle"""
+        with job.lock:
+            checkpoint = job.meta["checkpoint"]
+            job.meta["status"] = "running"
+            job.meta["started_at"] = job.meta["started_at"] or datetime.now().isoformat()
+            job.meta["_run_started"] = time.time()
+            job.save()
+
+        with open(job.results_path, "r+b") as results_file:
+            # Son kontrol noktasından sonra yazılmış yarım grubu at
+            results_file.truncate(checkpoint["results_size"])
+            results_file.seek(checkpoint["results_size"])
+            with open(job.input_path, "rb") as input_file:
+                input_file.seek(checkpoint["input_offset"])
+                while True:
+                    if job.cancel_requested:
+                        self._finish(job, "cancelled")
+                        return
+
+                    texts = []
+                    for _ in range(self.batch_size):
+                        line = input_file.readline()
+                        if not line:
+                            break
+                        texts.append(json.loads(line))
+                    if not texts:
+                        break
+
+                    outputs = self.analyze_batch(texts)
+                    if job.meta.get("persist") and self.persist:
+                        # Kontrol noktasından önce çökülürse bu grup yeniden kaydedilebilir
+                        for output in outputs:
+                            output["comment_id"] = self.persist(output)
+
+                    lines = [(json.dumps(o, ensure_ascii=False) + "\n").encode("utf-8") for o in outputs]
+                    start_position = results_file.tell()
+                    results_file.write(b"".join(lines))
+                    results_file.flush()
+                    os.fsync(results_file.fileno())
+
+                    with job.lock:
+                        self._index_results(job, job.meta["processed"], start_position, lines)
+                        job.meta["processed"] += len(outputs)
+                        job.meta["checkpoint"] = {
+                            "input_offset": input_file.tell(),
+                            "results_size": results_file.tell(),
+                        }
+                        now = time.time()
+                        job.meta["active_seconds"] += now - job.meta["_run_started"]
+                        job.meta["_run_started"] = now
+                        job.save()
+
+        self._finish(job, "completed")
+
+    def _finish(self, job: _Job, status: str) -> None:
+        with job.lock:
+            if job.meta.get("_run_started"):
+                job.meta["active_seconds"] += time.time() - job.meta.pop("_run_started")
+            job.meta["status"] = status
+            job.meta["finished_at"] = datetime.now().isoformat()
+            job.save()
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Eşzamanlı Yük Testi
+
+test_system.py istekleri tek tek gönderir; bu araç ise asenkron bir HTTP
+istemcisiyle /analyze, /analyze-batch ve /upload endpoint'lerine aynı anda
+yük bindirir. İki mod vardır:
+
+- Eşzamanlılık taraması (kapalı döngü): N işçi, her biri yanıtı alınca
+  yeni istek gönderir. Örn. --concurrency 1,2,4,8,16,32
+- Sabit RPS (açık döngü): istekler yanıt beklenmeden sabit aralıkla
+  başlatılır; sunucu yetişemezse gecikme büyür. Örn. --rps 5,10,20
+
+Her seviye için verim, p50/p95/p99 gecikme ve hata oranları raporlanır;
+"diz" noktası verim/ortalama gecikme oranının (Kleinrock'un güç ölçütü)
+en yüksek olduğu seviyedir.
+
+Kullanım:
+    python load_test.py --url http://127.0.0.1:8000 --concurrency 1,4,16
+    python load_test.py --corpus test_yorumlar_detayli.csv --workload mix --rps 5,10,20
+    python load_test.py --inprocess --concurrency 1,2,4,8     # sunucusuz, stub modellerle
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import os
+import random
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+DEFAULT_URL = "http://127.0.0.1:8000"
+DEFAULT_DURATION = 10.0
+DEFAULT_BATCH_SIZE = 16
+DEFAULT_UPLOAD_SIZE = 50
+DEFAULT_TIMEOUT = 60.0
+# mix iş yükünde endpoint ağırlıkları
+MIX_WEIGHTS = {"analyze": 0.7, "batch": 0.25, "upload": 0.05}
+
+
+# ----- derlem -----
+
+def load_corpus(paths: List[str]) -> List[str]:
+    """TXT (satır başına yorum) veya CSV ("yorum" sütunu, yoksa ilk sütun) dosyalarını oku"""
+    comments: List[str] = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            if path.lower().endswith(".csv"):
+                rows = list(csv.reader(f))
+                if not rows:
+                    continue
+                column = rows[0].index("yorum") if "yorum" in rows[0] else 0
+                body = rows[1:] if "yorum" in rows[0] else rows
+                comments.extend(row[column].strip() for row in body if len(row) > column and row[column].strip())
+            else:
+                comments.extend(line.strip() for line in f if line.strip())
+    return comments
+
+
+# ----- istekler -----
+
+class RequestFactory:
+    """İş yüküne göre (endpoint, istek parametreleri) üretir"""
+
+    def __init__(self, comments: List[str], workload: str, batch_size: int, upload_size: int, seed: int = 42):
+        self.comments = comments
+        self.workload = workload
+        self.batch_size = batch_size
+        self.upload_size = upload_size
+        self.rng = random.Random(seed)
+
+    def _sample(self, count: int) -> List[str]:
+        return [self.rng.choice(self.comments) for _ in range(count)]
+
+    def next(self) -> Dict[str, Any]:
+        kind = self.workload
+        if kind == "mix":
+            kind = self.rng.choices(list(MIX_WEIGHTS), weights=list(MIX_WEIGHTS.values()))[0]
+        if kind == "analyze":
+            return {"kind": kind, "comments": 1, "method": "POST", "url": "/analyze",
+                    "json": {"text": self._sample(1)[0]}}
+        if kind == "batch":
+            return {"kind": kind, "comments": self.batch_size, "method": "POST", "url": "/analyze-batch",
+                    "json": {"texts": self._sample(self.batch_size)}}
+        content = "\n".join(self._sample(self.upload_size)).encode("utf-8")
+        return {"kind": kind, "comments": self.upload_size, "method": "POST", "url": "/upload",
+                "files": {"file": ("yuk_testi.txt", content, "text/plain")}}
+
+
+class LevelStats:
+    """Bir yük seviyesinin sonuçları"""
+
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.errors: Dict[str, int] = {}
+        self.comments = 0
+        self.started = time.perf_counter()
+        self.finished: Optional[float] = None
+
+    def record(self, request: Dict[str, Any], status: Optional[int], seconds: float, error: str = "") -> None:
+        if status == 200:
+            self.latencies.append(seconds)
+            self.comments += request["comments"]
+            return
+        key = str(status) if status is not None else error or "bağlantı"
+        self.errors[key] = self.errors.get(key, 0) + 1
+
+    def summary(self) -> Dict[str, Any]:
+        elapsed = (self.finished or time.perf_counter()) - self.started
+        ok = len(self.latencies)
+        failed = sum(self.errors.values())
+        ordered = sorted(self.latencies)
+        return {
+            "requests": ok + failed,
+            "ok": ok,
+            "errors": dict(self.errors),
+            "error_rate": failed / (ok + failed) if ok + failed else 0.0,
+            "throughput_rps": ok / elapsed if elapsed else 0.0,
+            "comments_per_second": self.comments / elapsed if elapsed else 0.0,
+            "mean_ms": sum(ordered) / ok * 1000 if ok else None,
+            "p50_ms": percentile(ordered, 50),
+            "p95_ms": percentile(ordered, 95),
+            "p99_ms": percentile(ordered, 99),
+            "max_ms": ordered[-1] * 1000 if ordered else None,
+            "seconds": round(elapsed, 2)
+        }
+
+
+def percentile(ordered: List[float], q: float) -> Optional[float]:
+    """Sıralı örneklerde en yakın sıra yüzdeliği (ms)"""
+    if not ordered:
+        return None
+    index = min(len(ordered) - 1, max(0, int(round(q / 100 * len(ordered))) - 1))
+    return ordered[index] * 1000
+
+
+async def send(client: httpx.AsyncClient, request: Dict[str, Any], stats: LevelStats) -> None:
+    start = time.perf_counter()
+    try:
+        response = await client.request(request["method"], request["url"],
+                                        json=request.get("json"), files=request.get("files"))
+        stats.record(request, response.status_code, time.perf_counter() - start)
+    except httpx.TimeoutException:
+        stats.record(request, None, time.perf_counter() - start, "zaman_aşımı")
+    except httpx.HTTPError as e:
+        stats.record(request, None, time.perf_counter() - start, type(e).__name__)
+
+
+async def run_concurrency(client: httpx.AsyncClient, factory: RequestFactory,
+                          concurrency: int, duration: float) -> Dict[str, Any]:
+    """Kapalı döngü: concurrency işçi süre dolana kadar art arda istek gönderir"""
+    stats = LevelStats()
+    deadline = stats.started + duration
+
+    async def worker():
+        while time.perf_counter() < deadline:
+            await send(client, factory.next(), stats)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    stats.finished = time.perf_counter()
+    return {"level": concurrency, "mode": "concurrency", **stats.summary()}
+
+
+async def run_rate(client: httpx.AsyncClient, factory: RequestFactory, rps: float,
+                   duration: float, max_inflight: int) -> Dict[str, Any]:
+    """Açık döngü: istekler yanıt beklenmeden 1/rps aralıkla başlatılır"""
+    stats = LevelStats()
+    inflight = asyncio.Semaphore(max_inflight)
+    tasks = []
+    dropped = 0
+
+    async def fire(request):
+        try:
+            await send(client, request, stats)
+        finally:
+            inflight.release()
+
+    total = int(rps * duration)
+    for index in range(total):
+        # Zamanlama birikimli hesaplanır; gecikmeler sonraki istekleri kaydırmaz
+        delay = stats.started + index / rps - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if inflight.locked():
+            # İstemci tarafı sınır dolu: bu istek gönderilmeden başarısız sayılır
+            dropped += 1
+            continue
+        await inflight.acquire()
+        tasks.append(asyncio.create_task(fire(factory.next())))
+    await asyncio.gather(*tasks)
+    stats.finished = time.perf_counter()
+    if dropped:
+        stats.errors["istemci_sınırı"] = dropped
+    return {"level": rps, "mode": "rps", "offered_rps": rps, **stats.summary()}
+
+
+def find_knee(levels: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Verim / ortalama gecikme oranının en yüksek olduğu seviye
+
+    Bu noktadan sonra yük artışı verimi az artırırken gecikmeyi hızla büyütür.
+    """
+    candidates = [level for level in levels if level["mean_ms"] and level["error_rate"] < 0.01]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda level: level["throughput_rps"] / level["mean_ms"])
+
+
+def print_table(levels: List[Dict[str, Any]], knee: Optional[Dict[str, Any]]) -> None:
+    def fmt(value):
+        return f"{value:8.1f}" if value is not None else "       -"
+
+    label = "RPS" if levels and levels[0]["mode"] == "rps" else "Eşz."
+    print(f"\n{label:>6} {'istek/s':>8} {'yorum/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'hata %':>7}")
+    for level in levels:
+        marker = "  ← diz" if knee is not None and level is knee else ""
+        print(f"{level['level']:>6} {level['throughput_rps']:8.1f} {level['comments_per_second']:8.1f} "
+              f"{fmt(level['p50_ms'])} {fmt(level['p95_ms'])} {fmt(level['p99_ms'])} "
+              f"{level['error_rate'] * 100:6.1f}%{marker}")
+        if level["errors"]:
+            print(f"       hatalar: {level['errors']}")
+
+
+async def run(args, client: httpx.AsyncClient, comments: List[str]) -> Dict[str, Any]:
+    factory = RequestFactory(comments, args.workload, args.batch_size, args.upload_size, args.seed)
+    levels = []
+    for index, value in enumerate(parse_levels(args.rps or args.concurrency)):
+        if index and args.pause:
+            await asyncio.sleep(args.pause)
+        if args.rps:
+            print(f"🚀 {value:g} RPS, {args.duration:g} sn ({args.workload})")
+            levels.append(await run_rate(client, factory, value, args.duration, args.max_inflight))
+        else:
+            print(f"🚀 {int(value)} eşzamanlı istemci, {args.duration:g} sn ({args.workload})")
+            levels.append(await run_concurrency(client, factory, int(value), args.duration))
+    knee = find_knee(levels)
+    print_table(levels, knee)
+    if knee is not None:
+        print(f"\n📈 Diz noktası: {knee['level']} ({knee['mode']}) - "
+              f"{knee['throughput_rps']:.1f} istek/s, p95 {knee['p95_ms']:.1f} ms")
+    return {"workload": args.workload, "levels": levels, "knee": knee["level"] if knee else None}
+
+
+def parse_levels(value: str) -> List[float]:
+    return [float(part) for part in value.split(",") if part.strip()]
+
+
+def make_client(args) -> httpx.AsyncClient:
+    limits = httpx.Limits(max_connections=args.max_inflight, max_keepalive_connections=args.max_inflight)
+    timeout = httpx.Timeout(args.timeout)
+    if not args.inprocess:
+        return httpx.AsyncClient(base_url=args.url, limits=limits, timeout=timeout)
+    # Sunucusuz: uygulama aynı süreçte ASGI üzerinden çağrılır (istemci ve
+    # sunucu aynı GIL'i paylaşır; mutlak değerler gerçek sunucudan düşüktür)
+    from benchmark import load_engine
+    api, _ = load_engine(args.backend)
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=api.app), base_url="http://yuk-testi",
+                             timeout=timeout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Eşzamanlı asenkron yük testi")
+    parser.add_argument("--url", default=DEFAULT_URL, help="API adresi")
+    parser.add_argument("--corpus", action="append", help="TXT/CSV derlem dosyası (birden çok verilebilir)")
+    parser.add_argument("--synthetic", type=int, default=1000, help="Derlem yoksa sentetik yorum sayısı")
+    parser.add_argument("--workload", choices=["analyze", "batch", "upload", "mix"], default="analyze")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="/analyze-batch başına yorum")
+    parser.add_argument("--upload-size", type=int, default=DEFAULT_UPLOAD_SIZE, help="/upload dosyası başına yorum")
+    parser.add_argument("--concurrency", default="1,2,4,8,16", help="Eşzamanlılık seviyeleri (virgülle)")
+    parser.add_argument("--rps", help="Sabit RPS seviyeleri (virgülle); verilirse açık döngü kullanılır")
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION, help="Seviye başına süre (sn)")
+    parser.add_argument("--pause", type=float, default=0.0, help="Seviyeler arası bekleme (sn)")
+    parser.add_argument("--max-inflight", type=int, default=256, help="Aynı anda açık istek sınırı")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="İstek zaman aşımı (sn)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--inprocess", action="store_true", help="Uygulamayı aynı süreçte ASGI ile çalıştır")
+    parser.add_argument("--backend", choices=["stub", "hub"], default="stub", help="--inprocess için model arka ucu")
+    parser.add_argument("--output", help="Sonuçları bu JSON dosyasına yaz")
+    args = parser.parse_args()
+
+    output = os.path.abspath(args.output) if args.output else None
+    if args.corpus:
+        comments = load_corpus(args.corpus)
+    else:
+        from benchmark import synthetic_corpus
+        comments = synthetic_corpus(args.synthetic, args.seed)
+    if not comments:
+        parser.error("Derlemde yorum bulunamadı")
+    print(f"📚 {len(comments)} yorumluk derlem")
+
+    async def runner():
+        async with make_client(args) as client:
+            return await run(args, client, comments)
+
+    report = asyncio.run(runner())
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"💾 Sonuçlar kaydedildi: {output}")
+
+
+if __name__ == "__main__":
+    main()
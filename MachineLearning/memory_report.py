@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Bellek Muhasebesi ve Ayırma İzleme
+
+Modeller için parametre/buffer baytları tensörlerden kesin olarak hesaplanır.
+Python yapıları (önbellek, indeks, depo) için boyut sys.getsizeof ile
+özyinelemeli ölçülür; büyük kaplarda örnekleme ile tahmin edilir.
+
+tracemalloc anlık görüntüleri alınıp karşılaştırılabilir veya tek bir çağrı
+(ör. analyze_comments, parse_csv_file) iki görüntü arasında çalıştırılarak
+ayırma sıcak noktaları bulunabilir.
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+DEFAULT_SAMPLE = 500
+DEFAULT_TRACE_FRAMES = 10
+MAX_SNAPSHOTS = 10
+
+
+# ----- boyut ölçümü -----
+
+def deep_sizeof(obj: Any, seen: Optional[set] = None) -> int:
+    """Nesne ve içerdiklerinin toplam boyutu (paylaşılan nesneler bir kez sayılır)"""
+    if seen is None:
+        seen = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+    return total
+
+
+def estimate_size(container: Any, sample: int = DEFAULT_SAMPLE) -> Dict[str, Any]:
+    """Büyük dict/list için örnekleme ile boyut tahmini"""
+    size = len(container)
+    if size <= sample:
+        return {"items": size, "bytes": deep_sizeof(container), "estimated": False}
+
+    if isinstance(container, dict):
+        keys = random.sample(list(container.keys()), sample)
+        items = [(key, container[key]) for key in keys]
+    else:
+        items = random.sample(list(container), sample)
+    # Örneklenen öğeler arasında paylaşılan nesneler bir kez sayılır
+    per_item = deep_sizeof(items) - sys.getsizeof(items)
+    if isinstance(container, dict):
+        per_item -= sum(sys.getsizeof(item) for item in items)
+    return {
+        "items": size,
+        "bytes": int(sys.getsizeof(container) + per_item / sample * size),
+        "estimated": True
+    }
+
+
+def module_memory(module: Any) -> Dict[str, Any]:
+    """torch modülünün parametre ve buffer bellek kullanımı"""
+    parameter_bytes = parameter_count = buffer_bytes = 0
+    dtypes: Dict[str, int] = {}
+    for parameter in module.parameters():
+        size = parameter.numel() * parameter.element_size()
+        parameter_bytes += size
+        parameter_count += parameter.numel()
+        dtypes[str(parameter.dtype)] = dtypes.get(str(parameter.dtype), 0) + size
+    for buffer in module.buffers():
+        buffer_bytes += buffer.numel() * buffer.element_size()
+    return {
+        "parameters": parameter_count,
+        "parameter_bytes": parameter_bytes,
+        "buffer_bytes": buffer_bytes,
+        "total_bytes": parameter_bytes + buffer_bytes,
+        "dtypes": dtypes
+    }
+
+
+def tokenizer_memory(tokenizer: Any) -> Dict[str, Any]:
+    """Tokenizer sözlüğü ve Python tarafı önbellekleri (yaklaşık)"""
+    report: Dict[str, Any] = {"class": type(tokenizer).__name__, "vocab_size": len(tokenizer)}
+    vocab = tokenizer.get_vocab()
+    report["vocab_bytes"] = estimate_size(vocab)["bytes"]
+    # Yavaş tokenizer'ların kelime önbellekleri (ör. BPE cache)
+    cache = getattr(tokenizer, "cache", None)
+    if isinstance(cache, dict):
+        report["cache_entries"] = len(cache)
+        report["cache_bytes"] = estimate_size(cache)["bytes"]
+    report["rust_backend"] = bool(getattr(tokenizer, "is_fast", False))
+    return report
+
+
+def containers_memory(containers: Dict[str, Any], exact: bool = False) -> Dict[str, Any]:
+    """Bileşenin bellek içi yapılarını ölç, toplamı ekle"""
+    report: Dict[str, Any] = {}
+    total = 0
+    for name, container in containers.items():
+        if exact:
+            entry = {"items": len(container), "bytes": deep_sizeof(container), "estimated": False}
+        else:
+            entry = estimate_size(container)
+        report[name] = entry
+        total += entry["bytes"]
+    report["total_bytes"] = total
+    return report
+
+
+def format_bytes(value: int) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(value) < 1024:
+            return f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} TB"
+
+
+# ----- tracemalloc -----
+
+class TraceSnapshots:
+    """Adlandırılmış tracemalloc anlık görüntüleri (en fazla MAX_SNAPSHOTS)"""
+
+    def __init__(self):
+        self._snapshots: "OrderedDict[str, Tuple[float, tracemalloc.Snapshot]]" = OrderedDict()
+
+    @staticmethod
+    def start(frames: int = DEFAULT_TRACE_FRAMES) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+
+    def stop(self) -> None:
+        tracemalloc.stop()
+        self._snapshots.clear()
+
+    def take(self) -> Dict[str, Any]:
+        if not tracemalloc.is_tracing():
+            raise RuntimeError("tracemalloc çalışmıyor, önce başlatın")
+        snapshot_id = uuid.uuid4().hex[:8]
+        snapshot = _filtered(tracemalloc.take_snapshot())
+        self._snapshots[snapshot_id] = (time.time(), snapshot)
+        while len(self._snapshots) > MAX_SNAPSHOTS:
+            self._snapshots.popitem(last=False)
+        current, peak = tracemalloc.get_traced_memory()
+        return {"id": snapshot_id, "traced_bytes": current, "peak_bytes": peak}
+
+    def get(self, snapshot_id: str) -> tracemalloc.Snapshot:
+        if snapshot_id not in self._snapshots:
+            raise KeyError(snapshot_id)
+        return self._snapshots[snapshot_id][1]
+
+    def list(self) -> List[Dict[str, Any]]:
+        return [{"id": key, "taken_at": taken_at} for key, (taken_at, _) in self._snapshots.items()]
+
+
+def _filtered(snapshot: tracemalloc.Snapshot) -> tracemalloc.Snapshot:
+    return snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<unknown>"),
+    ))
+
+
+def diff_snapshots(before: tracemalloc.Snapshot, after: tracemalloc.Snapshot,
+                   group_by: str = "lineno", limit: int = 20) -> List[Dict[str, Any]]:
+    """İki görüntü arasındaki en büyük ayırma farkları"""
+    stats = after.compare_to(before, group_by)
+    top = []
+    for stat in stats[:limit]:
+        frames = [f"{frame.filename}:{frame.lineno}" for frame in stat.traceback]
+        top.append({
+            "location": frames[0] if group_by != "traceback" else frames,
+            "size_diff_bytes": stat.size_diff,
+            "size_bytes": stat.size,
+            "count_diff": stat.count_diff,
+            "count": stat.count
+        })
+    return top
+
+
+def trace_call(func: Callable[..., Any], *args, frames: int = DEFAULT_TRACE_FRAMES,
+               group_by: str = "lineno", limit: int = 20) -> Dict[str, Any]:
+    """func'u iki tracemalloc görüntüsü arasında çalıştır, ayırma farkını döndür"""
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start(frames)
+    try:
+        before = _filtered(tracemalloc.take_snapshot())
+        tracemalloc.reset_peak()
+        start_current, _ = tracemalloc.get_traced_memory()
+        start_time = time.perf_counter()
+        func(*args)
+        elapsed = time.perf_counter() - start_time
+        end_current, peak = tracemalloc.get_traced_memory()
+        after = _filtered(tracemalloc.take_snapshot())
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return {
+        "function": getattr(func, "__name__", str(func)),
+        "seconds": round(elapsed, 4),
+        "retained_bytes": end_current - start_current,
+        "peak_bytes": peak - start_current,
+        "top": diff_snapshots(before, after, group_by, limit)
+    }
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Canlı Profil Alma ve Server-Timing
+
+StackSampler, çalışan süreçteki tüm iş parçacıklarının yığınlarını belirli
+aralıklarla örnekler ve flamegraph araçlarının (flamegraph.pl, speedscope)
+okuduğu "collapsed stack" formatında ("a;b;c 42") döndürür. Örnekleyici
+yalnızca açıkken maliyet getirir; kapalıyken sık yolda hiçbir şey yapmaz.
+
+Server-Timing için istek başına bir sözlük contextvar içinde tutulur; motor
+aşamaları süreleri buraya ekler ve ara katman yanıt başlığına yazar.
+"""
+
+import os
+import sys
+import threading
+import time
+import uuid
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+DEFAULT_INTERVAL = 0.005
+DEFAULT_SECONDS = 10.0
+MAX_SECONDS = 300.0
+# Bu fonksiyonlarda duran yığınlar boşta bekleme sayılır
+IDLE_FUNCTIONS = {"wait", "select", "poll", "sleep", "accept", "_wait_for_tstate_lock", "get", "run_forever", "_run_once"}
+
+# ----- Server-Timing -----
+
+_request_timings: ContextVar[Optional[Dict[str, float]]] = ContextVar("request_timings", default=None)
+
+
+def record_timing(name: str, seconds: float) -> None:
+    """Aktif isteğin Server-Timing kaydına süre ekle (aynı ad tekrarlanırsa toplanır)"""
+    timings = _request_timings.get()
+    if timings is not None:
+        timings[name] = timings.get(name, 0.0) + seconds
+
+
+def format_server_timing(timings: Dict[str, float]) -> str:
+    return ", ".join(f"{name};dur={seconds * 1000:.2f}" for name, seconds in timings.items())
+
+
+class ServerTimingMiddleware:
+    """Yanıta motor aşamalarının sürelerini Server-Timing başlığı olarak ekler"""
+
+    def __init__(self, app, enabled: bool = True):
+        self.app = app
+        self.enabled = enabled
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.enabled:
+            return await self.app(scope, receive, send)
+        timings: Dict[str, float] = {}
+        token = _request_timings.set(timings)
+        start_time = time.perf_counter()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and timings:
+                timings["total"] = time.perf_counter() - start_time
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", format_server_timing(timings).encode("latin-1")))
+                message = dict(message, headers=headers)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _request_timings.reset(token)
+
+
+# ----- Yığın örnekleyici -----
+
+class StackSampler:
+    """sys._current_frames ile periyodik yığın örnekleyici"""
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL, include_idle: bool = False):
+        self.interval = interval
+        self.include_idle = include_idle
+        self.samples = 0
+        self._counts: Dict[str, int] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                if not self.include_idle and frame.f_code.co_name in IDLE_FUNCTIONS:
+                    continue
+                stack: List[str] = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                stack.append(names.get(thread_id, str(thread_id)))
+                key = ";".join(reversed(stack))
+                self._counts[key] = self._counts.get(key, 0) + 1
+            self.samples += 1
+
+    def collapsed(self) -> str:
+        """flamegraph.pl / speedscope için collapsed stack çıktısı"""
+        counts = dict(self._counts)
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(counts.items(), key=lambda item: -item[1]))
+
+
+class ProfileSession:
+    """Belirli süre veya istek sayısı boyunca açık kalan örnekleme oturumu"""
+
+    def __init__(self, seconds: float, max_requests: int, interval: float, include_idle: bool):
+        self.id = uuid.uuid4().hex[:8]
+        self.seconds = seconds
+        self.max_requests = max_requests
+        self.requests = 0
+        self.started_at = datetime.now().isoformat()
+        self.finished_at: Optional[str] = None
+        self.sampler = StackSampler(interval, include_idle)
+        self._lock = threading.Lock()
+        self._timer = threading.Timer(seconds, self.stop)
+        self._timer.daemon = True
+
+    @property
+    def running(self) -> bool:
+        return self.finished_at is None
+
+    def start(self) -> None:
+        self.sampler.start()
+        self._timer.start()
+
+    def stop(self) -> None:
+        with self._lock:
+            if not self.running:
+                return
+            self.finished_at = datetime.now().isoformat()
+        self._timer.cancel()
+        self.sampler.stop()
+
+    def note_request(self) -> None:
+        if not self.running or not self.max_requests:
+            return
+        with self._lock:
+            self.requests += 1
+            done = self.requests >= self.max_requests
+        if done:
+            self.stop()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "status": "running" if self.running else "completed",
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "seconds": self.seconds,
+            "max_requests": self.max_requests or None,
+            "requests": self.requests,
+            "interval_ms": round(self.sampler.interval * 1000, 2),
+            "samples": self.sampler.samples
+        }
+
+
+class Profiler:
+    """Tek seferde en fazla bir oturum çalıştıran profil yöneticisi"""
+
+    def __init__(self):
+        self.session: Optional[ProfileSession] = None
+
+    def start(self, seconds: float = DEFAULT_SECONDS, max_requests: int = 0,
+              interval: float = DEFAULT_INTERVAL, include_idle: bool = False) -> ProfileSession:
+        if self.session is not None and self.session.running:
+            raise RuntimeError("Zaten çalışan bir profil oturumu var")
+        if not 0 < seconds <= MAX_SECONDS:
+            raise ValueError(f"seconds 0 ile {MAX_SECONDS:.0f} arasında olmalı")
+        if interval <= 0:
+            raise ValueError("interval pozitif olmalı")
+        self.session = ProfileSession(seconds, max_requests, interval, include_idle)
+        self.session.start()
+        return self.session
+
+    def note_request(self) -> None:
+        session = self.session
+        if session is not None:
+            session.note_request()
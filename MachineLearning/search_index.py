@@ -0,0 +1,496 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Yorum Metinleri için Tam Metin Arama İndeksi
+
+Ters indeks (terim -> ID sıralı yorum_id ve terim_frekansı dizileri) yorum
+deposu ekleme/silme olaylarıyla artımlı olarak güncellenir. Sorgular terim,
+önek (yemek*) ve tırnak içinde ifade ("kahve makinesi") içerebilir; tüm
+parçalar eşleşmelidir. Sonuçlar BM25 ile sıralanır.
+
+Kesişim ve filtreler (ID aralığı, sentiment, silinenler) numpy ile diziler
+üzerinde arama (searchsorted) yapılarak uygulanır. Tek terimli sorgularda
+toplam dilim boyundan gelir ve en iyi sonuçlar blok başına skor üst
+sınırıyla (block-max) bulunur: bloklar sınıra göre azalan sırada puanlanır,
+kalan blokların sınırı offset+limit'inci skorun altına düşünce durulur.
+"""
+
+import math
+import re
+import threading
+from bisect import bisect_left, insort
+from collections import Counter
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+MAX_PREFIX_EXPANSION = 200
+
+# Skor üst sınırı tutulan blok boyu (posting sayısı)
+BLOCK_SIZE = 128
+# İlk turda puanlanan blok sayısı (her turda iki katına çıkar)
+FIRST_BLOCK_BATCH = 8
+# Silinenler bir posting listesinin bu oranını geçince dizi temizlenir
+DEAD_POSTING_RATIO = 0.25
+# Ortalama yorum uzunluğu bu oranda kayınca blok sınırları yeniden hesaplanır
+BOUND_REFRESH_DRIFT = 0.05
+# Blok sınırları kayan nokta yuvarlamasına karşı bu oranda gevşetilir
+BOUND_SLACK = 1e-9
+
+# Türkçe büyük/küçük harf dönüşümü: I -> ı, İ -> i (str.lower bunu yanlış yapar)
+_TURKISH_UPPER = str.maketrans({"I": "ı", "İ": "i"})
+
+
+def turkish_lower(text: str) -> str:
+    """Türkçe kurallarına göre küçük harfe çevir"""
+    return text.translate(_TURKISH_UPPER).lower()
+
+
+def normalize_text(text: str) -> str:
+    """Arama için metni normalize et (clean_text ile aynı temizlik, Türkçe küçük harf)"""
+    text = turkish_lower(text)
+    text = re.sub(r'[^\w\sçğıöşü]', ' ', text)
+    text = re.sub(r'(.)\1{2,}', r'\1\1', text)
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def tokenize(text: str) -> List[str]:
+    return normalize_text(text).split()
+
+
+def parse_query(query: str) -> Tuple[List[str], List[str], List[List[str]]]:
+    """Sorguyu (terimler, önekler, ifadeler) olarak ayrıştır"""
+    phrases = []
+    for phrase in re.findall(r'"([^"]*)"', query):
+        tokens = tokenize(phrase)
+        if len(tokens) == 1:
+            query += " " + tokens[0]
+        elif tokens:
+            phrases.append(tokens)
+    rest = re.sub(r'"[^"]*"', ' ', query)
+
+    terms, prefixes = [], []
+    for raw in rest.split():
+        is_prefix = raw.endswith("*")
+        tokens = tokenize(raw)
+        if not tokens:
+            continue
+        if is_prefix and len(tokens) == 1:
+            prefixes.append(tokens[0])
+        else:
+            terms.extend(tokens)
+    return terms, prefixes, phrases
+
+
+def _term_weights(tfs: np.ndarray, lengths: np.ndarray, avg_length: float) -> np.ndarray:
+    """BM25'in IDF dışındaki terim bileşeni"""
+    tf = tfs.astype(np.float64)
+    if avg_length:
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths / avg_length)
+    else:
+        norm = BM25_K1
+    return tf * (BM25_K1 + 1) / (tf + norm)
+
+
+def _block_max(ids: np.ndarray, tfs: np.ndarray, lengths: np.ndarray, avg_length: float) -> np.ndarray:
+    """Blok başına en büyük terim bileşeni"""
+    if not len(ids):
+        return np.empty(0)
+    weights = _term_weights(tfs, lengths[ids], avg_length)
+    return np.maximum.reduceat(weights, np.arange(0, len(ids), BLOCK_SIZE))
+
+
+def _bound_scale(bound_avg: float, avg_length: float) -> float:
+    """bound_avg ile hesaplanmış blok maksimumlarını avg_length için üst sınıra çeviren çarpan
+
+    Ortalama uzunluk büyüdükçe normalizasyon küçülür ve skorlar en fazla
+    avg_length / bound_avg oranında artar; küçülürse skorlar yalnızca azalır.
+    """
+    if not bound_avg or not avg_length:
+        return 1.0 if bound_avg == avg_length else math.inf
+    return max(1.0, avg_length / bound_avg)
+
+
+class _PostingList:
+    """Bir terimin ID sıralı posting dizileri ve blok skor sınırları
+
+    Yeni yorumlar önce tail listelerine eklenir; sorgudan önce seal ile
+    dizilere katılır. Silinenler dizide kalır (canlılık maskesiyle elenir),
+    oranları DEAD_POSTING_RATIO'yu geçince diziden atılır. Blok maksimumları
+    bound_avg ortalama uzunluğuyla hesaplanır; ortalama BOUND_REFRESH_DRIFT'ten
+    fazla kayınca yeniden hesaplanır.
+    """
+
+    __slots__ = ("ids", "tfs", "block_max", "bound_avg", "tail_ids", "tail_tfs", "dead")
+
+    def __init__(self):
+        self.ids = np.empty(0, np.int64)
+        self.tfs = np.empty(0, np.int32)
+        self.block_max = np.empty(0)
+        self.bound_avg = 0.0
+        self.tail_ids: List[int] = []
+        self.tail_tfs: List[int] = []
+        self.dead = 0
+
+    def __len__(self) -> int:
+        """Canlı posting sayısı (belge frekansı)"""
+        return len(self.ids) + len(self.tail_ids) - self.dead
+
+    def append(self, doc_id: int, tf: int) -> None:
+        self.tail_ids.append(doc_id)
+        self.tail_tfs.append(tf)
+
+    def parts(self) -> List[Any]:
+        return [self.ids, self.tfs, self.block_max, self.tail_ids, self.tail_tfs]
+
+    def seal(self, lengths: np.ndarray, live: np.ndarray, avg_length: float) -> None:
+        """Bekleyen eklemeleri dizilere kat, gerekirse silinenleri temizle ve sınırları yenile"""
+        first = None
+        if self.tail_ids:
+            new_ids = np.array(self.tail_ids, np.int64)
+            new_tfs = np.array(self.tail_tfs, np.int32)
+            self.tail_ids, self.tail_tfs = [], []
+            ids = np.concatenate((self.ids, new_ids))
+            tfs = np.concatenate((self.tfs, new_tfs))
+            if len(self.ids) and new_ids[0] > self.ids[-1] and np.all(new_ids[1:] > new_ids[:-1]):
+                # Yalnızca sona ekleme: son (yarım) bloktan itibaren sınırları yenile
+                first = len(self.ids) // BLOCK_SIZE
+            else:
+                # İlk doldurma sırasında gelen yeni yorumlar sırayı bozabilir
+                order = np.argsort(ids, kind="stable")
+                ids, tfs = ids[order], tfs[order]
+                first = 0
+            self.ids, self.tfs = ids, tfs
+        if self.dead > DEAD_POSTING_RATIO * len(self.ids):
+            keep = live[self.ids]
+            self.ids, self.tfs = self.ids[keep], self.tfs[keep]
+            self.dead = 0
+            first = 0
+        if abs(avg_length - self.bound_avg) > BOUND_REFRESH_DRIFT * self.bound_avg or not self.bound_avg:
+            self.bound_avg = avg_length
+            first = 0
+        if first is not None:
+            start = first * BLOCK_SIZE
+            block_max = _block_max(self.ids[start:], self.tfs[start:], lengths, self.bound_avg)
+            self.block_max = np.concatenate((self.block_max[:first], block_max))
+
+
+class _Group:
+    """Sorgu parçasının posting dizileri (önek için birleşik) ve blok sınırları"""
+
+    __slots__ = ("ids", "tfs", "block_max", "scale", "df", "idf")
+
+    def __init__(self, ids: np.ndarray, tfs: np.ndarray, block_max: np.ndarray, scale: float, df: int):
+        self.ids = ids
+        self.tfs = tfs
+        self.block_max = block_max
+        self.scale = scale
+        self.df = df
+        self.idf = 0.0
+
+    def bounds(self, first: int = 0, last: Optional[int] = None) -> np.ndarray:
+        """[first, last) bloklarının skor üst sınırları"""
+        return self.idf * self.scale * self.block_max[first:last]
+
+
+class SearchIndex:
+    """Artımlı güncellenen BM25 ters indeksi"""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._postings: Dict[str, _PostingList] = {}
+        self._vocabulary: List[str] = []            # önek sorguları için sıralı
+        # yorum_id -> " token token " (ifade araması alt dize aramasıyla yapılır)
+        self._doc_texts: Dict[int, str] = {}
+        # yorum_id -> token sayısı / canlı mı (ID ile doğrudan indekslenir)
+        self._lengths = np.zeros(1024, np.int32)
+        self._live = np.zeros(1024, np.bool_)
+        self._total_length = 0
+        # Dışarıdan verilen ID listelerinin (ör. sentiment indeksi) dizi kopyaları
+        self._restrict_cache: Dict[int, Tuple[Sequence[int], np.ndarray]] = {}
+        self.ready = False
+
+    def __len__(self) -> int:
+        return len(self._doc_texts)
+
+    def memory_containers(self) -> Dict[str, Any]:
+        """Bellek raporu için bellek içi yapılar"""
+        with self._lock:
+            postings = [part for posting in self._postings.values() for part in posting.parts()]
+        return {"postings": postings, "vocabulary": self._vocabulary, "documents": self._doc_texts,
+                "document_arrays": [self._lengths, self._live]}
+
+    # ----- güncelleme -----
+
+    def _ensure_capacity(self, doc_id: int) -> None:
+        size = len(self._lengths)
+        if doc_id < size:
+            return
+        size = max(doc_id + 1, size * 2)
+        lengths = np.zeros(size, np.int32)
+        lengths[:len(self._lengths)] = self._lengths
+        live = np.zeros(size, np.bool_)
+        live[:len(self._live)] = self._live
+        self._lengths, self._live = lengths, live
+
+    def add_document(self, comment: Dict[str, Any]) -> None:
+        """Yorumu indekse ekle (aynı ID tekrar eklenmez)"""
+        doc_id = comment["id"]
+        tokens = tokenize(comment.get("text") or "")
+        with self._lock:
+            if doc_id in self._doc_texts:
+                return
+            self._doc_texts[doc_id] = " " + " ".join(tokens) + " "
+            self._total_length += len(tokens)
+            self._ensure_capacity(doc_id)
+            self._lengths[doc_id] = len(tokens)
+            self._live[doc_id] = True
+            for token, tf in Counter(tokens).items():
+                postings = self._postings.get(token)
+                if postings is None:
+                    postings = self._postings[token] = _PostingList()
+                    insort(self._vocabulary, token)
+                postings.append(doc_id, tf)
+
+    def remove_document(self, comment: Dict[str, Any]) -> None:
+        """Yorumu indeksten çıkar"""
+        doc_id = comment["id"]
+        with self._lock:
+            text = self._doc_texts.pop(doc_id, None)
+            if text is None:
+                return
+            tokens = text.split()
+            self._total_length -= len(tokens)
+            self._live[doc_id] = False
+            for token in set(tokens):
+                postings = self._postings.get(token)
+                if postings is None:
+                    continue
+                postings.dead += 1
+                if not len(postings):
+                    del self._postings[token]
+                    index = bisect_left(self._vocabulary, token)
+                    if index < len(self._vocabulary) and self._vocabulary[index] == token:
+                        self._vocabulary.pop(index)
+
+    def build(self, comments: Iterable[Dict[str, Any]]) -> None:
+        """Mevcut yorumlarla indeksi doldur"""
+        for comment in comments:
+            self.add_document(comment)
+        with self._lock:
+            avg_length = self._avg_length()
+            for postings in self._postings.values():
+                postings.seal(self._lengths, self._live, avg_length)
+        self.ready = True
+
+    # ----- sorgu -----
+
+    def _expand_prefix(self, prefix: str) -> List[str]:
+        start = bisect_left(self._vocabulary, prefix)
+        terms = []
+        for term in self._vocabulary[start:start + MAX_PREFIX_EXPANSION]:
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+        return terms
+
+    def _avg_length(self) -> float:
+        n_docs = len(self._doc_texts)
+        return self._total_length / n_docs if n_docs else 0.0
+
+    def _idf(self, document_frequency: int) -> float:
+        n = len(self._doc_texts)
+        return math.log(1 + (n - document_frequency + 0.5) / (document_frequency + 0.5))
+
+    def _group(self, terms: List[str], avg_length: float) -> Optional[_Group]:
+        """Terimlerden birini içeren canlı yorumlar (tek terimde diziler kopyalanmaz)"""
+        postings = [self._postings[t] for t in terms if t in self._postings]
+        for posting in postings:
+            posting.seal(self._lengths, self._live, avg_length)
+        if len(postings) == 1:
+            posting = postings[0]
+            if not len(posting):
+                return None
+            return _Group(posting.ids, posting.tfs, posting.block_max,
+                          _bound_scale(posting.bound_avg, avg_length), len(posting))
+        if not postings:
+            return None
+        ids = np.concatenate([p.ids for p in postings])
+        tfs = np.concatenate([p.tfs for p in postings])
+        keep = self._live[ids]
+        ids, tfs = ids[keep], tfs[keep]
+        if not len(ids):
+            return None
+        order = np.argsort(ids, kind="stable")
+        ids, tfs = ids[order], tfs[order]
+        starts = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]])
+        ids, tfs = ids[starts], np.add.reduceat(tfs, starts)
+        return _Group(ids, tfs, _block_max(ids, tfs, self._lengths, avg_length), 1.0, len(ids))
+
+    def _restrict_array(self, ids: Sequence[int]) -> np.ndarray:
+        """Artan ID listesinin dizi kopyası (yalnızca sona eklenen listelerde artımlı)"""
+        size = len(ids)
+        cached = self._restrict_cache.get(id(ids))
+        if cached is None or cached[0] is not ids:
+            if len(self._restrict_cache) >= 8:
+                self._restrict_cache.clear()
+            array = np.fromiter(islice(ids, size), np.int64, size)
+        else:
+            array = cached[1]
+            if len(array) < size:
+                tail = np.fromiter(islice(ids, len(array), size), np.int64, size - len(array))
+                array = np.concatenate((array, tail))
+        self._restrict_cache[id(ids)] = (ids, array)
+        return array
+
+    @staticmethod
+    def _seek(ids: np.ndarray, targets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """ids'te de bulunan hedeflerin maskesi ve ids'teki konumları"""
+        if not len(targets):
+            return np.zeros(len(ids), np.bool_), np.zeros(len(ids), np.intp)
+        positions = np.minimum(np.searchsorted(targets, ids), len(targets) - 1)
+        return targets[positions] == ids, positions
+
+    def _match(self, groups: List[_Group], ids: np.ndarray, tfs: np.ndarray,
+               restricts: List[np.ndarray]) -> Tuple[np.ndarray, List[np.ndarray]]:
+        """İlk grubun postinglerini diğer gruplar, kısıtlar ve canlılıkla kesiştir"""
+        keep = self._live[ids]
+        ids, frequencies = ids[keep], [tfs[keep]]
+        for group in groups[1:]:
+            found, positions = self._seek(ids, group.ids)
+            ids = ids[found]
+            frequencies = [f[found] for f in frequencies] + [group.tfs[positions[found]]]
+        for restrict in restricts:
+            found, _ = self._seek(ids, restrict)
+            ids = ids[found]
+            frequencies = [f[found] for f in frequencies]
+        return ids, frequencies
+
+    def _scores(self, groups: List[_Group], ids: np.ndarray, frequencies: List[np.ndarray],
+                avg_length: float) -> np.ndarray:
+        if avg_length:
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * self._lengths[ids] / avg_length)
+        else:
+            norm = np.full(len(ids), BM25_K1)
+        scores = np.zeros(len(ids))
+        for group, tf in zip(groups, frequencies):
+            tf = tf.astype(np.float64)
+            scores += group.idf * tf * (BM25_K1 + 1) / (tf + norm)
+        return scores
+
+    @staticmethod
+    def _settled(ids: np.ndarray, scores: np.ndarray, wanted: int, bounds: np.ndarray,
+                 blocks: np.ndarray, driver: _Group) -> bool:
+        """Kalan bloklardan hiçbiri ilk wanted sonuca giremiyorsa True"""
+        top = np.lexsort((-ids, -scores))[wanted - 1]
+        threshold, last_id = scores[top], ids[top]
+        # Sınırı eşiğin altındaki bloklar giremez; eşitlerde yalnızca daha yeni ID girebilir
+        reachable = blocks[bounds >= threshold]
+        if not len(reachable):
+            return True
+        newest = min((int(reachable.max()) + 1) * BLOCK_SIZE, len(driver.ids)) - 1
+        return bool(driver.ids[newest] < last_id) and bool(bounds[0] <= threshold * (1 + 2 * BOUND_SLACK))
+
+    def _top_blocks(self, driver: _Group, start: int, end: int, wanted: int,
+                    avg_length: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Tek grupta en iyi wanted sonucu içeren aday kümesi (block-max ile erken durur)
+
+        Bloklar üst sınıra göre azalan (eşitlerde yeni ID'ler önce) sırada,
+        her turda iki katı blok puanlanır.
+        """
+        groups = [driver]
+        first_block, last_block = start // BLOCK_SIZE, (end - 1) // BLOCK_SIZE + 1
+        bounds = driver.bounds(first_block, last_block) * (1 + BOUND_SLACK)
+        blocks = np.arange(first_block, last_block)
+        order = np.lexsort((-blocks, -bounds))
+        bounds, blocks = bounds[order], blocks[order]
+        offsets = np.arange(BLOCK_SIZE)
+
+        ids = np.empty(0, np.int64)
+        scores = np.empty(0)
+        i, batch = 0, FIRST_BLOCK_BATCH
+        while i < len(blocks):
+            if len(ids) >= wanted and self._settled(ids, scores, wanted, bounds[i:], blocks[i:], driver):
+                break
+            positions = (blocks[i:i + batch, None] * BLOCK_SIZE + offsets).ravel()
+            i += batch
+            batch *= 2
+            positions = positions[(positions >= start) & (positions < end)]
+            block_ids, frequencies = self._match(groups, driver.ids[positions], driver.tfs[positions], [])
+            if len(block_ids):
+                ids = np.concatenate((ids, block_ids))
+                scores = np.concatenate((scores, self._scores(groups, block_ids, frequencies, avg_length)))
+        return ids, scores
+
+    def search(self, query: str, limit: int = 20, offset: int = 0,
+               restrict_ids: Optional[Sequence[int]] = None,
+               id_range: Optional[Tuple[int, int]] = None) -> Tuple[List[Tuple[int, float]], int]:
+        """Sorguyu çalıştır - ([(yorum_id, skor)], toplam eşleşme)
+
+        restrict_ids: artan sıralı izinli ID listesi (ör. deponun sentiment
+        indeksi; silinmiş ID'ler içerebilir), id_range: [min, max) ID aralığı
+        """
+        terms, prefixes, phrases = parse_query(query)
+        with self._lock:
+            # Her sorgu parçası bir "grup": gruptaki terimlerden biri eşleşmeli
+            term_groups: List[List[str]] = [[t] for t in dict.fromkeys(terms)]
+            term_groups += [self._expand_prefix(p) for p in prefixes]
+            term_groups += [[t] for phrase in phrases for t in dict.fromkeys(phrase)]
+            if not term_groups:
+                return [], 0
+
+            avg_length = self._avg_length()
+            groups = []
+            for group_terms in term_groups:
+                group = self._group(group_terms, avg_length)
+                if group is None:
+                    return [], 0
+                groups.append(group)
+
+            # En küçük posting listesi kesişimi sürer
+            groups.sort(key=lambda g: g.df)
+            for group in groups:
+                group.idf = self._idf(group.df)
+
+            driver = groups[0]
+            start, end = 0, len(driver.ids)
+            if id_range:
+                start, end = (int(i) for i in np.searchsorted(driver.ids, id_range))
+                end = max(start, end)
+            restricts = [self._restrict_array(restrict_ids)] if restrict_ids is not None else []
+
+            wanted = offset + limit
+            if len(groups) == 1 and not restricts and not phrases:
+                # Tek terim: toplam dilim boyundan gelir, en iyiler blok sınırlarıyla erken durarak bulunur
+                total = end - start
+                if total and driver.df < len(driver.ids):
+                    total = int(np.count_nonzero(self._live[driver.ids[start:end]]))
+                if not total or wanted <= 0:
+                    return [], total
+                ids, scores = self._top_blocks(driver, start, end, wanted, avg_length)
+            else:
+                # Kesin toplam için kesişim zaten tam yapılır; eşleşenler vektörel puanlanır
+                ids, frequencies = self._match(groups, driver.ids[start:end], driver.tfs[start:end], restricts)
+                if phrases and len(ids):
+                    texts = list(map(self._doc_texts.__getitem__, ids.tolist()))
+                    keep = np.ones(len(texts), np.bool_)
+                    for phrase in phrases:
+                        pattern = " " + " ".join(phrase) + " "
+                        keep &= np.array([pattern in text for text in texts], np.bool_)
+                    ids, frequencies = ids[keep], [f[keep] for f in frequencies]
+                total = len(ids)
+                if not total or wanted <= 0:
+                    return [], total
+                scores = self._scores(groups, ids, frequencies, avg_length)
+
+        if len(ids) > wanted:
+            # Eşiğin altında kalanlar sıralamaya girmez
+            threshold = np.partition(scores, len(ids) - wanted)[len(ids) - wanted]
+            keep = scores >= threshold
+            ids, scores = ids[keep], scores[keep]
+        # Eşit skorlarda yeni yorum önce
+        top = np.lexsort((-ids, -scores))[offset:wanted]
+        return [(int(ids[j]), round(float(scores[j]), 4)) for j in top], total
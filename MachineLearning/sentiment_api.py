@@ -1,741 +1,1559 @@
-from fastapi import FastAPI, UploadFile, File, HTTPException
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
-from pydantic import BaseModel
-from transformers import AutoTokenizer, AutoModelForSequenceClassification, pipeline
-import re
-import csv
-import io
-import os
-from typing import List, Dict, Any
-
-# Çoklu model yükle
-MODELS = {
-    "savasy": {
-        "name": "savasy/bert-base-turkish-sentiment-cased",
-        "description": "Türkçe için özel eğitilmiş sentiment modeli"
-    },
-    "dbmdz": {
-        "name": "dbmdz/bert-base-turkish-cased", 
-        "description": "Genel Türkçe BERT modeli"
-    }
-}
-
-# Model pipeline'ları
-pipelines = {}
-for model_id, model_info in MODELS.items():
-    try:
-        tokenizer = AutoTokenizer.from_pretrained(model_info["name"])
-        model = AutoModelForSequenceClassification.from_pretrained(model_info["name"])
-        pipelines[model_id] = pipeline("sentiment-analysis", model=model, tokenizer=tokenizer)
-        print(f"✅ {model_id} modeli yüklendi: {model_info['name']}")
-    except Exception as e:
-        print(f"❌ {model_id} modeli yüklenemedi: {e}")
-
-# API başlat
-app = FastAPI(title="Türkçe Duygu Analizi API - Çoklu Model", version="2.0.0")
-
-# Static dosyaları serve et
-app.mount("/static", StaticFiles(directory="static"), name="static")
-
-class Comment(BaseModel):
-    text: str
-
-class Comments(BaseModel):
-    texts: List[str]
-
-# Etiket eşleme - farklı modeller için
-MAPPINGS = {
-    "savasy": {"positive": "Olumlu", "negative": "Olumsuz", "neutral": "Nötr"},
-    "dbmdz": {"LABEL_0": "Olumsuz", "LABEL_1": "Olumlu", "LABEL_2": "Nötr"}  # Genel BERT için
-}
-
-def is_neutral_comment(text: str) -> bool:
-    """Nötr yorumları tespit et - özellikle iş yeri talepleri ve önerileri için"""
-    text_lower = text.lower()
-    
-    # Nötr göstergeler (talep, öneri, rica) - daha geniş liste
-    neutral_indicators = [
-        'talep ediyoruz', 'istiyoruz', 'rica ediyoruz', 'açılmasını istiyoruz',
-        'bulunmak istiyoruz', 'teşekkür ederiz', 'hayırlı akşamlar', 'hayırlı günler',
-        'personel', 'lojman', 'mescit', 'kahve makinesi', 'dinlenme alanı',
-        'yönetim kurulu', 'sizden ricamız', 'açılmasını talep ediyoruz',
-        'eklenmesini istiyoruz', 'kurulmasını istiyoruz', 'yapılmasını istiyoruz',
-        'düzenlenmesini istiyoruz', 'iyileştirilmesini istiyoruz',
-        'olmasını istiyoruz', 'olmasını talep ediyoruz', 'olmasını rica ediyoruz',
-        'artırılmasını istiyoruz', 'azaltılmasını istiyoruz', 'değiştirilmesini istiyoruz',
-        'yemekhane', 'internet', 'çalışma saati', 'çalışma ortamı', 'sosyal alan',
-        'spor salonu', 'otopark', 'ulaşım', 'servis', 'yemek', 'çay', 'kahve',
-        'temizlik', 'güvenlik', 'bakım', 'onarım', 'yenileme', 'modernizasyon'
-    ]
-    
-    # Şikayet göstergeleri (gerçekten olumsuz olanlar)
-    complaint_indicators = [
-        'kötü', 'berbat', 'rezalet', 'çok kötü', 'hiç beğenmedim', 'beğenmedim',
-        'şikayet', 'memnun değilim', 'kızgınım', 'sinirliyim', 'üzgünüm',
-        'yetersiz', 'kötü kalite', 'düşük kalite', 'sorunlu', 'problemli',
-        'çalışmıyor', 'bozuk', 'arızalı', 'hatalı', 'yanlış', 'kırık',
-        'eski', 'kirli', 'pis', 'kötü kokuyor', 'gürültülü', 'sıcak', 'soğuk'
-    ]
-    
-    # Pozitif göstergeler
-    positive_indicators = [
-        'çok iyi', 'harika', 'mükemmel', 'süper', 'güzel', 'beğendim',
-        'memnun', 'teşekkür', 'başarılı', 'kaliteli', 'profesyonel',
-        'sorunsuz', 'tam istediğimiz gibi', 'çok güzel', 'çok başarılı'
-    ]
-    
-    neutral_count = sum(1 for indicator in neutral_indicators if indicator in text_lower)
-    complaint_count = sum(1 for indicator in complaint_indicators if indicator in text_lower)
-    positive_count = sum(1 for indicator in positive_indicators if indicator in text_lower)
-    
-    # Nötr yorum kriterleri - daha esnek:
-    # 1. Nötr göstergeler yeterli (2+)
-    # 2. Şikayet göstergeleri az (2'den az)
-    # 3. Pozitif göstergeler varsa da nötr olabilir (talep + pozitif = nötr)
-    if neutral_count >= 2 and complaint_count <= 1:
-        return True
-    
-    # Özel durum: "herşey çok iyi sorunsuz fakat" gibi yapılar
-    if 'fakat' in text_lower or 'ama' in text_lower or 'ancak' in text_lower:
-        if neutral_count >= 1:
-            return True
-    
-    # Özel durum: "istiyoruz", "talep ediyoruz" gibi direkt talepler
-    if any(word in text_lower for word in ['istiyoruz', 'talep ediyoruz', 'rica ediyoruz']):
-        if complaint_count == 0:
-            return True
-    
-    # Özel durum: Personel, lojman, yemekhane gibi iş yeri konuları
-    workplace_topics = ['personel', 'lojman', 'yemekhane', 'mescit', 'dinlenme', 'çalışma']
-    if any(topic in text_lower for topic in workplace_topics):
-        if neutral_count >= 1 and complaint_count <= 1:
-            return True
-    
-    return False
-
-def clean_text(text: str) -> str:
-    """Metni normalize et ve temizle"""
-    text = text.lower()
-    # Türkçe karakterleri koru, gereksiz işaretleri temizle
-    text = re.sub(r'[^\w\sçğıöşü]', '', text)
-    # Tekrar eden harfleri azalt (ör: aaa -> aa)
-    text = re.sub(r'(.)\1{2,}', r'\1\1', text)
-    # Fazla boşlukları temizle
-    text = re.sub(r'\s+', ' ', text).strip()
-    return text
-
-def analyze_with_model(text: str, model_id: str) -> Dict[str, Any]:
-    """Belirli bir model ile analiz"""
-    try:
-        pipeline = pipelines.get(model_id)
-        if not pipeline:
-            return {"error": f"Model {model_id} bulunamadı"}
-        
-        result = pipeline(text)[0]
-        label = str(result['label'])
-        confidence = float(result['score'])
-        
-        # Model'e göre etiket eşleme
-        mapping = MAPPINGS.get(model_id, {})
-        sentiment = mapping.get(label, label)
-        
-        return {
-            "model_id": model_id,
-            "sentiment": sentiment,
-            "confidence": confidence,
-            "raw_label": label
-        }
-    except Exception as e:
-        return {"error": str(e)}
-
-def combine_model_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Çoklu model sonuçlarını birleştir"""
-    valid_results = [r for r in results if "error" not in r]
-    
-    if not valid_results:
-        return {"error": "Hiçbir model çalışmadı"}
-    
-    if len(valid_results) == 1:
-        return valid_results[0]
-    
-    # Çoklu model sonuçlarını analiz et
-    sentiments = [r["sentiment"] for r in valid_results]
-    confidences = [r["confidence"] for r in valid_results]
-    
-    # En yüksek güven skoruna sahip sonucu al
-    best_result = max(valid_results, key=lambda x: x["confidence"])
-    
-    # Sonuçlar tutarlı mı kontrol et
-    unique_sentiments = set(sentiments)
-    is_consistent = len(unique_sentiments) == 1
-    
-    return {
-        "final_sentiment": best_result["sentiment"],
-        "final_confidence": best_result["confidence"],
-        "model_used": best_result["model_id"],
-        "consistency": is_consistent,
-        "all_results": valid_results,
-        "method": "multi_model"
-    }
-
-def analyze_comment(comment: str) -> Dict[str, Any]:
-    """Tek yorum analizi - gelişmiş hibrit yaklaşım"""
-    if not comment or len(comment.strip()) < 2:
-        raise HTTPException(status_code=400, detail="Yorum çok kısa veya boş")
-    
-    # 1. Önce kural tabanlı kontrol
-    if is_neutral_comment(comment):
-        return {
-            "yorum": comment,
-            "analiz": "Nötr",
-            "güven": 0.95,
-            "yöntem": "kural_tabanlı",
-            "açıklama": "Talep, öneri veya rica içeren yorum",
-            "model_sonuçları": None
-        }
-    
-    cleaned = clean_text(comment)
-    if len(cleaned.split()) < 2:
-        return {
-            "yorum": comment,
-            "analiz": "Geçersiz / Yetersiz Yorum",
-            "güven": 0.0,
-            "yöntem": "kural_tabanlı",
-            "model_sonuçları": None
-        }
-    
-    try:
-        # 2. Çoklu model analizi
-        model_results = []
-        for model_id in pipelines.keys():
-            result = analyze_with_model(cleaned, model_id)
-            if "error" not in result:
-                model_results.append(result)
-        
-        # 3. Model sonuçlarını birleştir
-        combined_result = combine_model_results(model_results)
-        
-        if "error" in combined_result:
-            raise Exception(combined_result["error"])
-        
-        final_sentiment = combined_result["final_sentiment"]
-        final_confidence = combined_result["final_confidence"]
-        
-        # 4. Model sonucunu kontrol et - eğer çok yüksek güvenle yanlış sınıflandırıyorsa
-        if final_confidence > 0.9 and final_sentiment == "Olumsuz":
-            if is_neutral_comment(comment):
-                return {
-                    "yorum": comment,
-                    "analiz": "Nötr",
-                    "güven": 0.90,
-                    "yöntem": "hibrit_düzeltme",
-                    "açıklama": "Model yanlış sınıflandırdı, kural tabanlı düzeltme uygulandı",
-                    "model_sonuçları": combined_result
-                }
-        
-        return {
-            "yorum": comment,
-            "analiz": final_sentiment,
-            "güven": round(final_confidence, 3),
-            "yöntem": combined_result["method"],
-            "model_sonuçları": combined_result
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Analiz hatası: {str(e)}")
-
-def analyze_comments(comments: List[str]) -> List[Dict[str, Any]]:
-    """Toplu yorum analizi"""
-    if not comments:
-        return []
-    
-    # Boş yorumları filtrele
-    valid_comments = [c.strip() for c in comments if c.strip()]
-    if not valid_comments:
-        return []
-    
-    try:
-        outputs = []
-        for comment in valid_comments:
-            outputs.append(analyze_comment(comment))
-        return outputs
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Toplu analiz hatası: {str(e)}")
-
-def parse_csv_file(file_content: bytes) -> List[str]:
-    """CSV dosyasından yorumları oku"""
-    try:
-        content = file_content.decode('utf-8')
-        csv_reader = csv.reader(io.StringIO(content))
-        comments = []
-        for row in csv_reader:
-            if row and row[0].strip():
-                comments.append(row[0].strip())
-        return comments
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"CSV okuma hatası: {str(e)}")
-
-def parse_txt_file(file_content: bytes) -> List[str]:
-    """TXT dosyasından yorumları oku"""
-    try:
-        content = file_content.decode('utf-8')
-        lines = [line.strip() for line in content.splitlines() if line.strip()]
-        return lines
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"TXT okuma hatası: {str(e)}")
-
-# Veritabanı için basit JSON dosya sistemi
-import json
-import os
-from datetime import datetime
-
-# Veritabanı dosyası
-DB_FILE = "sentiment_database.json"
-
-def load_database():
-    """Veritabanını yükle"""
-    if os.path.exists(DB_FILE):
-        try:
-            with open(DB_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except:
-            pass
-    return {
-        "comments": [],
-        "statistics": {
-            "total": 0,
-            "positive": 0,
-            "negative": 0,
-            "neutral": 0,
-            "invalid": 0
-        },
-        "last_updated": datetime.now().isoformat()
-    }
-
-def save_database(db):
-    """Veritabanını kaydet"""
-    db["last_updated"] = datetime.now().isoformat()
-    with open(DB_FILE, 'w', encoding='utf-8') as f:
-        json.dump(db, f, ensure_ascii=False, indent=2)
-
-def add_comment_to_database(comment_data):
-    """Yorumu veritabanına ekle"""
-    db = load_database()
-    
-    # Yorum ID'si oluştur
-    comment_id = len(db["comments"]) + 1
-    
-    # Yorum verisi
-    comment_entry = {
-        "id": comment_id,
-        "text": comment_data["yorum"],
-        "sentiment": comment_data["analiz"],
-        "confidence": comment_data["güven"],
-        "method": comment_data.get("yöntem", "bilinmiyor"),
-        "timestamp": datetime.now().isoformat(),
-        "model_results": comment_data.get("model_sonuçları", None)
-    }
-    
-    db["comments"].append(comment_entry)
-    
-    # İstatistikleri güncelle
-    db["statistics"]["total"] += 1
-    sentiment = comment_data["analiz"]
-    if sentiment == "Olumlu":
-        db["statistics"]["positive"] += 1
-    elif sentiment == "Olumsuz":
-        db["statistics"]["negative"] += 1
-    elif sentiment == "Nötr":
-        db["statistics"]["neutral"] += 1
-    else:
-        db["statistics"]["invalid"] += 1
-    
-    save_database(db)
-    return comment_id
-
-@app.get("/", response_class=HTMLResponse)
-async def read_root():
-    """Ana sayfa - HTML arayüzünü serve et"""
-    try:
-        html_path = os.path.join("static", "index.html")
-        if os.path.exists(html_path):
-            with open(html_path, "r", encoding="utf-8") as f:
-                return HTMLResponse(content=f.read())
-        else:
-            # HTML dosyası bulunamadıysa basit bir sayfa döndür
-            return HTMLResponse(content="""
-            <!DOCTYPE html>
-            <html lang="tr">
-            <head>
-                <meta charset="UTF-8">
-                <title>Türkçe Duygu Analizi - Çoklu Model</title>
-                <style>
-                    body { font-family: Arial, sans-serif; margin: 40px; }
-                    .container { max-width: 800px; margin: 0 auto; }
-                    .endpoint { background: #f5f5f5; padding: 15px; margin: 10px 0; border-radius: 5px; }
-                    .method { font-weight: bold; color: #007bff; }
-                    .model-info { background: #e8f4fd; padding: 15px; margin: 10px 0; border-radius: 5px; }
-                </style>
-            </head>
-            <body>
-                <div class="container">
-                    <h1>🎭 Türkçe Duygu Analizi API - Çoklu Model</h1>
-                    <p>API çalışıyor! Kullanılabilir endpoint'ler:</p>
-                    
-                    <div class="model-info">
-                        <h3>🤖 Yüklü Modeller</h3>
-                        <ul>
-                            <li><strong>savasy</strong>: Türkçe sentiment için özel eğitilmiş</li>
-                            <li><strong>dbmdz</strong>: Genel Türkçe BERT modeli</li>
-                        </ul>
-                    </div>
-                    
-                    <div class="endpoint">
-                        <span class="method">GET</span> <code>/</code> - Bu sayfa
-                    </div>
-                    
-                    <div class="endpoint">
-                        <span class="method">POST</span> <code>/analyze</code> - Tek yorum analizi
-                    </div>
-                    
-                    <div class="endpoint">
-                        <span class="method">POST</span> <code>/analyze-batch</code> - Toplu yorum analizi (JSON)
-                    </div>
-                    
-                    <div class="endpoint">
-                        <span class="method">POST</span> <code>/upload</code> - Dosya yükleme ve analiz
-                    </div>
-                    
-                    <div class="endpoint">
-                        <span class="method">GET</span> <code>/health</code> - Sağlık kontrolü
-                    </div>
-                    
-                    <div class="endpoint">
-                        <span class="method">GET</span> <code>/docs</code> - Swagger dokümantasyonu
-                    </div>
-                    
-                    <h3>📝 Örnek Kullanım</h3>
-                    <p><strong>Tek yorum analizi:</strong></p>
-                    <pre>curl -X POST "http://localhost:8000/analyze" \
-     -H "Content-Type: application/json" \
-     -d '{"text": "Bu ürün harika!"}'</pre>
-                    
-                    <p><strong>Dosya yükleme:</strong></p>
-                    <pre>curl -X POST "http://localhost:8000/upload" \
-     -F "file=@ornek_yorumlar.txt"</pre>
-                </div>
-            </body>
-            </html>
-            """)
-    except Exception as e:
-        return HTMLResponse(content=f"""
-        <html>
-            <head><title>Hata</title></head>
-            <body><h1>Hata oluştu: {str(e)}</h1></body>
-        </html>
-        """)
-
-@app.post("/analyze")
-async def analyze_single(comment: Comment):
-    """Tek yorum analizi - gelişmiş hibrit yaklaşım"""
-    if not comment or len(comment.strip()) < 2:
-        raise HTTPException(status_code=400, detail="Yorum çok kısa veya boş")
-    
-    # 1. Önce kural tabanlı kontrol
-    if is_neutral_comment(comment.text):
-        result = {
-            "yorum": comment.text,
-            "analiz": "Nötr",
-            "güven": 0.95,
-            "yöntem": "kural_tabanlı",
-            "açıklama": "Talep, öneri veya rica içeren yorum",
-            "model_sonuçları": None
-        }
-    else:
-        cleaned = clean_text(comment.text)
-        if len(cleaned.split()) < 2:
-            result = {
-                "yorum": comment.text,
-                "analiz": "Geçersiz / Yetersiz Yorum",
-                "güven": 0.0,
-                "yöntem": "kural_tabanlı",
-                "model_sonuçları": None
-            }
-        else:
-            try:
-                # 2. Çoklu model analizi
-                model_results = []
-                for model_id in pipelines.keys():
-                    result_model = analyze_with_model(cleaned, model_id)
-                    if "error" not in result_model:
-                        model_results.append(result_model)
-                
-                # 3. Model sonuçlarını birleştir
-                combined_result = combine_model_results(model_results)
-                
-                if "error" in combined_result:
-                    raise Exception(combined_result["error"])
-                
-                final_sentiment = combined_result["final_sentiment"]
-                final_confidence = combined_result["final_confidence"]
-                
-                # 4. Model sonucunu kontrol et - eğer çok yüksek güvenle yanlış sınıflandırıyorsa
-                if final_confidence > 0.9 and final_sentiment == "Olumsuz":
-                    if is_neutral_comment(comment.text):
-                        result = {
-                            "yorum": comment.text,
-                            "analiz": "Nötr",
-                            "güven": 0.90,
-                            "yöntem": "hibrit_düzeltme",
-                            "açıklama": "Model yanlış sınıflandırdı, kural tabanlı düzeltme uygulandı",
-                            "model_sonuçları": combined_result
-                        }
-                    else:
-                        result = {
-                            "yorum": comment.text,
-                            "analiz": final_sentiment,
-                            "güven": round(final_confidence, 3),
-                            "yöntem": combined_result["method"],
-                            "model_sonuçları": combined_result
-                        }
-                else:
-                    result = {
-                        "yorum": comment.text,
-                        "analiz": final_sentiment,
-                        "güven": round(final_confidence, 3),
-                        "yöntem": combined_result["method"],
-                        "model_sonuçları": combined_result
-                    }
-            except Exception as e:
-                raise HTTPException(status_code=500, detail=f"Analiz hatası: {str(e)}")
-    
-    # Yorumu veritabanına ekle
-    try:
-        comment_id = add_comment_to_database(result)
-        result["comment_id"] = comment_id
-    except Exception as e:
-        print(f"Veritabanı hatası: {e}")
-        result["comment_id"] = None
-    
-    return result
-
-@app.post("/analyze-batch")
-async def analyze_batch(payload: Comments):
-    """JSON ile toplu yorum analizi"""
-    return analyze_comments(payload.texts)
-
-@app.post("/upload")
-async def upload_file(file: UploadFile = File(...)):
-    """Dosya yükleme ve analiz"""
-    if not file.filename:
-        raise HTTPException(status_code=400, detail="Dosya adı bulunamadı")
-    
-    # Dosya boyutu kontrolü (5MB)
-    if file.size and file.size > 5 * 1024 * 1024:
-        raise HTTPException(status_code=400, detail="Dosya çok büyük (max 5MB)")
-    
-    try:
-        content = await file.read()
-        
-        if file.filename.lower().endswith('.csv'):
-            comments = parse_csv_file(content)
-        elif file.filename.lower().endswith('.txt'):
-            comments = parse_txt_file(content)
-        else:
-            raise HTTPException(status_code=400, detail="Sadece .csv ve .txt dosyaları desteklenir")
-        
-        if not comments:
-            raise HTTPException(status_code=400, detail="Dosyada geçerli yorum bulunamadı")
-        
-        results = analyze_comments(comments)
-        return {
-            "dosya_adi": file.filename,
-            "yorum_sayisi": len(comments),
-            "sonuclar": results
-        }
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Dosya işleme hatası: {str(e)}")
-
-@app.get("/health")
-async def health_check():
-    """Sağlık kontrolü"""
-    return {
-        "status": "healthy", 
-        "models": {model_id: {"name": info["name"], "status": "loaded"} for model_id, info in MODELS.items()},
-        "pipelines": list(pipelines.keys())
-    }
-
-@app.get("/statistics")
-async def get_statistics():
-    """Güncel istatistikleri getir"""
-    try:
-        db = load_database()
-        return {
-            "status": "success",
-            "data": db["statistics"],
-            "last_updated": db["last_updated"],
-            "total_comments": len(db["comments"])
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"İstatistik hatası: {str(e)}")
-
-@app.get("/comments")
-async def get_comments(limit: int = 50, offset: int = 0):
-    """Yorumları getir"""
-    try:
-        db = load_database()
-        comments = db["comments"][offset:offset+limit]
-        return {
-            "status": "success",
-            "data": comments,
-            "total": len(db["comments"]),
-            "limit": limit,
-            "offset": offset
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Yorum getirme hatası: {str(e)}")
-
-@app.get("/comments/{comment_id}")
-async def get_comment(comment_id: int):
-    """Belirli bir yorumu getir"""
-    try:
-        db = load_database()
-        if comment_id <= 0 or comment_id > len(db["comments"]):
-            raise HTTPException(status_code=404, detail="Yorum bulunamadı")
-        
-        comment = db["comments"][comment_id - 1]
-        return {
-            "status": "success",
-            "data": comment
-        }
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Yorum getirme hatası: {str(e)}")
-
-@app.delete("/comments/{comment_id}")
-async def delete_comment(comment_id: int):
-    """Yorumu sil"""
-    try:
-        db = load_database()
-        if comment_id <= 0 or comment_id > len(db["comments"]):
-            raise HTTPException(status_code=404, detail="Yorum bulunamadı")
-        
-        # Yorumu sil
-        deleted_comment = db["comments"].pop(comment_id - 1)
-        
-        # İstatistikleri güncelle
-        sentiment = deleted_comment["sentiment"]
-        db["statistics"]["total"] -= 1
-        if sentiment == "Olumlu":
-            db["statistics"]["positive"] -= 1
-        elif sentiment == "Olumsuz":
-            db["statistics"]["negative"] -= 1
-        elif sentiment == "Nötr":
-            db["statistics"]["neutral"] -= 1
-        else:
-            db["statistics"]["invalid"] -= 1
-        
-        # ID'leri yeniden düzenle
-        for i, comment in enumerate(db["comments"]):
-            comment["id"] = i + 1
-        
-        save_database(db)
-        
-        return {
-            "status": "success",
-            "message": "Yorum başarıyla silindi",
-            "deleted_comment": deleted_comment
-        }
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Yorum silme hatası: {str(e)}")
-
-@app.post("/analyze-bulk")
-async def analyze_bulk_comments(comments: List[str]):
-    """Toplu yorum analizi"""
-    if not comments or len(comments) == 0:
-        raise HTTPException(status_code=400, detail="Yorum listesi boş")
-    
-    if len(comments) > 100:
-        raise HTTPException(status_code=400, detail="Maksimum 100 yorum analiz edilebilir")
-    
-    results = []
-    start_time = time.time()
-    
-    for comment_text in comments:
-        try:
-            # Her yorumu analiz et
-            comment_obj = Comment(text=comment_text)
-            result = await analyze_single(comment_obj)
-            results.append(result)
-        except Exception as e:
-            results.append({
-                "yorum": comment_text,
-                "analiz": "Hata",
-                "güven": 0.0,
-                "yöntem": "hata",
-                "açıklama": str(e),
-                "comment_id": None
-            })
-    
-    end_time = time.time()
-    processing_time = end_time - start_time
-    
-    return {
-        "status": "success",
-        "message": f"{len(comments)} yorum analiz edildi",
-        "results": results,
-        "processing_time": round(processing_time, 2),
-        "average_time_per_comment": round(processing_time / len(comments), 3)
-    }
-
-@app.get("/export")
-async def export_data(format: str = "json"):
-    """Veriyi dışa aktar"""
-    try:
-        db = load_database()
-        
-        if format.lower() == "csv":
-            import csv
-            from io import StringIO
-            
-            output = StringIO()
-            writer = csv.writer(output)
-            
-            # CSV başlıkları
-            writer.writerow(["ID", "Yorum", "Sentiment", "Güven", "Yöntem", "Tarih"])
-            
-            # Verileri yaz
-            for comment in db["comments"]:
-                writer.writerow([
-                    comment["id"],
-                    comment["text"],
-                    comment["sentiment"],
-                    comment["confidence"],
-                    comment["method"],
-                    comment["timestamp"]
-                ])
-            
-            output.seek(0)
-            return Response(
-                content=output.getvalue(),
-                media_type="text/csv",
-                headers={"Content-Disposition": f"attachment; filename=sentiment_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"}
-            )
-        
-        else:  # JSON format
-            return {
-                "status": "success",
-                "data": db,
-                "export_time": datetime.now().isoformat()
-            }
-            
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Dışa aktarma hatası: {str(e)}")
-
-if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+from fastapi import FastAPI, UploadFile, File, HTTPException, Request, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
+from fastapi.staticfiles import StaticFiles
+from fastapi.responses import HTMLResponse, StreamingResponse, Response
+from pydantic import BaseModel
+import re
+import csv
+import hashlib
+import time
+import asyncio
+import io
+import os
+import threading
+from contextlib import asynccontextmanager
+from typing import List, Dict, Any, Optional
+from result_cache import LRUCache
+from profiling import Profiler, ServerTimingMiddleware, record_timing
+from memory_report import (TraceSnapshots, containers_memory, diff_snapshots, format_bytes,
+                           module_memory, tokenizer_memory, trace_call)
+from metrics import Registry, SIZE_BUCKETS, CONTENT_TYPE as METRICS_CONTENT_TYPE, labelled, process_rss_bytes
+from inference_engine import MAPPINGS, MODELS, InferenceEngine
+from admission import AdmissionController, ClientDisconnected, LatencyEstimator, Overloaded, parse_lane_weights
+
+# Model arka ucu: "hub" gerçek modelleri indirir, "stub" çevrimdışı küçük
+# modeller üretir (test ve benchmark için, bkz. stub_backend.py)
+MODEL_BACKEND = os.environ.get("SENTIMENT_BACKEND", "hub").lower()
+
+# Toplu çıkarım: modele gidecek yorumlar tek tek değil, gruplar halinde işlenir
+INFERENCE_BATCH_SIZE = int(os.environ.get("SENTIMENT_BATCH_SIZE", "32"))
+
+# Ortak çıkarım motoru (bkz. inference_engine.py); forward metrikleri aşağıda bağlanır
+engine = InferenceEngine(MODEL_BACKEND, INFERENCE_BATCH_SIZE)
+
+# Yüklü modeller: torch/transformers ve modeller ilk gerçek kullanımda
+# (sunucu açılışı ya da ilk analiz) yüklenir; içe aktarma hızlı kalır
+pipelines = engine.models
+# Yükleme önbelleği anahtarının parçası: model değişince eski sonuçlar sunulmaz
+MODEL_VERSION: Optional[str] = None
+_models_lock = threading.Lock()
+
+def compute_model_version() -> str:
+    """Yüklü modelleri tanımlayan kısa özet (arka uç, kaynak, revizyon ve etiket eşlemesi)"""
+    parts = [MODEL_BACKEND]
+    for model_id in sorted(pipelines):
+        config = pipelines[model_id].model.config
+        revision = getattr(config, "_commit_hash", None) or getattr(config, "_name_or_path", "")
+        parts.append(f"{model_id}={MODELS[model_id]['name']}@{revision}:{sorted(MAPPINGS[model_id].items())}")
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()[:12]
+
+def load_models() -> Dict[str, Any]:
+    """Modelleri bir kez yükle, sürüm özetini hesapla ve ısındır (sonraki çağrılar beklemez)"""
+    global MODEL_VERSION
+    if MODEL_VERSION is not None:
+        return pipelines
+    with _models_lock:
+        if MODEL_VERSION is not None:
+            return pipelines
+        for model_id, model_info in MODELS.items():
+            try:
+                engine.load(model_id)
+                print(f"✅ {model_id} modeli yüklendi: {model_info['name']} ({MODEL_BACKEND})")
+            except Exception as e:
+                print(f"❌ {model_id} modeli yüklenemedi: {e}")
+        warm_up_models()
+        MODEL_VERSION = os.environ.get("SENTIMENT_MODEL_VERSION") or compute_model_version()
+    return pipelines
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Modeller ilk istekten önce, olay döngüsünü bloklamadan yüklenir
+    await run_in_threadpool(load_models)
+    yield
+
+# API başlat
+app = FastAPI(title="Türkçe Duygu Analizi API - Çoklu Model", version="2.0.0", lifespan=lifespan)
+
+# Static dosyaları serve et
+app.mount("/static", StaticFiles(directory="static"), name="static")
+
+class Comment(BaseModel):
+    text: str
+
+class Comments(BaseModel):
+    texts: List[str]
+
+# Nötr göstergeler (talep, öneri, rica) - daha geniş liste
+NEUTRAL_INDICATORS = [
+    'talep ediyoruz', 'istiyoruz', 'rica ediyoruz', 'açılmasını istiyoruz',
+    'bulunmak istiyoruz', 'teşekkür ederiz', 'hayırlı akşamlar', 'hayırlı günler',
+    'personel', 'lojman', 'mescit', 'kahve makinesi', 'dinlenme alanı',
+    'yönetim kurulu', 'sizden ricamız', 'açılmasını talep ediyoruz',
+    'eklenmesini istiyoruz', 'kurulmasını istiyoruz', 'yapılmasını istiyoruz',
+    'düzenlenmesini istiyoruz', 'iyileştirilmesini istiyoruz',
+    'olmasını istiyoruz', 'olmasını talep ediyoruz', 'olmasını rica ediyoruz',
+    'artırılmasını istiyoruz', 'azaltılmasını istiyoruz', 'değiştirilmesini istiyoruz',
+    'yemekhane', 'internet', 'çalışma saati', 'çalışma ortamı', 'sosyal alan',
+    'spor salonu', 'otopark', 'ulaşım', 'servis', 'yemek', 'çay', 'kahve',
+    'temizlik', 'güvenlik', 'bakım', 'onarım', 'yenileme', 'modernizasyon'
+]
+
+# Şikayet göstergeleri (gerçekten olumsuz olanlar)
+COMPLAINT_INDICATORS = [
+    'kötü', 'berbat', 'rezalet', 'çok kötü', 'hiç beğenmedim', 'beğenmedim',
+    'şikayet', 'memnun değilim', 'kızgınım', 'sinirliyim', 'üzgünüm',
+    'yetersiz', 'kötü kalite', 'düşük kalite', 'sorunlu', 'problemli',
+    'çalışmıyor', 'bozuk', 'arızalı', 'hatalı', 'yanlış', 'kırık',
+    'eski', 'kirli', 'pis', 'kötü kokuyor', 'gürültülü', 'sıcak', 'soğuk'
+]
+
+# Pozitif göstergeler
+POSITIVE_INDICATORS = [
+    'çok iyi', 'harika', 'mükemmel', 'süper', 'güzel', 'beğendim',
+    'memnun', 'teşekkür', 'başarılı', 'kaliteli', 'profesyonel',
+    'sorunsuz', 'tam istediğimiz gibi', 'çok güzel', 'çok başarılı'
+]
+
+def is_neutral_comment(text: str) -> bool:
+    """Nötr yorumları tespit et - özellikle iş yeri talepleri ve önerileri için"""
+    text_lower = text.lower()
+    
+    neutral_count = sum(1 for indicator in NEUTRAL_INDICATORS if indicator in text_lower)
+    complaint_count = sum(1 for indicator in COMPLAINT_INDICATORS if indicator in text_lower)
+    positive_count = sum(1 for indicator in POSITIVE_INDICATORS if indicator in text_lower)
+    
+    # Nötr yorum kriterleri - daha esnek:
+    # 1. Nötr göstergeler yeterli (2+)
+    # 2. Şikayet göstergeleri az (2'den az)
+    # 3. Pozitif göstergeler varsa da nötr olabilir (talep + pozitif = nötr)
+    if neutral_count >= 2 and complaint_count <= 1:
+        return True
+    
+    # Özel durum: "herşey çok iyi sorunsuz fakat" gibi yapılar
+    if 'fakat' in text_lower or 'ama' in text_lower or 'ancak' in text_lower:
+        if neutral_count >= 1:
+            return True
+    
+    # Özel durum: "istiyoruz", "talep ediyoruz" gibi direkt talepler
+    if any(word in text_lower for word in ['istiyoruz', 'talep ediyoruz', 'rica ediyoruz']):
+        if complaint_count == 0:
+            return True
+    
+    # Özel durum: Personel, lojman, yemekhane gibi iş yeri konuları
+    workplace_topics = ['personel', 'lojman', 'yemekhane', 'mescit', 'dinlenme', 'çalışma']
+    if any(topic in text_lower for topic in workplace_topics):
+        if neutral_count >= 1 and complaint_count <= 1:
+            return True
+    
+    return False
+
+def clean_text(text: str) -> str:
+    """Metni normalize et ve temizle"""
+    text = text.lower()
+    # Türkçe karakterleri koru, gereksiz işaretleri temizle
+    text = re.sub(r'[^\w\sçğıöşü]', '', text)
+    # Tekrar eden harfleri azalt (ör: aaa -> aa)
+    text = re.sub(r'(.)\1{2,}', r'\1\1', text)
+    # Fazla boşlukları temizle
+    text = re.sub(r'\s+', ' ', text).strip()
+    return text
+
+def analyze_with_model(text: str, model_id: str) -> Dict[str, Any]:
+    """Belirli bir model ile analiz"""
+    return analyze_with_model_batch([text], model_id)[0]
+
+def combine_model_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Çoklu model sonuçlarını birleştir"""
+    valid_results = [r for r in results if "error" not in r]
+    
+    if not valid_results:
+        return {"error": "Hiçbir model çalışmadı"}
+    
+    # Çoklu model sonuçlarını analiz et
+    sentiments = [r["sentiment"] for r in valid_results]
+    confidences = [r["confidence"] for r in valid_results]
+    
+    # En yüksek güven skoruna sahip sonucu al
+    best_result = max(valid_results, key=lambda x: x["confidence"])
+    
+    # Sonuçlar tutarlı mı kontrol et (tek model her zaman tutarlıdır)
+    unique_sentiments = set(sentiments)
+    is_consistent = len(unique_sentiments) == 1
+    
+    return {
+        "final_sentiment": best_result["sentiment"],
+        "final_confidence": best_result["confidence"],
+        "model_used": best_result["model_id"],
+        "consistency": is_consistent,
+        "all_results": valid_results,
+        "method": "multi_model"
+    }
+
+# Birleştirilmiş model sonuçları temizlenmiş metne göre önbelleklenir
+result_cache = LRUCache(int(os.environ.get("SENTIMENT_CACHE_SIZE", "4096")))
+
+# Aynı içerikli dosya yüklemelerinin sonuçları (anahtar: model sürümü, biçim, SHA-256)
+upload_cache = LRUCache(int(os.environ.get("SENTIMENT_UPLOAD_CACHE_SIZE", "32")))
+
+# Model başına canlı gecikme tahminleri (süre bütçesine göre yol seçimi için)
+latency = LatencyEstimator()
+
+# Aşama metrikleri (/metrics) - sık yolda yalnızca perf_counter ve sayaç artırma
+metrics_registry = Registry()
+STAGE_SECONDS = metrics_registry.histogram(
+    "sentiment_stage_seconds", "Motor aşaması süresi (analiz grubu başına)", ["stage"])
+MODEL_STAGE_SECONDS = metrics_registry.histogram(
+    "sentiment_model_stage_seconds", "Model başına tokenize/forward süresi (forward çağrısı başına)", ["model", "stage"])
+MODEL_BATCH_SIZE = metrics_registry.histogram(
+    "sentiment_model_batch_size", "Forward çağrısı başına yorum sayısı", ["model"], SIZE_BUCKETS)
+ENGINE_BATCH_SIZE = metrics_registry.histogram(
+    "sentiment_engine_batch_size", "Analiz grubu başına yorum sayısı", (), SIZE_BUCKETS)
+PATH_TOTAL = metrics_registry.counter(
+    "sentiment_comments_total", "Sonucu üreten yola göre analiz edilen yorumlar", ["path"])
+
+# Server-Timing başlığındaki adlar
+SERVER_TIMING_NAMES = {"rules": "rule", "clean_text": "normalize", "cache_lookup": "cache"}
+
+def observe_stage(stage: str, seconds: float) -> None:
+    """Aşama süresini histograma ve (açıksa) isteğin Server-Timing kaydına yaz"""
+    STAGE_SECONDS.observe(seconds, stage)
+    record_timing(SERVER_TIMING_NAMES.get(stage, stage), seconds)
+
+def observe_model_stage(model_id: str, stage: str, seconds: float) -> None:
+    MODEL_STAGE_SECONDS.observe(seconds, model_id, stage)
+    record_timing(f"{stage}-{model_id}", seconds)
+
+def observe_model_batch(model_id: str, tokenize_seconds: float, forward_seconds: float, size: int) -> None:
+    """Motorun her forward çağrısından sonra çağırdığı gözlemci"""
+    observe_model_stage(model_id, "tokenize", tokenize_seconds)
+    observe_model_stage(model_id, "forward", forward_seconds)
+    MODEL_BATCH_SIZE.observe(size, model_id)
+
+engine.on_batch = observe_model_batch
+
+# Süre bütçesi yetmediğinde kullanılan yollar ("yöntem" alanına yazılır)
+DEGRADED_CACHE = "önbellek"
+DEGRADED_SINGLE_MODEL = "bütçe_tek_model"
+DEGRADED_RULES = "bütçe_kural_tabanlı"
+DEGRADED_METHODS = {DEGRADED_CACHE, DEGRADED_SINGLE_MODEL, DEGRADED_RULES}
+
+def analyze_with_model_batch(texts: List[str], model_id: str) -> List[Dict[str, Any]]:
+    """Belirli bir model ile toplu analiz (motor batch_size'lık forward çağrıları yapar)
+
+    Hata veya eksik modelde her metin için {"error": ...} döner; böylece
+    combine_model_results diğer modellerle devam edebilir.
+    """
+    if model_id not in pipelines:
+        return [{"error": f"Model {model_id} bulunamadı"} for _ in texts]
+    try:
+        start_time = time.perf_counter()
+        predictions = engine.predict(texts, model_id)
+        latency.observe(model_id, time.perf_counter() - start_time, len(texts))
+    except Exception as e:
+        return [{"error": str(e)} for _ in texts]
+    return [prediction.to_dict() for prediction in predictions]
+
+def warm_up_models() -> None:
+    """Her modeli bir kez çalıştırıp gecikme tahminlerini başlat"""
+    for model_id in pipelines.keys():
+        analyze_with_model_batch(["Isınma için örnek bir yorum"], model_id)
+
+def rule_based_result(comment: str) -> Optional[Dict[str, Any]]:
+    """Kural tabanlı sonuç - model gerekiyorsa None"""
+    if is_neutral_comment(comment):
+        return {
+            "yorum": comment,
+            "analiz": "Nötr",
+            "güven": 0.95,
+            "yöntem": "kural_tabanlı",
+            "açıklama": "Talep, öneri veya rica içeren yorum",
+            "model_sonuçları": None
+        }
+    
+    if len(comment.strip()) < 2 or len(clean_text(comment).split()) < 2:
+        return {
+            "yorum": comment,
+            "analiz": "Geçersiz / Yetersiz Yorum",
+            "güven": 0.0,
+            "yöntem": "kural_tabanlı",
+            "model_sonuçları": None
+        }
+    return None
+
+def model_based_result(comment: str, combined_result: Dict[str, Any]) -> Dict[str, Any]:
+    """Birleştirilmiş model sonucundan yanıt oluştur"""
+    final_sentiment = combined_result["final_sentiment"]
+    final_confidence = combined_result["final_confidence"]
+    
+    # Model sonucunu kontrol et - eğer çok yüksek güvenle yanlış sınıflandırıyorsa
+    if final_confidence > 0.9 and final_sentiment == "Olumsuz":
+        if is_neutral_comment(comment):
+            return {
+                "yorum": comment,
+                "analiz": "Nötr",
+                "güven": 0.90,
+                "yöntem": "hibrit_düzeltme",
+                "açıklama": "Model yanlış sınıflandırdı, kural tabanlı düzeltme uygulandı",
+                "model_sonuçları": combined_result
+            }
+    
+    return {
+        "yorum": comment,
+        "analiz": final_sentiment,
+        "güven": round(final_confidence, 3),
+        "yöntem": combined_result["method"],
+        "model_sonuçları": combined_result
+    }
+
+def lexicon_result(comment: str) -> Dict[str, Any]:
+    """Model çalıştırılamadığında gösterge kelimelerden kaba sonuç"""
+    text_lower = comment.lower()
+    complaint_count = sum(1 for indicator in COMPLAINT_INDICATORS if indicator in text_lower)
+    positive_count = sum(1 for indicator in POSITIVE_INDICATORS if indicator in text_lower)
+    
+    if positive_count > complaint_count:
+        sentiment = "Olumlu"
+    elif complaint_count > positive_count:
+        sentiment = "Olumsuz"
+    else:
+        sentiment = "Nötr"
+    return {
+        "yorum": comment,
+        "analiz": sentiment,
+        "güven": 0.6 if sentiment != "Nötr" else 0.5,
+        "yöntem": DEGRADED_RULES,
+        "açıklama": "Süre bütçesi model için yetmedi, gösterge kelimelerle tahmin edildi",
+        "model_sonuçları": None
+    }
+
+def plan_models(count: int, deadline: Optional[float]) -> tuple:
+    """Süre bütçesine sığan yolu seç - (model_id listesi, modele gidecek yorum sayısı)"""
+    model_ids = list(load_models().keys())
+    if deadline is None or not model_ids:
+        return model_ids, count
+    
+    remaining = deadline - time.perf_counter()
+    # Bütçe bitmişse tahmine bakılmaz; tüm yorumlar kurallarla tahmin edilir
+    if remaining <= 0:
+        return [], 0
+    # Henüz ölçüm yoksa iyimser davranılır; ilk çağrı tahmini oluşturur
+    ensemble = sum(latency.estimate(model_id, count) or 0.0 for model_id in model_ids)
+    if ensemble <= remaining:
+        return model_ids, count
+    
+    per_item, fastest = min((latency.estimate(model_id) or 0.0, model_id) for model_id in model_ids)
+    if per_item <= 0:
+        return [fastest], count
+    # En hızlı model bütçeye sığdığı kadar yorumu işler, kalanlar kurallarla tahmin edilir
+    return [fastest], max(0, min(count, int(remaining / per_item)))
+
+def analyze_comments_batch(comments: List[str], deadline: Optional[float] = None) -> List[Dict[str, Any]]:
+    """Yorum grubunu analiz et - kurala takılmayanlar her modele tek seferde verilir
+
+    deadline: time.perf_counter() cinsinden son an. Verilirse önbellek, kurallar,
+    en hızlı tek model ve tüm modeller arasından bütçeye sığan yol seçilir.
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(comments)
+    ENGINE_BATCH_SIZE.observe(len(comments))
+    
+    # 1. Önce kural tabanlı kontrol
+    stage_start = time.perf_counter()
+    pending = []
+    for index, comment in enumerate(comments):
+        results[index] = rule_based_result(comment)
+        if results[index] is None:
+            pending.append(index)
+    stage_end = time.perf_counter()
+    observe_stage("rules", stage_end - stage_start)
+    if len(pending) < len(comments):
+        PATH_TOTAL.inc("rule", amount=len(comments) - len(pending))
+    
+    if not pending:
+        return results
+    
+    # 2. Önbellekte olmayanlar için çoklu model analizi - her model tüm grubu batch halinde işler
+    cleaned = {index: clean_text(comments[index]) for index in pending}
+    stage_start, stage_end = stage_end, time.perf_counter()
+    observe_stage("clean_text", stage_end - stage_start)
+    
+    combined: Dict[str, Dict[str, Any]] = {}
+    cached_texts = set()
+    for index in pending:
+        cached = result_cache.get(cleaned[index])
+        if cached is not None:
+            combined[cleaned[index]] = cached
+            cached_texts.add(cleaned[index])
+    misses = list(dict.fromkeys(text for text in cleaned.values() if text not in combined))
+    observe_stage("cache_lookup", time.perf_counter() - stage_end)
+    
+    degraded = None
+    if misses:
+        model_ids, fit = plan_models(len(misses), deadline)
+        if len(model_ids) < len(pipelines):
+            degraded = DEGRADED_SINGLE_MODEL
+        model_texts = misses[:fit]
+        per_model = [analyze_with_model_batch(model_texts, model_id) for model_id in model_ids] if model_texts else []
+        
+        # 3. Model sonuçlarını birleştir
+        stage_start = time.perf_counter()
+        for position, text in enumerate(model_texts):
+            combined_result = combine_model_results([outputs[position] for outputs in per_model])
+            if "error" in combined_result:
+                raise HTTPException(status_code=500, detail=f"Analiz hatası: {combined_result['error']}")
+            combined[text] = combined_result
+            # Tek modelle bulunan sonuç önbelleğe girmez (tam analiz yerine sunulmasın)
+            if degraded is None:
+                result_cache.put(text, combined_result)
+        observe_stage("combine", time.perf_counter() - stage_start)
+    
+    paths: Dict[str, int] = {}
+    for index in pending:
+        text = cleaned[index]
+        if text not in combined:
+            results[index] = lexicon_result(comments[index])
+            paths["lexicon"] = paths.get("lexicon", 0) + 1
+            continue
+        path = "cache" if text in cached_texts else ("single_model" if degraded else "model")
+        paths[path] = paths.get(path, 0) + 1
+        result = model_based_result(comments[index], combined[text])
+        if deadline is not None and result["yöntem"] == combined[text]["method"]:
+            if text in cached_texts:
+                result["yöntem"] = DEGRADED_CACHE
+            elif degraded:
+                result["yöntem"] = degraded
+        results[index] = result
+    for path, count in paths.items():
+        PATH_TOTAL.inc(path, amount=count)
+    return results
+
+def analyze_comment(comment: str, deadline: Optional[float] = None) -> Dict[str, Any]:
+    """Tek yorum analizi - gelişmiş hibrit yaklaşım"""
+    if not comment or len(comment.strip()) < 2:
+        raise HTTPException(status_code=400, detail="Yorum çok kısa veya boş")
+    
+    return analyze_comments_batch([comment], deadline)[0]
+
+def analyze_comments(comments: List[str], deadline: Optional[float] = None) -> List[Dict[str, Any]]:
+    """Toplu yorum analizi"""
+    if not comments:
+        return []
+    
+    # Boş yorumları filtrele
+    valid_comments = [c.strip() for c in comments if c.strip()]
+    if not valid_comments:
+        return []
+    
+    try:
+        outputs = []
+        for start in range(0, len(valid_comments), INFERENCE_BATCH_SIZE):
+            outputs.extend(analyze_comments_batch(valid_comments[start:start + INFERENCE_BATCH_SIZE], deadline))
+        return outputs
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Toplu analiz hatası: {str(e)}")
+
+def deadline_from_ms(deadline_ms: Optional[int]) -> Optional[float]:
+    """İstek anından itibaren milisaniye bütçesini mutlak son ana çevir"""
+    if deadline_ms is None:
+        return None
+    if deadline_ms <= 0:
+        raise HTTPException(status_code=400, detail="deadline_ms pozitif olmalı")
+    return time.perf_counter() + deadline_ms / 1000
+
+# Kabul kontrolü: çıkarım aşamasına sınırlı kuyruk ve eşzamanlılık sınırı ile girilir.
+# Bekleyenler şeritler arasında ağırlıklı adil sırayla (WFQ) çalışır.
+admission = AdmissionController(
+    max_concurrency=int(os.environ.get("SENTIMENT_MAX_CONCURRENCY", "2")),
+    max_queue=int(os.environ.get("SENTIMENT_MAX_QUEUE", "64")),
+    lane_weights=parse_lane_weights(os.environ.get("SENTIMENT_LANE_WEIGHTS", ""))
+)
+
+def request_tenant(connection) -> Optional[str]:
+    """X-API-Key başlığından kiracı kimliği (anahtarın kendisi metriklere yazılmaz)"""
+    api_key = connection.headers.get("x-api-key")
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:8] if api_key else None
+
+async def run_admitted(func, *args, cost: int = 1, lane: str = "interactive",
+                       request: Optional[Request] = None, tenant: Optional[str] = None,
+                       bounded: bool = True):
+    """Çıkarımı kabul kontrolünden geçirerek çalıştır (kuyruk doluysa 429)"""
+    if tenant is None and request is not None:
+        tenant = request_tenant(request)
+    try:
+        return await admission.run(
+            func, *args, cost=cost, lane=lane, tenant=tenant, bounded=bounded,
+            is_disconnected=request.is_disconnected if request is not None else None
+        )
+    except Overloaded as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+    except ClientDisconnected:
+        raise HTTPException(status_code=499, detail="İstemci bağlantıyı kapattı")
+
+async def analyze_sliced(comments: List[str], deadline: Optional[float] = None,
+                         request: Optional[Request] = None, lane: str = "batch") -> List[Dict[str, Any]]:
+    """Toplu analizi INFERENCE_BATCH_SIZE'lık dilimler halinde sıraya koy
+
+    Her dilim ayrı kabul edilir; böylece büyük girdiler etkileşimli isteklerle
+    araya girerek işlenir. Kuyruk sınırı yalnızca ilk dilimde uygulanır.
+    """
+    valid_comments = [c.strip() for c in comments if c.strip()]
+    outputs = []
+    try:
+        for start in range(0, len(valid_comments), INFERENCE_BATCH_SIZE):
+            chunk = valid_comments[start:start + INFERENCE_BATCH_SIZE]
+            outputs.extend(await run_admitted(
+                analyze_comments_batch, chunk, deadline, cost=len(chunk),
+                lane=lane, request=request, bounded=start == 0
+            ))
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Toplu analiz hatası: {str(e)}")
+    return outputs
+
+def analyze_in_background(comments: List[str]) -> List[Dict[str, Any]]:
+    """Arka plan işleri için analiz - background şeridinde sırasını bekler"""
+    return admission.run_sync(analyze_comments_batch, comments, cost=len(comments), lane="background")
+
+def parse_csv_file(file_content: bytes) -> List[str]:
+    """CSV dosyasından yorumları oku"""
+    try:
+        content = file_content.decode('utf-8')
+        csv_reader = csv.reader(io.StringIO(content))
+        comments = []
+        for row in csv_reader:
+            if row and row[0].strip():
+                comments.append(row[0].strip())
+        return comments
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"CSV okuma hatası: {str(e)}")
+
+def parse_txt_file(file_content: bytes) -> List[str]:
+    """TXT dosyasından yorumları oku"""
+    try:
+        content = file_content.decode('utf-8')
+        lines = [line.strip() for line in content.splitlines() if line.strip()]
+        return lines
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"TXT okuma hatası: {str(e)}")
+
+# Veritabanı: değişmez ID'li, eklenmeye açık yorum deposu
+import json
+import os
+from datetime import datetime
+from comment_store import CommentStore, normalize_timestamp
+from search_index import SearchIndex
+from store_aggregates import StoreAggregates
+from upload_stream import UploadCommentStream, UploadFormatError
+from columnar_export import arrow_stream, parquet_stream, require_pyarrow
+from jobs import JobManager, JobNotFound
+
+# Veritabanı dosyaları (eski tek-parça JSON ilk açılışta içe aktarılır)
+DB_FILE = "sentiment_database.json"
+DB_LOG_FILE = "sentiment_database.jsonl"
+
+comment_store = CommentStore(DB_LOG_FILE, legacy_path=DB_FILE)
+comment_store.start_compaction()
+
+# Tam metin arama indeksi: ekleme/silme ile artımlı güncellenir,
+# mevcut yorumlar arka planda indekslenir
+search_index = SearchIndex()
+comment_store.add_listener(search_index.add_document, search_index.remove_document)
+threading.Thread(
+    target=search_index.build, args=(comment_store.iter_comments(),),
+    name="search-index-build", daemon=True
+).start()
+
+# /statistics/summary için artımlı özet: mevcut yorumlar kayıt sırasında bir kez işlenir
+store_aggregates = StoreAggregates(comment_store.iter_comments)
+comment_store.add_listener(store_aggregates.add_comment, store_aggregates.remove_comment, replay=True)
+
+def add_comment_to_database(comment_data):
+    """Yorumu veritabanına ekle"""
+    comment_entry = {
+        "text": comment_data["yorum"],
+        "sentiment": comment_data["analiz"],
+        "confidence": comment_data["güven"],
+        "method": comment_data.get("yöntem", "bilinmiyor"),
+        "timestamp": datetime.now().isoformat(),
+        "model_results": comment_data.get("model_sonuçları", None)
+    }
+    start_time = time.perf_counter()
+    comment_id = comment_store.add(comment_entry)
+    observe_stage("persist", time.perf_counter() - start_time)
+    return comment_id
+
+@app.get("/", response_class=HTMLResponse)
+async def read_root():
+    """Ana sayfa - HTML arayüzünü serve et"""
+    try:
+        html_path = os.path.join("static", "index.html")
+        if os.path.exists(html_path):
+            with open(html_path, "r", encoding="utf-8") as f:
+                return HTMLResponse(content=f.read())
+        else:
+            # HTML dosyası bulunamadıysa basit bir sayfa döndür
+            return HTMLResponse(content="""
+            <!DOCTYPE html>
+            <html lang="tr">
+            <head>
+                <meta charset="UTF-8">
+                <title>Türkçe Duygu Analizi - Çoklu Model</title>
+                <style>
+                    body { font-family: Arial, sans-serif; margin: 40px; }
+                    .container { max-width: 800px; margin: 0 auto; }
+                    .endpoint { background: #f5f5f5; padding: 15px; margin: 10px 0; border-radius: 5px; }
+                    .method { font-weight: bold; color: #007bff; }
+                    .model-info { background: #e8f4fd; padding: 15px; margin: 10px 0; border-radius: 5px; }
+                </style>
+            </head>
+            <body>
+                <div class="container">
+                    <h1>🎭 Türkçe Duygu Analizi API - Çoklu Model</h1>
+                    <p>API çalışıyor! Kullanılabilir endpoint'ler:</p>
+                    
+                    <div class="model-info">
+                        <h3>🤖 Yüklü Modeller</h3>
+                        <ul>
+                            <li><strong>savasy</strong>: Türkçe sentiment için özel eğitilmiş</li>
+                            <li><strong>dbmdz</strong>: Genel Türkçe BERT modeli</li>
+                        </ul>
+                    </div>
+                    
+                    <div class="endpoint">
+                        <span class="method">GET</span> <code>/</code> - Bu sayfa
+                    </div>
+                    
+                    <div class="endpoint">
+                        <span class="method">POST</span> <code>/analyze</code> - Tek yorum analizi
+                    </div>
+                    
+                    <div class="endpoint">
+                        <span class="method">POST</span> <code>/analyze-batch</code> - Toplu yorum analizi (JSON)
+                    </div>
+                    
+                    <div class="endpoint">
+                        <span class="method">POST</span> <code>/upload</code> - Dosya yükleme ve analiz
+                    </div>
+                    
+                    <div class="endpoint">
+                        <span class="method">GET</span> <code>/health</code> - Sağlık kontrolü
+                    </div>
+                    
+                    <div class="endpoint">
+                        <span class="method">GET</span> <code>/docs</code> - Swagger dokümantasyonu
+                    </div>
+                    
+                    <h3>📝 Örnek Kullanım</h3>
+                    <p><strong>Tek yorum analizi:</strong></p>
+                    <pre>curl -X POST "http://localhost:8000/analyze" \
+     -H "Content-Type: application/json" \
+     -d '{"text": "Bu ürün harika!"}'</pre>
+                    
+                    <p><strong>Dosya yükleme:</strong></p>
+                    <pre>curl -X POST "http://localhost:8000/upload" \
+     -F "file=@ornek_yorumlar.txt"</pre>
+                </div>
+            </body>
+            </html>
+            """)
+    except Exception as e:
+        return HTMLResponse(content=f"""
+        <html>
+            <head><title>Hata</title></head>
+            <body><h1>Hata oluştu: {str(e)}</h1></body>
+        </html>
+        """)
+
+@app.post("/analyze")
+async def analyze_single(comment: Comment, request: Request, deadline_ms: Optional[int] = None):
+    """Tek yorum analizi - gelişmiş hibrit yaklaşım
+
+    deadline_ms verilirse bütçeye sığan en iyi yol seçilir (önbellek, kurallar,
+    en hızlı model, tüm modeller); seçilen yol "yöntem" alanında görünür.
+    """
+    deadline = deadline_from_ms(deadline_ms)
+    if not comment.text or len(comment.text.strip()) < 2:
+        raise HTTPException(status_code=400, detail="Yorum çok kısa veya boş")
+    
+    try:
+        result = await run_admitted(analyze_comment, comment.text, deadline, request=request)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Analiz hatası: {str(e)}")
+    
+    # Yorumu veritabanına ekle
+    try:
+        comment_id = add_comment_to_database(result)
+        result["comment_id"] = comment_id
+    except Exception as e:
+        print(f"Veritabanı hatası: {e}")
+        result["comment_id"] = None
+    
+    return result
+
+@app.post("/analyze-batch")
+async def analyze_batch(payload: Comments, request: Request, deadline_ms: Optional[int] = None):
+    """JSON ile toplu yorum analizi"""
+    deadline = deadline_from_ms(deadline_ms)
+    return await analyze_sliced(payload.texts, deadline, request)
+
+@app.post("/upload")
+async def upload_file(request: Request, file: UploadFile = File(...), deadline_ms: Optional[int] = None):
+    """Dosya yükleme ve analiz"""
+    deadline = deadline_from_ms(deadline_ms)
+    if not file.filename:
+        raise HTTPException(status_code=400, detail="Dosya adı bulunamadı")
+    
+    # Dosya boyutu kontrolü (5MB)
+    if file.size and file.size > 5 * 1024 * 1024:
+        raise HTTPException(status_code=400, detail="Dosya çok büyük (max 5MB)")
+    
+    try:
+        content = await file.read()
+        
+        if file.filename.lower().endswith('.csv'):
+            parse = parse_csv_file
+        elif file.filename.lower().endswith('.txt'):
+            parse = parse_txt_file
+        else:
+            raise HTTPException(status_code=400, detail="Sadece .csv ve .txt dosyaları desteklenir")
+        
+        # Aynı içerik aynı model sürümüyle daha önce analiz edildiyse motor çalıştırılmaz
+        content_hash = hashlib.sha256(content).hexdigest()
+        if MODEL_VERSION is None:
+            await run_in_threadpool(load_models)
+        cache_key = (MODEL_VERSION, parse.__name__, content_hash)
+        cached = upload_cache.get(cache_key)
+        if cached is not None:
+            return {
+                "dosya_adi": file.filename,
+                "yorum_sayisi": cached["yorum_sayisi"],
+                "sonuclar": cached["sonuclar"],
+                "icerik_ozeti": content_hash,
+                "onbellekten": True
+            }
+        
+        comments = parse(content)
+        if not comments:
+            raise HTTPException(status_code=400, detail="Dosyada geçerli yorum bulunamadı")
+        
+        results = await analyze_sliced(comments, deadline, request)
+        # Süre bütçesi yüzünden kısaltılmış sonuçlar sonraki yüklemelere sunulmaz
+        if not any(result["yöntem"] in DEGRADED_METHODS for result in results):
+            upload_cache.put(cache_key, {"yorum_sayisi": len(comments), "sonuclar": results})
+        return {
+            "dosya_adi": file.filename,
+            "yorum_sayisi": len(comments),
+            "sonuclar": results,
+            "icerik_ozeti": content_hash,
+            "onbellekten": False
+        }
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Dosya işleme hatası: {str(e)}")
+
+# Akış halinde yükleme: dosya geldikçe çözümlenir, sonuçlar NDJSON olarak akar
+STREAM_QUEUE_BATCHES = 4
+
+class BodyStreamingResponse(StreamingResponse):
+    """İstek gövdesi okunmaya devam ederken yanıtı akıtan StreamingResponse
+
+    Standart StreamingResponse bağlantı kopmasını receive() ile dinler ve bu
+    gövde mesajlarını tüketir; burada gövdeyi endpoint okuduğu için dinlenmez.
+    """
+    async def __call__(self, scope, receive, send):
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+@app.post("/upload/stream")
+async def upload_stream(request: Request, format: Optional[str] = None, filename: Optional[str] = None):
+    """Dosyayı parça parça analiz et, sonuçları NDJSON olarak akıt (boyut sınırı yok)
+
+    Gövde ham dosya (text/plain, text/csv) veya multipart/form-data olabilir.
+    """
+    # Yoğunlukta gövde okunmadan reddet; kabul edilen akışın grupları sonra kuyruk sınırına takılmaz
+    tenant = request_tenant(request)
+    try:
+        admission.check("batch", tenant)
+    except Overloaded as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+    
+    content_type = request.headers.get("content-type", "")
+    try:
+        source = UploadCommentStream(request.stream(), content_type, format, filename)
+        await source.start()
+    except UploadFormatError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_QUEUE_BATCHES)
+    
+    async def produce():
+        """Gövdeyi okuyup yorum gruplarını kuyruğa koy (kuyruk doluysa okuma bekler)"""
+        try:
+            batch = []
+            async for comment in source.comments():
+                batch.append(comment)
+                if len(batch) >= INFERENCE_BATCH_SIZE:
+                    await queue.put(batch)
+                    batch = []
+            if batch:
+                await queue.put(batch)
+            await queue.put(None)
+        except Exception as e:
+            await queue.put(e)
+    
+    async def results():
+        producer = asyncio.create_task(produce())
+        count = 0
+        start_time = time.time()
+        try:
+            while True:
+                batch = await queue.get()
+                if batch is None:
+                    break
+                if isinstance(batch, Exception):
+                    yield json.dumps({"hata": f"Dosya okuma hatası: {str(batch)}"}, ensure_ascii=False) + "\n"
+                    return
+                try:
+                    outputs = await run_admitted(analyze_comments_batch, batch, cost=len(batch), lane="batch",
+                                                 tenant=tenant, bounded=False)
+                except HTTPException as e:
+                    yield json.dumps({"hata": e.detail}, ensure_ascii=False) + "\n"
+                    return
+                lines = []
+                for output in outputs:
+                    count += 1
+                    lines.append(json.dumps(dict(output, sira=count), ensure_ascii=False) + "\n")
+                yield "".join(lines)
+            
+            yield json.dumps({
+                "dosya_adi": source.filename,
+                "yorum_sayisi": count,
+                "okunan_bayt": source.bytes_read,
+                "sure": round(time.time() - start_time, 2),
+                "tamamlandi": True
+            }, ensure_ascii=False) + "\n"
+        finally:
+            producer.cancel()
+    
+    return BodyStreamingResponse(results(), media_type="application/x-ndjson")
+
+# Gerçek zamanlı analiz: yazarken gönderilen metinler için WebSocket kanalı.
+# Sonuçlar veritabanına kaydedilmez; her bağlantıda yalnızca en son metin işlenir.
+@app.websocket("/ws/analyze")
+async def realtime_analysis(websocket: WebSocket):
+    """Mesaj: {"id": 1, "text": "...", "deadline_ms": 50} - yanıt: {"id": 1, ...analiz sonucu}
+
+    Model çalışırken gelen yeni metinler öncekileri geçersiz kılar: ara metinler
+    hiç çalıştırılmaz, eskimiş sonuçlar gönderilmez (ama önbelleğe girer).
+    """
+    await websocket.accept()
+    tenant = request_tenant(websocket)
+    latest: Dict[str, Any] = {"id": None, "text": None, "deadline": None}
+    pending = asyncio.Event()
+    
+    async def send(payload: Dict[str, Any]):
+        try:
+            await websocket.send_json(payload)
+        except (WebSocketDisconnect, RuntimeError):
+            pass
+    
+    async def worker():
+        while True:
+            await pending.wait()
+            pending.clear()
+            request_id, text, deadline = latest["id"], latest["text"], latest["deadline"]
+            try:
+                result = await run_admitted(analyze_comment, text, deadline, tenant=tenant)
+            except HTTPException as e:
+                result = {"hata": e.detail}
+                if e.status_code == 429:
+                    result["retry_after"] = int(e.headers["Retry-After"])
+            except Exception as e:
+                # Model veya kabul hatası bağlantıdaki sonraki istekleri durdurmasın
+                print(f"❌ WebSocket analiz hatası: {e!r}")
+                result = {"hata": f"Analiz hatası: {str(e)}"}
+            if latest["id"] != request_id:
+                continue  # daha yeni bir metin geldi, bu sonuç eskidi
+            await send(dict(result, id=request_id))
+    
+    task = asyncio.create_task(worker())
+    counter = 0
+    try:
+        while True:
+            raw = await websocket.receive_text()
+            counter += 1
+            try:
+                message = json.loads(raw)
+            except ValueError:
+                message = {"text": raw}  # düz metin de kabul edilir
+            if not isinstance(message, dict):
+                message = {}
+            text = message.get("text")
+            request_id = message.get("id", counter)
+            if not isinstance(text, str) or len(text.strip()) < 2:
+                latest["id"] = request_id  # bekleyen eski sonucu da geçersiz kıl
+                await send({"id": request_id, "hata": "Yorum çok kısa veya boş"})
+                continue
+            deadline_ms = message.get("deadline_ms")
+            deadline = time.perf_counter() + deadline_ms / 1000 if isinstance(deadline_ms, (int, float)) and deadline_ms > 0 else None
+            latest["id"], latest["text"], latest["deadline"] = request_id, text.strip(), deadline
+            pending.set()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        # Görev beklenmedik biçimde bittiyse hatası kaybolmasın
+        if task.done() and not task.cancelled() and task.exception() is not None:
+            print(f"❌ WebSocket analiz görevi durdu: {task.exception()!r}")
+        task.cancel()
+
+@app.get("/health")
+async def health_check():
+    """Sağlık kontrolü"""
+    return {
+        "status": "healthy", 
+        "backend": MODEL_BACKEND,
+        "model_version": MODEL_VERSION,
+        "models": {model_id: {"name": info["name"], "status": "loaded"} for model_id, info in MODELS.items()},
+        "pipelines": list(pipelines.keys()),
+        "cache": result_cache.stats(),
+        "upload_cache": upload_cache.stats(),
+        "admission": admission.stats(),
+        "latency_ms_per_comment": latency.stats()
+    }
+
+@app.get("/statistics")
+async def get_statistics():
+    """Güncel istatistikleri getir"""
+    try:
+        return {
+            "status": "success",
+            "data": comment_store.statistics,
+            "last_updated": comment_store.last_updated,
+            "total_comments": len(comment_store)
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"İstatistik hatası: {str(e)}")
+
+# Özetin ETag'i: süreç yeniden başlarsa sürüm sayacı sıfırlansa da etiket değişir
+SUMMARY_ETAG_PREFIX = hashlib.sha256(f"{os.getpid()}-{time.time()}".encode("utf-8")).hexdigest()[:8]
+
+@app.get("/statistics/summary")
+async def get_statistics_summary(request: Request):
+    """Rapor araçlarının istatistikleri (dağılımlar, güven, tutarlılık, uzunluk kovaları)
+
+    Depo olaylarıyla artımlı tutulan toplamlardan üretilir ve depo değişene
+    kadar önbellekte kalır; If-None-Match ile değişmediyse 304 döner.
+    """
+    try:
+        summary = store_aggregates.summary()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"İstatistik hatası: {str(e)}")
+    etag = f'"{SUMMARY_ETAG_PREFIX}-{summary["surum"]}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    content = json.dumps({
+        "status": "success",
+        "data": summary,
+        "last_updated": comment_store.last_updated
+    }, ensure_ascii=False)
+    return Response(content=content, media_type="application/json", headers={"ETag": etag})
+
+@app.get("/comments")
+async def get_comments(limit: int = 50, offset: int = 0, sentiment: Optional[str] = None,
+                       method: Optional[str] = None, since: Optional[str] = None,
+                       until: Optional[str] = None):
+    """Yorumları getir (sentiment, yöntem ve tarih aralığına göre filtrelenebilir)"""
+    try:
+        comments, total = comment_store.query(limit, offset, sentiment, method, since, until)
+        return {
+            "status": "success",
+            "data": comments,
+            "total": total,
+            "limit": limit,
+            "offset": offset
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Geçersiz tarih filtresi: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Yorum getirme hatası: {str(e)}")
+
+@app.get("/comments/search")
+async def search_comments(q: str, limit: int = 20, offset: int = 0, sentiment: Optional[str] = None,
+                          since: Optional[str] = None, until: Optional[str] = None):
+    """Yorum metinlerinde tam metin arama (terim, önek* ve "ifade" sorguları)"""
+    if not q.strip():
+        raise HTTPException(status_code=400, detail="Arama sorgusu boş")
+    
+    try:
+        start_time = time.perf_counter()
+        id_range = comment_store.id_range(since, until) if since or until else None
+        
+        # Sentiment filtresi deponun sentiment indeksiyle kesiştirilir
+        restrict_ids = comment_store.indexed_ids("sentiment", sentiment) if sentiment is not None else None
+        hits, total = search_index.search(q, limit, offset, restrict_ids, id_range)
+        data = []
+        for comment_id, score in hits:
+            # Arama ile getirme arasında silinen yorum atlanır
+            comment = comment_store.get(comment_id)
+            if comment is not None:
+                data.append(dict(comment, score=score))
+        return {
+            "status": "success",
+            "query": q,
+            "data": data,
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+            "index_ready": search_index.ready,
+            "took_ms": round((time.perf_counter() - start_time) * 1000, 2)
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Geçersiz tarih filtresi: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Arama hatası: {str(e)}")
+
+@app.get("/comments/{comment_id}")
+async def get_comment(comment_id: int):
+    """Belirli bir yorumu getir"""
+    try:
+        comment = comment_store.get(comment_id)
+        if comment is None:
+            raise HTTPException(status_code=404, detail="Yorum bulunamadı")
+        
+        return {
+            "status": "success",
+            "data": comment
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Yorum getirme hatası: {str(e)}")
+
+@app.delete("/comments/{comment_id}")
+async def delete_comment(comment_id: int):
+    """Yorumu sil (ID'ler değişmez, silinen satır sıkıştırmada temizlenir)"""
+    try:
+        deleted_comment = comment_store.delete(comment_id)
+        if deleted_comment is None:
+            raise HTTPException(status_code=404, detail="Yorum bulunamadı")
+        
+        return {
+            "status": "success",
+            "message": "Yorum başarıyla silindi",
+            "deleted_comment": deleted_comment
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Yorum silme hatası: {str(e)}")
+
+@app.delete("/comments")
+async def delete_comments(sentiment: Optional[str] = None, method: Optional[str] = None,
+                          since: Optional[str] = None, until: Optional[str] = None):
+    """Filtreye uyan yorumları toplu sil"""
+    if sentiment is None and method is None and not since and not until:
+        raise HTTPException(status_code=400, detail="Toplu silme için en az bir filtre gerekli")
+    
+    try:
+        deleted_ids = comment_store.delete_where(sentiment, method, since, until)
+        return {
+            "status": "success",
+            "message": f"{len(deleted_ids)} yorum silindi",
+            "deleted_ids": deleted_ids
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Geçersiz tarih filtresi: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Toplu silme hatası: {str(e)}")
+
+@app.post("/analyze-bulk")
+async def analyze_bulk_comments(comments: List[str], request: Request, deadline_ms: Optional[int] = None):
+    """Toplu yorum analizi"""
+    deadline = deadline_from_ms(deadline_ms)
+    if not comments or len(comments) == 0:
+        raise HTTPException(status_code=400, detail="Yorum listesi boş")
+    
+    if len(comments) > 100:
+        raise HTTPException(status_code=400, detail="Maksimum 100 yorum analiz edilebilir")
+    
+    start_time = time.time()
+    results = await analyze_sliced(comments, deadline, request)
+    
+    for result in results:
+        try:
+            result["comment_id"] = add_comment_to_database(result)
+        except Exception as e:
+            print(f"Veritabanı hatası: {e}")
+            result["comment_id"] = None
+    
+    end_time = time.time()
+    processing_time = end_time - start_time
+    
+    return {
+        "status": "success",
+        "message": f"{len(comments)} yorum analiz edildi",
+        "results": results,
+        "processing_time": round(processing_time, 2),
+        "average_time_per_comment": round(processing_time / len(comments), 3)
+    }
+
+# Asenkron analiz işleri: büyük girdiler arka planda, kontrol noktalarıyla işlenir
+JOBS_DIR = os.environ.get("SENTIMENT_JOBS_DIR", "jobs")
+JOB_WORKERS = int(os.environ.get("SENTIMENT_JOB_WORKERS", "1"))
+
+job_manager = JobManager(JOBS_DIR, analyze_in_background, persist=add_comment_to_database,
+                         workers=JOB_WORKERS, batch_size=INFERENCE_BATCH_SIZE)
+job_manager.start()
+
+@app.post("/jobs", status_code=202)
+async def create_job(request: Request, format: Optional[str] = None, filename: Optional[str] = None,
+                     persist: bool = False):
+    """Analiz işi oluştur ve iş ID'sini hemen döndür
+
+    Gövde JSON ({"texts": [...], "persist": false} veya düz liste), ham dosya
+    (text/plain, text/csv) ya da multipart/form-data olabilir. Dosya belleğe
+    alınmadan diske yazılır.
+    """
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith("application/json"):
+        try:
+            payload = await request.json()
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Geçersiz JSON")
+        if isinstance(payload, dict):
+            texts = payload.get("texts")
+            persist = bool(payload.get("persist", persist))
+        else:
+            texts = payload
+        if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+            raise HTTPException(status_code=400, detail="Yorum listesi (texts) bekleniyor")
+        job_id = await run_in_threadpool(job_manager.create_from_texts, texts, persist)
+    else:
+        try:
+            source = UploadCommentStream(request.stream(), content_type, format, filename)
+            await source.start()
+        except UploadFormatError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        job_id = job_manager.create_job(filename=source.filename, persist=persist)
+        total = 0
+        try:
+            with job_manager.open_input(job_id) as f:
+                async for comment in source.comments():
+                    f.write(json.dumps(comment, ensure_ascii=False) + "\n")
+                    total += 1
+        except Exception as e:
+            job_manager.fail(job_id, f"Dosya okuma hatası: {str(e)}")
+            raise HTTPException(status_code=400, detail=f"Dosya okuma hatası: {str(e)}")
+        job_manager.submit(job_id, total)
+    
+    return job_manager.status(job_id)
+
+@app.get("/jobs")
+async def list_jobs():
+    """Tüm işleri listele"""
+    return {"jobs": job_manager.list_jobs()}
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """İş durumu, ilerleme ve işlem hızı"""
+    try:
+        return job_manager.status(job_id)
+    except JobNotFound:
+        raise HTTPException(status_code=404, detail="İş bulunamadı")
+
+@app.get("/jobs/{job_id}/results")
+async def get_job_results(job_id: str, offset: int = 0, limit: int = 100):
+    """Tamamlanmış (kontrol noktasına yazılmış) sonuçlardan bir sayfa"""
+    if offset < 0 or not 1 <= limit <= 1000:
+        raise HTTPException(status_code=400, detail="offset >= 0 ve 1 <= limit <= 1000 olmalı")
+    try:
+        status = job_manager.status(job_id)
+        results = await run_in_threadpool(job_manager.results, job_id, offset, limit)
+    except JobNotFound:
+        raise HTTPException(status_code=404, detail="İş bulunamadı")
+    return {
+        "job_id": job_id,
+        "status": status["status"],
+        "processed": status["processed"],
+        "offset": offset,
+        "limit": limit,
+        "results": results
+    }
+
+@app.get("/jobs/{job_id}/results/stream")
+async def stream_job_results(job_id: str, request: Request):
+    """Sonuçları NDJSON olarak akıt; iş sürüyorsa yeni sonuçlar geldikçe gönderilir"""
+    try:
+        job_manager.status(job_id)
+    except JobNotFound:
+        raise HTTPException(status_code=404, detail="İş bulunamadı")
+    
+    chunks = job_manager.iter_results(job_id, poll_interval=0)
+    
+    async def results():
+        try:
+            while True:
+                chunk = await run_in_threadpool(next, chunks, StopIteration)
+                if chunk is StopIteration:
+                    return
+                if chunk is None:
+                    # İstemci gittiyse beklemeyi bırak
+                    if await request.is_disconnected():
+                        return
+                    await asyncio.sleep(0.5)
+                    continue
+                yield chunk
+        finally:
+            # Sonuç dosyası GC'yi beklemeden kapanır
+            chunks.close()
+    
+    return StreamingResponse(results(), media_type="application/x-ndjson")
+
+@app.delete("/jobs/{job_id}")
+async def cancel_job(job_id: str, purge: bool = False):
+    """İşi iptal et (purge=true ile dosyalarını da sil)"""
+    try:
+        if purge:
+            job_manager.delete(job_id)
+            return {"status": "success", "message": f"İş {job_id} silindi"}
+        job_manager.cancel(job_id)
+        return job_manager.status(job_id)
+    except JobNotFound:
+        raise HTTPException(status_code=404, detail="İş bulunamadı")
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+# Metrikler: Prometheus metin formatı
+HTTP_REQUEST_SECONDS = metrics_registry.histogram(
+    "sentiment_http_request_seconds", "HTTP istek süresi", ["method", "route", "status"])
+
+class HttpMetricsMiddleware:
+    """Route şablonu ve durum koduna göre istek süresini ölçen ASGI ara katmanı"""
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        start_time = time.perf_counter()
+        status = {"code": 500}
+        
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            HTTP_REQUEST_SECONDS.observe(
+                time.perf_counter() - start_time, scope["method"],
+                getattr(route, "path", "bilinmeyen"), str(status["code"])
+            )
+            if not scope["path"].startswith("/admin"):
+                profiler.note_request()
+
+profiler = Profiler()
+app.add_middleware(HttpMetricsMiddleware)
+# İsteğe bağlı Server-Timing başlığı: rule, normalize, cache, tokenize-<model>, forward-<model>, combine, persist
+app.add_middleware(ServerTimingMiddleware, enabled=os.environ.get("SENTIMENT_SERVER_TIMING", "0") == "1")
+
+def _lane_values(field: str):
+    return labelled((lane, values[field]) for lane, values in admission.stats()["lanes"].items())
+
+metrics_registry.counter_callback(
+    "sentiment_cache_hits_total", "Model sonuç önbelleği isabetleri", lambda: result_cache.hits)
+metrics_registry.counter_callback(
+    "sentiment_cache_misses_total", "Model sonuç önbelleği ıskaları", lambda: result_cache.misses)
+metrics_registry.gauge_callback(
+    "sentiment_cache_entries", "Önbellekteki sonuç sayısı", lambda: len(result_cache))
+metrics_registry.counter_callback(
+    "sentiment_upload_cache_hits_total", "Yükleme önbelleği isabetleri (aynı içerikli dosya)", lambda: upload_cache.hits)
+metrics_registry.counter_callback(
+    "sentiment_upload_cache_misses_total", "Yükleme önbelleği ıskaları", lambda: upload_cache.misses)
+metrics_registry.gauge_callback(
+    "sentiment_queue_depth", "Şerit başına sırada bekleyen istek", lambda: _lane_values("queued"), ["lane"])
+metrics_registry.gauge_callback(
+    "sentiment_queue_comments", "Şerit başına sırada bekleyen yorum", lambda: _lane_values("queued_comments"), ["lane"])
+metrics_registry.gauge_callback(
+    "sentiment_inflight_requests", "Şerit başına model çalıştıran istek", lambda: _lane_values("active"), ["lane"])
+metrics_registry.counter_callback(
+    "sentiment_rejected_total", "Kuyruk dolu olduğu için reddedilen istekler", lambda: _lane_values("rejected"), ["lane"])
+metrics_registry.counter_callback(
+    "sentiment_dropped_total", "Sıra gelmeden bağlantısı kopan istekler", lambda: _lane_values("dropped_disconnected"), ["lane"])
+metrics_registry.gauge_callback(
+    "sentiment_stored_comments", "Yorum deposundaki canlı yorum sayısı", lambda: len(comment_store))
+metrics_registry.gauge_callback(
+    "sentiment_search_index_documents", "Arama indeksindeki yorum sayısı", lambda: len(search_index))
+metrics_registry.gauge_callback(
+    "sentiment_jobs", "Duruma göre analiz işleri", lambda: labelled(job_manager.status_counts().items()), ["status"])
+metrics_registry.gauge_callback(
+    "process_resident_memory_bytes", "Süreç RSS belleği", process_rss_bytes)
+
+@app.get("/metrics")
+async def get_metrics():
+    """Prometheus metin formatında metrikler"""
+    return Response(content=metrics_registry.render(), media_type=METRICS_CONTENT_TYPE)
+
+# Yönetim endpoint'leri: SENTIMENT_ADMIN_TOKEN tanımlıysa X-Admin-Token başlığı gerekir
+ADMIN_TOKEN = os.environ.get("SENTIMENT_ADMIN_TOKEN")
+
+def require_admin(request: Request) -> None:
+    if ADMIN_TOKEN and request.headers.get("x-admin-token") != ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Yönetim yetkisi gerekli")
+
+@app.post("/admin/profile")
+async def start_profile(request: Request, seconds: float = 10.0, requests: int = 0,
+                        interval_ms: float = 5.0, include_idle: bool = False):
+    """Yığın örneklemeyi başlat: seconds saniye veya sonraki requests istek boyunca"""
+    require_admin(request)
+    try:
+        session = profiler.start(seconds, requests, interval_ms / 1000, include_idle)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return session.status()
+
+@app.get("/admin/profile")
+async def get_profile(request: Request):
+    """Son profil oturumunun durumu"""
+    require_admin(request)
+    if profiler.session is None:
+        raise HTTPException(status_code=404, detail="Profil oturumu yok")
+    return profiler.session.status()
+
+@app.get("/admin/profile/collapsed")
+async def get_profile_collapsed(request: Request):
+    """Collapsed stack çıktısı (flamegraph.pl, speedscope); oturum sürerken kısmi sonuç verir"""
+    require_admin(request)
+    if profiler.session is None:
+        raise HTTPException(status_code=404, detail="Profil oturumu yok")
+    session = profiler.session
+    return Response(
+        content=session.sampler.collapsed(), media_type="text/plain; charset=utf-8",
+        headers={"Content-Disposition": f'attachment; filename="profile_{session.id}.folded"'}
+    )
+
+@app.delete("/admin/profile")
+async def stop_profile(request: Request):
+    """Çalışan profil oturumunu erken bitir"""
+    require_admin(request)
+    if profiler.session is None:
+        raise HTTPException(status_code=404, detail="Profil oturumu yok")
+    profiler.session.stop()
+    return profiler.session.status()
+
+# Bellek muhasebesi ve tracemalloc
+trace_snapshots = TraceSnapshots()
+TRACE_TARGETS = {
+    "analyze_comments": lambda body: analyze_comments(parse_txt_file(body)),
+    "parse_csv_file": parse_csv_file,
+    "parse_txt_file": parse_txt_file
+}
+
+def build_memory_report(exact: bool = False) -> Dict[str, Any]:
+    """Bileşen başına bellek kullanımı"""
+    models = {}
+    for model_id, model_pipeline in pipelines.items():
+        models[model_id] = module_memory(model_pipeline.model)
+        models[model_id]["tokenizer"] = tokenizer_memory(model_pipeline.tokenizer)
+    components = {
+        "result_cache": containers_memory(result_cache.memory_containers(), exact),
+        "upload_cache": containers_memory(upload_cache.memory_containers(), exact),
+        "search_index": containers_memory(search_index.memory_containers(), exact),
+        "comment_store": containers_memory(comment_store.memory_containers(), exact)
+    }
+    components["comment_store"]["log_file_bytes"] = os.path.getsize(comment_store.path) if os.path.exists(comment_store.path) else 0
+    
+    rss = process_rss_bytes()
+    summary = {"process_rss": format_bytes(rss) if rss else None}
+    summary.update({f"model_{model_id}": format_bytes(info["total_bytes"]) for model_id, info in models.items()})
+    summary.update({name: format_bytes(info["total_bytes"]) for name, info in components.items()})
+    return {
+        "process_rss_bytes": rss,
+        "models": models,
+        **components,
+        "summary": summary
+    }
+
+@app.get("/admin/memory")
+async def memory_report(request: Request, exact: bool = False):
+    """Model, tokenizer, önbellek, indeks ve depo bellek kullanımı (exact=false ise örneklemeli tahmin)"""
+    require_admin(request)
+    return await run_in_threadpool(build_memory_report, exact)
+
+@app.post("/admin/memory/tracemalloc/start")
+async def start_tracemalloc(request: Request, frames: int = 10):
+    """tracemalloc'u başlat (çalışırken ayırmalar yavaşlar)"""
+    require_admin(request)
+    trace_snapshots.start(frames)
+    return {"status": "tracing", "frames": frames}
+
+@app.post("/admin/memory/tracemalloc/stop")
+async def stop_tracemalloc(request: Request):
+    require_admin(request)
+    trace_snapshots.stop()
+    return {"status": "stopped"}
+
+@app.post("/admin/memory/snapshots")
+async def take_memory_snapshot(request: Request):
+    """tracemalloc anlık görüntüsü al"""
+    require_admin(request)
+    try:
+        return await run_in_threadpool(trace_snapshots.take)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+@app.get("/admin/memory/snapshots")
+async def list_memory_snapshots(request: Request):
+    require_admin(request)
+    return {"snapshots": trace_snapshots.list()}
+
+@app.get("/admin/memory/snapshots/{before_id}/diff/{after_id}")
+async def diff_memory_snapshots(request: Request, before_id: str, after_id: str,
+                                group_by: str = "lineno", limit: int = 20):
+    """İki anlık görüntü arasındaki en büyük ayırma farkları"""
+    require_admin(request)
+    if group_by not in ("lineno", "filename", "traceback"):
+        raise HTTPException(status_code=400, detail="group_by: lineno, filename veya traceback")
+    try:
+        before, after = trace_snapshots.get(before_id), trace_snapshots.get(after_id)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=f"Anlık görüntü bulunamadı: {e}")
+    return {"top": await run_in_threadpool(diff_snapshots, before, after, group_by, limit)}
+
+@app.post("/admin/memory/trace")
+async def trace_memory(request: Request, target: str = "analyze_comments",
+                       group_by: str = "lineno", limit: int = 20):
+    """İstek gövdesini hedef fonksiyonla işleyip ayırma sıcak noktalarını döndür
+
+    Gövde ham dosya içeriğidir; analyze_comments için satır başına bir yorum.
+    """
+    require_admin(request)
+    if target not in TRACE_TARGETS:
+        raise HTTPException(status_code=400, detail=f"Hedef: {', '.join(TRACE_TARGETS)}")
+    if group_by not in ("lineno", "filename", "traceback"):
+        raise HTTPException(status_code=400, detail="group_by: lineno, filename veya traceback")
+    body = await request.body()
+    try:
+        return await run_in_threadpool(
+            lambda: trace_call(TRACE_TARGETS[target], body, group_by=group_by, limit=limit)
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"İzleme hatası: {str(e)}")
+
+# Dışa aktarma: satırlar depodan akış halinde okunur, bellek kullanımı sabit kalır
+EXPORT_CHUNK_ROWS = 500
+EXPORT_CSV_HEADER = ["ID", "Yorum", "Sentiment", "Güven", "Yöntem", "Tarih"]
+
+def _chunked(lines, first_chunk: str = ""):
+    """Satırları EXPORT_CHUNK_ROWS'luk parçalar halinde birleştir"""
+    if first_chunk:
+        # Başlık hemen gitsin ki istemci ilk baytları beklemesin
+        yield first_chunk
+    buffer = []
+    for line in lines:
+        buffer.append(line)
+        if len(buffer) >= EXPORT_CHUNK_ROWS:
+            yield "".join(buffer)
+            buffer = []
+    if buffer:
+        yield "".join(buffer)
+
+def _csv_line(values) -> str:
+    output = io.StringIO()
+    csv.writer(output).writerow(values)
+    return output.getvalue()
+
+def export_csv_stream(comments):
+    """Yorumları CSV satırları olarak üret"""
+    rows = (_csv_line([
+        comment["id"],
+        comment["text"],
+        comment["sentiment"],
+        comment["confidence"],
+        comment["method"],
+        comment["timestamp"]
+    ]) for comment in comments)
+    return _chunked(rows, _csv_line(EXPORT_CSV_HEADER))
+
+def export_ndjson_stream(comments):
+    """Yorumları satır başına bir JSON nesnesi olarak üret"""
+    rows = (json.dumps(comment, ensure_ascii=False) + "\n" for comment in comments)
+    return _chunked(rows)
+
+def export_json_stream(comments):
+    """Eski JSON yanıt biçimini tek seferde belleğe almadan üret"""
+    def rows():
+        for index, comment in enumerate(comments):
+            yield ("," if index else "") + json.dumps(comment, ensure_ascii=False)
+        yield '], "statistics": %s, "last_updated": %s}, "export_time": %s}' % (
+            json.dumps(comment_store.statistics),
+            json.dumps(comment_store.last_updated),
+            json.dumps(datetime.now().isoformat())
+        )
+    return _chunked(rows(), '{"status": "success", "data": {"comments": [')
+
+def export_parquet_stream(comments):
+    """Yorumları row-group'lar halinde Parquet olarak üret"""
+    return parquet_stream(comments, list(MODELS))
+
+def export_arrow_stream(comments):
+    """Yorumları Arrow IPC akışı olarak üret"""
+    return arrow_stream(comments, list(MODELS))
+
+EXPORT_FORMATS = {
+    "csv": (export_csv_stream, "text/csv; charset=utf-8", "csv"),
+    "ndjson": (export_ndjson_stream, "application/x-ndjson", "ndjson"),
+    "json": (export_json_stream, "application/json", "json"),
+    "parquet": (export_parquet_stream, "application/vnd.apache.parquet", "parquet"),
+    "arrow": (export_arrow_stream, "application/vnd.apache.arrow.stream", "arrows"),
+}
+COLUMNAR_FORMATS = {"parquet", "arrow"}
+
+@app.get("/export")
+async def export_data(format: str = "json", sentiment: Optional[str] = None,
+                      method: Optional[str] = None, since: Optional[str] = None,
+                      until: Optional[str] = None):
+    """Veriyi dışa aktar (csv, ndjson, json, parquet veya arrow; /comments ile aynı filtreler)"""
+    fmt = format.lower()
+    if fmt not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Desteklenmeyen format: {format} ({', '.join(EXPORT_FORMATS)})")
+    
+    if fmt in COLUMNAR_FORMATS:
+        try:
+            require_pyarrow()
+        except RuntimeError as e:
+            raise HTTPException(status_code=501, detail=str(e))
+    
+    try:
+        since, until = normalize_timestamp(since), normalize_timestamp(until)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Geçersiz tarih filtresi: {str(e)}")
+    
+    try:
+        stream_fn, media_type, extension = EXPORT_FORMATS[fmt]
+        comments = comment_store.iter_comments(sentiment, method, since, until)
+        filename = f"sentiment_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}"
+        return StreamingResponse(
+            stream_fn(comments),
+            media_type=media_type,
+            headers={"Content-Disposition": f"attachment; filename={filename}"}
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Dışa aktarma hatası: {str(e)}")
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(app, host="0.0.0.0", port=8000)
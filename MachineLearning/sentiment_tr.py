@@ -1,140 +1,425 @@
-"""
-Basit Türkçe duygu analizi aracı.
-- Hugging Face Transformers kullanır (çok dilli/Türkçe bir model).
-- Tekil veya birden çok yorumu analiz eder.
-- Çıktı formatı:
-    - Yorum: "..."
-    - Analiz: Olumlu/Olumsuz/Nötr
-
-Kullanım:
-    python sentiment_tr.py               # etkileşimli mod (kullanıcıdan girdi alır)
-    python sentiment_tr.py --demo        # örnek yorum listesi üzerinde demo çalıştırır
-    python sentiment_tr.py --file path   # bir dosyadaki yorumları satır satır okur
-
-Notlar:
-- Varsayılan model: savasy/bert-base-turkish-sentiment-cased (3 sınıf: neg/neu/pos)
-"""
-from __future__ import annotations
-
-import argparse
-from typing import Iterable, List, Tuple
-
-import numpy as np
-from transformers import AutoModelForSequenceClassification, AutoTokenizer, TextClassificationPipeline
-
-# Varsayılan model ve etiket eşlemeleri
-DEFAULT_MODEL_NAME = "savasy/bert-base-turkish-sentiment-cased"
-LABEL_ID_TO_NAME = {0: "Olumsuz", 1: "Nötr", 2: "Olumlu"}
-
-
-def load_pipeline(model_name: str = DEFAULT_MODEL_NAME) -> TextClassificationPipeline:
-	"""Duygu analizi için inference pipeline'ı yükler.
-
-	Model ilk çalıştırmada indirilecektir. Sonraki çalıştırmalarda cache'den yüklenir.
-	"""
-	tokenizer = AutoTokenizer.from_pretrained(model_name)
-	model = AutoModelForSequenceClassification.from_pretrained(model_name)
-	return TextClassificationPipeline(model=model, tokenizer=tokenizer, task="text-classification", top_k=None)
-
-
-def map_label_to_tr(label_str: str) -> str:
-	"""Model etiketini Türkçe 3 sınıfa dönüştürür."""
-	ls = label_str.strip().lower()
-	if ls.startswith("label_"):
-		try:
-			idx = int(ls.split("_")[-1])
-			return LABEL_ID_TO_NAME.get(idx, "Nötr")
-		except Exception:
-			return "Nötr"
-	# Bazı modeller 'negative/neutral/positive' döndürebilir
-	if "neg" in ls:
-		return "Olumsuz"
-	if "neu" in ls or "neutral" in ls:
-		return "Nötr"
-	if "pos" in ls or "positive" in ls:
-		return "Olumlu"
-	# Yıldız temelli olursa
-	if "1" in ls or "2" in ls:
-		return "Olumsuz"
-	if "3" in ls:
-		return "Nötr"
-	if "4" in ls or "5" in ls:
-		return "Olumlu"
-	return "Nötr"
-
-
-def predict_sentiment(pipeline: TextClassificationPipeline, texts: Iterable[str]) -> List[Tuple[str, str]]:
-	"""Metinler için duygu analizi yapar ve (metin, etiket) döner."""
-	outputs = pipeline(list(texts), truncation=True)
-	results: List[Tuple[str, str]] = []
-	for text, out in zip(texts, outputs):
-		if isinstance(out, list):
-			best = max(out, key=lambda x: float(x.get("score", 0.0)))
-			pred_label = map_label_to_tr(str(best.get("label", "")))
-		else:
-			pred_label = map_label_to_tr(str(out.get("label", "")))
-		results.append((text, pred_label))
-	return results
-
-
-def print_results(pairs: List[Tuple[str, str]]) -> None:
-	"""İstenen formatta sonuçları yazdırır."""
-	for text, label in pairs:
-		print(f'- Yorum: "{text}"')
-		print(f'- Analiz: {label}')
-
-
-def interactive_loop(pipeline: TextClassificationPipeline) -> None:
-	"""Kullanıcıdan bir veya birden fazla yorum alıp analiz eder. Çıkmak için boş enter."""
-	print("Çıkmak için boş satır bırakıp Enter'a basın. Birden çok yorum için satır satır girin.")
-	while True:
-		try:
-			text = input("Yorum: ").strip()
-		except (EOFError, KeyboardInterrupt):
-			print()
-			break
-		if not text:
-			break
-		results = predict_sentiment(pipeline, [text])
-		print_results(results)
-
-
-def read_lines(path: str) -> List[str]:
-	"""Dosyadan satır satır yorumları okur (boş satırları atlar)."""
-	with open(path, "r", encoding="utf-8") as f:
-		lines = [ln.strip() for ln in f.readlines()]
-	return [ln for ln in lines if ln]
-
-
-def main() -> None:
-	parser = argparse.ArgumentParser(description="Türkçe duygu analizi (Olumlu/Olumsuz/Nötr)")
-	parser.add_argument("--model", type=str, default=DEFAULT_MODEL_NAME, help="Hugging Face model adı veya yol")
-	parser.add_argument("--file", type=str, default=None, help="Yorumları içeren dosya yolu (satır bazında)")
-	parser.add_argument("--demo", action="store_true", help="Örnek yorum listesi üzerinde demo çalıştır")
-	args = parser.parse_args()
-
-	pipe = load_pipeline(args.model)
-
-	if args.demo:
-		demo_texts = [
-			"Ürün harika, beklediğimden daha iyi!",
-			"Hiç memnun kalmadım, kargo çok geç geldi.",
-			"Ne iyi ne kötü, idare eder.",
-			"Fiyatına göre performansı fena değil.",
-			"Berbat bir deneyimdi, tekrar almam.",
-			"Müşteri hizmetleri hızlı ve yardımcıydı.",
-		]
-		print_results(predict_sentiment(pipe, demo_texts))
-		return
-
-	if args.file:
-		texts = read_lines(args.file)
-		print_results(predict_sentiment(pipe, texts))
-		return
-
-	interactive_loop(pipe)
-
-
-if __name__ == "__main__":
-	main()
-
+"""
+Basit Türkçe duygu analizi aracı.
+- Hugging Face Transformers kullanır (çok dilli/Türkçe bir model); model
+  yükleme, etiket eşleme ve çıkarım API ile ortak motordadır (inference_engine.py).
+- Tekil veya birden çok yorumu analiz eder.
+- Çıktı formatı:
+    - Yorum: "..."
+    - Analiz: Olumlu/Olumsuz/Nötr
+
+Kullanım:
+    python sentiment_tr.py               # etkileşimli mod (kullanıcıdan girdi alır)
+    python sentiment_tr.py --demo        # örnek yorum listesi üzerinde demo çalıştırır
+    python sentiment_tr.py --file path   # bir dosyadaki yorumları satır satır okur
+    python sentiment_tr.py --file big.txt --output sonuc.jsonl --workers 4   # toplu mod
+    python sentiment_tr.py --file big.txt --output sonuc.jsonl --resume      # kaldığı yerden
+    zcat yorumlar.gz | python sentiment_tr.py --stream | jq .analiz          # boru hattı modu
+
+Toplu mod (--output):
+- Girdi dosyası belleğe alınmadan parça parça okunur; parçalar N işçi sürece
+  dağıtılır (her süreç kendi modelini tutar) ve süreç içinde batch_size'lık
+  gruplarla çalıştırılır.
+- Sonuçlar girdi sırasıyla JSONL (.jsonl) veya CSV (.csv) olarak yazılır.
+- Her parçadan sonra girdi konumu kontrol noktası dosyasına (<çıktı>.ckpt)
+  kaydedilir; --resume ile yarıda kalan çalışma bu konumdan sürer.
+
+Akış modu (--stream):
+- Standart girdiden satırlar okunur; --batch-size satıra ulaşınca veya ilk
+  satırdan bu yana --max-wait milisaniye geçince grup modele verilir.
+- Her girdi satırı için (boş satırlar dahil) bir JSON satırı, grup biter
+  bitmez ve girdi sırasıyla yazılır; bellekte en fazla birkaç grup tutulur.
+
+Notlar:
+- Varsayılan model: savasy/bert-base-turkish-sentiment-cased (3 sınıf: neg/neu/pos)
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import itertools
+import json
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from collections import deque
+from queue import Empty, Queue
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Model yükleme, etiket eşleme ve çıkarım API ile ortak motordadır; torch ve
+# transformers yalnızca model yüklenirken içe aktarılır (--help bu bedeli ödemez)
+from inference_engine import InferenceEngine
+from result_cache import LRUCache
+
+# Varsayılan model
+DEFAULT_MODEL_NAME = "savasy/bert-base-turkish-sentiment-cased"
+
+# Toplu mod varsayılanları
+DEFAULT_BATCH_SIZE = 32
+# Akış modu: ilk satırdan sonra grubun dolması için beklenecek en uzun süre
+DEFAULT_MAX_WAIT_MS = 50
+CSV_COLUMNS = ["sira", "yorum", "analiz", "guven", "skorlar"]
+
+
+def load_engine(model_name: str = DEFAULT_MODEL_NAME, batch_size: int = DEFAULT_BATCH_SIZE,
+				cache_size: int = 0) -> InferenceEngine:
+	"""Duygu analizi için ortak çıkarım motorunu yükler.
+
+	Model ilk çalıştırmada indirilecektir. Sonraki çalıştırmalarda cache'den yüklenir.
+	cache_size > 0 ise tekrar eden yorumlar modele yeniden verilmez.
+	"""
+	engine = InferenceEngine("hub", batch_size, LRUCache(cache_size) if cache_size > 0 else None)
+	engine.load(model_name, model_name)
+	return engine
+
+
+def analyze_batch(engine: InferenceEngine, texts: List[str],
+				  batch_size: int = DEFAULT_BATCH_SIZE) -> List[Dict[str, Any]]:
+	"""Metinleri batch_size'lık gruplarla analiz eder; etiket, güven ve tüm skorları döner."""
+	results: List[Dict[str, Any]] = []
+	for text, prediction in zip(texts, engine.predict(texts, batch_size=batch_size)):
+		# En olası etiket önce
+		scores = dict(sorted(prediction.scores.items(), key=lambda item: item[1], reverse=True))
+		label = next(iter(scores))
+		results.append({"yorum": text, "analiz": label, "guven": scores[label], "skorlar": scores})
+	return results
+
+
+def print_results(pairs: List[Tuple[str, str]]) -> None:
+	"""İstenen formatta sonuçları yazdırır."""
+	for text, label in pairs:
+		print(f'- Yorum: "{text}"')
+		print(f'- Analiz: {label}')
+
+
+_END_OF_INPUT = object()
+
+
+def micro_batches(lines: Iterable[str], batch_size: int = DEFAULT_BATCH_SIZE,
+				  max_wait: float = DEFAULT_MAX_WAIT_MS / 1000) -> Iterator[List[str]]:
+	"""Satırları boyut veya süre dolunca gruplar halinde üretir.
+
+	Okuma ayrı bir iş parçacığında yapılır; sınırlı kuyruk yavaş tüketicide
+	okumayı durdurur, böylece bellek birkaç grupla sınırlı kalır.
+	"""
+	queue: Queue = Queue(maxsize=2 * batch_size)
+
+	def reader() -> None:
+		try:
+			for line in lines:
+				queue.put(line)
+		finally:
+			queue.put(_END_OF_INPUT)
+
+	threading.Thread(target=reader, name="stdin-reader", daemon=True).start()
+	batch: List[str] = []
+	deadline = 0.0
+	while True:
+		try:
+			item = queue.get(timeout=max(0.0, deadline - time.monotonic()) if batch else None)
+		except Empty:
+			yield batch
+			batch = []
+			continue
+		if item is _END_OF_INPUT:
+			break
+		batch.append(item.rstrip("\r\n"))
+		if len(batch) == 1:
+			deadline = time.monotonic() + max_wait
+		if len(batch) >= batch_size:
+			yield batch
+			batch = []
+	if batch:
+		yield batch
+
+
+def analyze_lines(engine: InferenceEngine, lines: List[str],
+				  batch_size: int = DEFAULT_BATCH_SIZE) -> List[Dict[str, Any]]:
+	"""Her satır için bir sonuç döner; boş satırlar modele verilmez (analiz: None)."""
+	texts = [line.strip() for line in lines]
+	analyzed = iter(analyze_batch(engine, [t for t in texts if t], batch_size) if any(texts) else [])
+	return [next(analyzed) if text else {"yorum": "", "analiz": None, "guven": None, "skorlar": {}}
+			for text in texts]
+
+
+def stream_mode(engine: InferenceEngine, batch_size: int = DEFAULT_BATCH_SIZE,
+				max_wait: float = DEFAULT_MAX_WAIT_MS / 1000) -> None:
+	"""Standart girdiyi mikro gruplarla analiz edip JSON satırlarını standart çıktıya yazar."""
+	source = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", errors="replace")
+	sys.stdout.reconfigure(encoding="utf-8")
+	index = 0
+	try:
+		for batch in micro_batches(source, batch_size, max_wait):
+			lines = []
+			for result in analyze_lines(engine, batch, batch_size):
+				result["sira"] = index
+				index += 1
+				lines.append(json.dumps(result, ensure_ascii=False))
+			sys.stdout.write("\n".join(lines) + "\n")
+			sys.stdout.flush()
+	except BrokenPipeError:
+		# Okuyan taraf kapandı (ör. head); kapanışta tekrar hata verilmesin
+		os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+		sys.exit(1)
+
+
+def interactive_loop(engine: InferenceEngine, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+	"""Kullanıcıdan bir veya birden fazla yorum alıp analiz eder. Çıkmak için boş enter.
+
+	Girdi bir terminal değilse (yönlendirilmiş dosya/boru) satırlar tek tek değil
+	mikro gruplarla modele verilir; çıktı biçimi aynıdır.
+	"""
+	if not sys.stdin.isatty():
+		# Etkileşimli moddaki gibi ilk boş satırda durulur
+		for batch in micro_batches(itertools.takewhile(str.strip, sys.stdin), batch_size):
+			print_results([(r["yorum"], r["analiz"]) for r in analyze_lines(engine, batch, batch_size)])
+		return
+
+	print("Çıkmak için boş satır bırakıp Enter'a basın. Birden çok yorum için satır satır girin.")
+	while True:
+		try:
+			text = input("Yorum: ").strip()
+		except (EOFError, KeyboardInterrupt):
+			print()
+			break
+		if not text:
+			break
+		results = analyze_batch(engine, [text], batch_size)
+		print_results([(r["yorum"], r["analiz"]) for r in results])
+
+
+def iter_line_batches(path: str, batch_size: int, offset: int = 0) -> Iterator[Tuple[int, List[str]]]:
+	"""Dosyayı offset'ten itibaren okuyup (parça sonu bayt konumu, yorumlar) üretir."""
+	with open(path, "rb") as f:
+		f.seek(offset)
+		texts: List[str] = []
+		while True:
+			line = f.readline()
+			if not line:
+				break
+			text = line.decode("utf-8", errors="replace").strip()
+			if text:
+				texts.append(text)
+			if len(texts) >= batch_size:
+				yield f.tell(), texts
+				texts = []
+		if texts:
+			yield f.tell(), texts
+
+
+# ----- toplu mod: işçi süreçler -----
+
+_worker_engine: Optional[InferenceEngine] = None
+
+
+def _init_worker(model_name: str, threads: int, batch_size: int, cache_size: int) -> None:
+	"""İşçi süreçte modeli bir kez yükler; çekirdekler işçiler arasında paylaştırılır."""
+	global _worker_engine
+	import torch
+	torch.set_num_threads(threads)
+	_worker_engine = load_engine(model_name, batch_size, cache_size)
+
+
+def _worker_analyze(texts: List[str], batch_size: int) -> List[Dict[str, Any]]:
+	return analyze_batch(_worker_engine, texts, batch_size)
+
+
+def analyze_ordered(batches: Iterable[Tuple[int, List[str]]], model_name: str, workers: int,
+					batch_size: int, cache_size: int = 0) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+	"""Parçaları işçilere dağıtır, sonuçları girdi sırasıyla üretir.
+
+	Aynı anda en fazla 2 * workers parça işlemde tutulur; büyük dosyalar da
+	sabit bellekle işlenir.
+	"""
+	if workers <= 1:
+		engine = load_engine(model_name, batch_size, cache_size)
+		for end_offset, texts in batches:
+			yield end_offset, analyze_batch(engine, texts, batch_size)
+		return
+
+	threads = max(1, (os.cpu_count() or 1) // workers)
+	# fork, ebeveynde başlamış torch iş parçacıklarıyla kilitlenebilir
+	context = multiprocessing.get_context("spawn")
+	with context.Pool(workers, initializer=_init_worker, initargs=(model_name, threads, batch_size, cache_size)) as pool:
+		pending: deque = deque()
+		for end_offset, texts in batches:
+			pending.append((end_offset, pool.apply_async(_worker_analyze, (texts, batch_size))))
+			if len(pending) >= 2 * workers:
+				offset, result = pending.popleft()
+				yield offset, result.get()
+		while pending:
+			offset, result = pending.popleft()
+			yield offset, result.get()
+
+
+# ----- toplu mod: çıktı ve kontrol noktası -----
+
+class ResultWriter:
+	"""Sonuçları JSONL veya CSV olarak yazar; kontrol noktası için bayt konumunu bildirir."""
+
+	def __init__(self, path: str, resume_bytes: Optional[int] = None):
+		self.format = "csv" if path.lower().endswith(".csv") else "jsonl"
+		if resume_bytes is not None:
+			# Son kontrol noktasından sonra yazılmış yarım kayıtlar atılır; dosya
+			# eksik veya kısaysa devam etmek önceki sonuçları kaybettirir
+			self._file = open(path, "r+b")
+			size = os.fstat(self._file.fileno()).st_size
+			if size < resume_bytes:
+				self._file.close()
+				raise ValueError(f"{path} kontrol noktasından kısa ({size} < {resume_bytes} bayt)")
+			self._file.truncate(resume_bytes)
+			self._file.seek(resume_bytes)
+		else:
+			self._file = open(path, "wb")
+			if self.format == "csv":
+				self._write_csv([CSV_COLUMNS])
+
+	def _write_csv(self, rows: List[List[Any]]) -> None:
+		buffer = io.StringIO()
+		csv.writer(buffer).writerows(rows)
+		self._file.write(buffer.getvalue().encode("utf-8"))
+
+	def write(self, results: List[Dict[str, Any]], first_index: int) -> None:
+		if self.format == "csv":
+			self._write_csv([
+				[first_index + i, r["yorum"], r["analiz"], f'{r["guven"]:.6f}', json.dumps(r["skorlar"], ensure_ascii=False)]
+				for i, r in enumerate(results)
+			])
+			return
+		lines = [json.dumps(dict(r, sira=first_index + i), ensure_ascii=False) + "\n" for i, r in enumerate(results)]
+		self._file.write("".join(lines).encode("utf-8"))
+
+	def sync(self) -> int:
+		"""Diske yazar ve kalıcı bayt konumunu döner."""
+		self._file.flush()
+		os.fsync(self._file.fileno())
+		return self._file.tell()
+
+	def close(self) -> None:
+		self._file.close()
+
+
+def load_checkpoint(path: str) -> Optional[Dict[str, Any]]:
+	if not os.path.exists(path):
+		return None
+	with open(path, "r", encoding="utf-8") as f:
+		return json.load(f)
+
+
+def save_checkpoint(path: str, state: Dict[str, Any]) -> None:
+	"""Kontrol noktasını atomik olarak yazar (yarım dosya kalmaz)."""
+	tmp_path = path + ".tmp"
+	with open(tmp_path, "w", encoding="utf-8") as f:
+		json.dump(state, f)
+		f.flush()
+		os.fsync(f.fileno())
+	os.replace(tmp_path, path)
+
+
+def run_batch(input_path: str, output_path: str, model_name: str = DEFAULT_MODEL_NAME, workers: int = 1,
+			  batch_size: int = DEFAULT_BATCH_SIZE, checkpoint_path: Optional[str] = None,
+			  resume: bool = False, cache_size: int = 0) -> int:
+	"""Dosyayı toplu modda analiz eder ve yazılan toplam sonuç sayısını döner."""
+	checkpoint_path = checkpoint_path or output_path + ".ckpt"
+	input_size = os.path.getsize(input_path)
+	state = load_checkpoint(checkpoint_path) if resume else None
+	if state is not None:
+		if state["input"] != os.path.abspath(input_path) or state["input_size"] != input_size:
+			raise SystemExit(f"❌ Kontrol noktası başka bir girdiye ait: {checkpoint_path}")
+		if state.get("model") != model_name:
+			raise SystemExit(f"❌ Kontrol noktası başka bir modelle alınmış ({state.get('model')}); "
+							 f"aynı çıktıda iki model karışmasın diye --model {state.get('model')} kullanın")
+		if not os.path.exists(output_path) or os.path.getsize(output_path) < state["output_bytes"]:
+			raise SystemExit(f"❌ Çıktı dosyası eksik veya kontrol noktasından kısa: {output_path} "
+							 f"(kontrol noktasını silip baştan başlayın)")
+		print(f"↪️  {state['written']} sonuçtan sonra devam ediliyor (bayt {state['offset']})", file=sys.stderr)
+	elif resume:
+		print("ℹ️  Kontrol noktası yok, baştan başlanıyor", file=sys.stderr)
+
+	offset = state["offset"] if state else 0
+	written = state["written"] if state else 0
+	writer = ResultWriter(output_path, state["output_bytes"] if state else None)
+	started = time.perf_counter()
+	processed = 0
+	try:
+		batches = iter_line_batches(input_path, batch_size, offset)
+		for end_offset, results in analyze_ordered(batches, model_name, workers, batch_size, cache_size):
+			writer.write(results, written)
+			written += len(results)
+			processed += len(results)
+			save_checkpoint(checkpoint_path, {
+				"input": os.path.abspath(input_path),
+				"input_size": input_size,
+				"model": model_name,
+				"offset": end_offset,
+				"written": written,
+				"output_bytes": writer.sync()
+			})
+			elapsed = time.perf_counter() - started
+			print(f"\r⏳ {written} yorum ({end_offset / max(input_size, 1):.1%}, {processed / elapsed:.1f} yorum/sn)",
+				  end="", file=sys.stderr)
+	finally:
+		writer.close()
+	# Tamamlanan çalışmanın kontrol noktası gereksiz
+	if os.path.exists(checkpoint_path):
+		os.remove(checkpoint_path)
+	print(f"\n✅ {written} sonuç {output_path} dosyasına yazıldı", file=sys.stderr)
+	return written
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description="Türkçe duygu analizi (Olumlu/Olumsuz/Nötr)")
+	parser.add_argument("--model", type=str, default=DEFAULT_MODEL_NAME, help="Hugging Face model adı veya yol")
+	parser.add_argument("--file", type=str, default=None, help="Yorumları içeren dosya yolu (satır bazında)")
+	parser.add_argument("--demo", action="store_true", help="Örnek yorum listesi üzerinde demo çalıştır")
+	parser.add_argument("--output", type=str, default=None, help="Toplu mod: sonuç dosyası (.jsonl veya .csv)")
+	parser.add_argument("--workers", type=int, default=1, help="Toplu mod: model yükleyen işçi süreç sayısı")
+	parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Model çağrısı başına yorum")
+	parser.add_argument("--checkpoint", type=str, default=None, help="Kontrol noktası dosyası (varsayılan <çıktı>.ckpt)")
+	parser.add_argument("--resume", action="store_true", help="Toplu mod: kontrol noktasından devam et")
+	parser.add_argument("--stream", action="store_true", help="Standart girdiden oku, her satır için JSON satırı yaz")
+	parser.add_argument("--max-wait", type=float, default=DEFAULT_MAX_WAIT_MS,
+						help="Akış modu: grubun dolması için en fazla bekleme (ms)")
+	parser.add_argument("--cache-size", type=int, default=0,
+						help="Tekrar eden yorumlar için sonuç önbelleği boyutu (0 = kapalı)")
+	args = parser.parse_args()
+
+	if args.output:
+		if not args.file:
+			parser.error("--output için --file gerekli")
+		run_batch(args.file, args.output, args.model, args.workers, args.batch_size, args.checkpoint, args.resume,
+				  args.cache_size)
+		return
+
+	engine = load_engine(args.model, args.batch_size, args.cache_size)
+
+	if args.stream:
+		stream_mode(engine, args.batch_size, args.max_wait / 1000)
+		return
+
+	if args.demo:
+		demo_texts = [
+			"Ürün harika, beklediğimden daha iyi!",
+			"Hiç memnun kalmadım, kargo çok geç geldi.",
+			"Ne iyi ne kötü, idare eder.",
+			"Fiyatına göre performansı fena değil.",
+			"Berbat bir deneyimdi, tekrar almam.",
+			"Müşteri hizmetleri hızlı ve yardımcıydı.",
+		]
+		print_results([(r["yorum"], r["analiz"]) for r in analyze_batch(engine, demo_texts, args.batch_size)])
+		return
+
+	if args.file:
+		# Dosya belleğe alınmadan parça parça okunur
+		for _, texts in iter_line_batches(args.file, args.batch_size):
+			print_results([(r["yorum"], r["analiz"]) for r in analyze_batch(engine, texts, args.batch_size)])
+		return
+
+	interactive_loop(engine, args.batch_size)
+
+
+if __name__ == "__main__":
+	main()
+
@@ -1,342 +1,289 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-"""
-Sentiment Analiz Sistemi İstatistik Analizörü
-"""
-
-import requests
-import json
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from collections import Counter
-import time
-from typing import Dict, List, Any
-
-class SentimentStatisticsAnalyzer:
-    def __init__(self, api_url: str = "http://127.0.0.1:8000"):
-        self.api_url = api_url
-        self.results_cache = {}
-        
-    def analyze_single_comment(self, comment: str) -> Dict[str, Any]:
-        """Tek yorum analizi"""
-        try:
-            response = requests.post(
-                f"{self.api_url}/analyze",
-                json={'text': comment},
-                timeout=10
-            )
-            if response.status_code == 200:
-                return response.json()
-            else:
-                return {"error": f"HTTP {response.status_code}"}
-        except Exception as e:
-            return {"error": str(e)}
-    
-    def analyze_file(self, file_path: str) -> Dict[str, Any]:
-        """Dosya yükleme ve analiz"""
-        try:
-            with open(file_path, 'rb') as f:
-                files = {'file': (file_path, f, 'text/plain')}
-                response = requests.post(
-                    f"{self.api_url}/upload",
-                    files=files,
-                    timeout=30
-                )
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    return {"error": f"HTTP {response.status_code}"}
-        except Exception as e:
-            return {"error": str(e)}
-    
-    def get_system_health(self) -> Dict[str, Any]:
-        """Sistem sağlık kontrolü"""
-        try:
-            response = requests.get(f"{self.api_url}/health", timeout=5)
-            if response.status_code == 200:
-                return response.json()
-            else:
-                return {"error": f"HTTP {response.status_code}"}
-        except Exception as e:
-            return {"error": str(e)}
-    
-    def analyze_test_files(self) -> Dict[str, Any]:
-        """Tüm test dosyalarını analiz et"""
-        print("🔍 Test dosyaları analiz ediliyor...")
-        
-        test_files = [
-            "ornek_yorumlar.txt",
-            "test_yorumlar_detayli.txt"
-        ]
-        
-        all_results = {}
-        
-        for file_path in test_files:
-            try:
-                print(f"📁 {file_path} analiz ediliyor...")
-                result = self.analyze_file(file_path)
-                
-                if "error" not in result:
-                    all_results[file_path] = result
-                    print(f"✅ {file_path}: {result['yorum_sayisi']} yorum analiz edildi")
-                else:
-                    print(f"❌ {file_path}: {result['error']}")
-                    
-            except Exception as e:
-                print(f"❌ {file_path} hatası: {e}")
-        
-        return all_results
-    
-    def calculate_statistics(self, results: Dict[str, Any]) -> Dict[str, Any]:
-        """Sonuçlardan istatistik hesapla"""
-        if not results or "sonuclar" not in results:
-            return {"error": "Geçerli sonuç bulunamadı"}
-        
-        comments = results["sonuclar"]
-        
-        # Temel istatistikler
-        total_comments = len(comments)
-        sentiments = [c["analiz"] for c in comments]
-        methods = [c.get("yöntem", "bilinmiyor") for c in comments]
-        confidences = [c.get("güven", 0) for c in comments]
-        
-        # Sentiment dağılımı
-        sentiment_counts = Counter(sentiments)
-        sentiment_percentages = {
-            sentiment: (count / total_comments) * 100 
-            for sentiment, count in sentiment_counts.items()
-        }
-        
-        # Yöntem dağılımı
-        method_counts = Counter(methods)
-        method_percentages = {
-            method: (count / total_comments) * 100 
-            for method, count in method_counts.items()
-        }
-        
-        # Güven skoru istatistikleri
-        valid_confidences = [c for c in confidences if c > 0]
-        confidence_stats = {
-            "ortalama": sum(valid_confidences) / len(valid_confidences) if valid_confidences else 0,
-            "minimum": min(valid_confidences) if valid_confidences else 0,
-            "maksimum": max(valid_confidences) if valid_confidences else 0,
-            "standart_sapma": self._calculate_std(valid_confidences) if valid_confidences else 0
-        }
-        
-        # Model tutarlılığı
-        model_consistency = self._analyze_model_consistency(comments)
-        
-        return {
-            "genel": {
-                "toplam_yorum": total_comments,
-                "dosya_adi": results.get("dosya_adi", "bilinmiyor")
-            },
-            "sentiment_dagilimi": {
-                "sayilar": dict(sentiment_counts),
-                "yuzdeler": sentiment_percentages
-            },
-            "yontem_dagilimi": {
-                "sayilar": dict(method_counts),
-                "yuzdeler": method_percentages
-            },
-            "guven_skorlari": confidence_stats,
-            "model_tutarliligi": model_consistency
-        }
-    
-    def _calculate_std(self, values: List[float]) -> float:
-        """Standart sapma hesapla"""
-        if len(values) < 2:
-            return 0
-        
-        mean = sum(values) / len(values)
-        variance = sum((x - mean) ** 2 for x in values) / len(values)
-        return variance ** 0.5
-    
-    def _analyze_model_consistency(self, comments: List[Dict]) -> Dict[str, Any]:
-        """Model tutarlılığını analiz et"""
-        model_results = []
-        
-        for comment in comments:
-            if "model_sonuçları" in comment and comment["model_sonuçları"]:
-                model_data = comment["model_sonuçları"]
-                if "consistency" in model_data:
-                    model_results.append({
-                        "tutarlı": model_data["consistency"],
-                        "model": model_data.get("model_used", "bilinmiyor"),
-                        "güven": model_data.get("final_confidence", 0)
-                    })
-        
-        if not model_results:
-            return {"toplam_model_analizi": 0, "tutarlılık_oranı": 0}
-        
-        total_model_analysis = len(model_results)
-        consistent_count = sum(1 for r in model_results if r["tutarlı"])
-        consistency_rate = (consistent_count / total_model_analysis) * 100
-        
-        # Model bazında tutarlılık
-        model_consistency = {}
-        for result in model_results:
-            model = result["model"]
-            if model not in model_consistency:
-                model_consistency[model] = {"tutarlı": 0, "toplam": 0}
-            
-            model_consistency[model]["toplam"] += 1
-            if result["tutarlı"]:
-                model_consistency[model]["tutarlı"] += 1
-        
-        # Yüzdelik hesapla
-        for model in model_consistency:
-            total = model_consistency[model]["toplam"]
-            consistent = model_consistency[model]["tutarlı"]
-            model_consistency[model]["yüzde"] = (consistent / total) * 100
-        
-        return {
-            "toplam_model_analizi": total_model_analysis,
-            "tutarlılık_oranı": consistency_rate,
-            "model_bazında": model_consistency
-        }
-    
-    def generate_detailed_report(self) -> str:
-        """Detaylı rapor oluştur"""
-        print("📊 Detaylı istatistik raporu oluşturuluyor...")
-        
-        # Sistem sağlığı
-        health = self.get_system_health()
-        
-        # Test dosyalarını analiz et
-        test_results = self.analyze_test_files()
-        
-        # Rapor oluştur
-        report = []
-        report.append("🎭 TÜRKÇE DUYGU ANALİZİ SİSTEMİ - İSTATİSTİK RAPORU")
-        report.append("=" * 60)
-        report.append("")
-        
-        # Sistem durumu
-        report.append("🏥 SİSTEM DURUMU")
-        report.append("-" * 20)
-        if "error" not in health:
-            report.append(f"✅ Durum: {health.get('status', 'bilinmiyor')}")
-            report.append(f"✅ Yüklenen Modeller: {len(health.get('pipelines', []))}")
-            for model_id, model_info in health.get('models', {}).items():
-                report.append(f"   - {model_id}: {model_info.get('name', 'bilinmiyor')}")
-        else:
-            report.append(f"❌ Sistem hatası: {health['error']}")
-        report.append("")
-        
-        # Test sonuçları
-        if test_results:
-            report.append("📁 TEST DOSYALARI ANALİZİ")
-            report.append("-" * 30)
-            
-            for file_path, result in test_results.items():
-                if "error" not in result:
-                    stats = self.calculate_statistics(result)
-                    if "error" not in stats:
-                        report.append(f"📄 {file_path}")
-                        report.append(f"   Toplam Yorum: {stats['genel']['toplam_yorum']}")
-                        
-                        # Sentiment dağılımı
-                        report.append("   Sentiment Dağılımı:")
-                        for sentiment, count in stats['sentiment_dagilimi']['sayilar'].items():
-                            percentage = stats['sentiment_dagilimi']['yuzdeler'][sentiment]
-                            report.append(f"     {sentiment}: {count} ({percentage:.1f}%)")
-                        
-                        # Yöntem dağılımı
-                        report.append("   Yöntem Dağılımı:")
-                        for method, count in stats['yontem_dagilimi']['sayilar'].items():
-                            percentage = stats['yontem_dagilimi']['yuzdeler'][method]
-                            report.append(f"     {method}: {count} ({percentage:.1f}%)")
-                        
-                        # Güven skorları
-                        conf_stats = stats['guven_skorlari']
-                        report.append("   Güven Skorları:")
-                        report.append(f"     Ortalama: {conf_stats['ortalama']:.3f}")
-                        report.append(f"     Min-Max: {conf_stats['minimum']:.3f} - {conf_stats['maksimum']:.3f}")
-                        report.append(f"     Standart Sapma: {conf_stats['standart_sapma']:.3f}")
-                        
-                        # Model tutarlılığı
-                        if stats['model_tutarliligi']['toplam_model_analizi'] > 0:
-                            report.append("   Model Tutarlılığı:")
-                            report.append(f"     Genel Tutarlılık: {stats['model_tutarliligi']['tutarlılık_oranı']:.1f}%")
-                            for model, model_stats in stats['model_tutarliligi']['model_bazında'].items():
-                                report.append(f"     {model}: {model_stats['yüzde']:.1f}% tutarlı")
-                        
-                        report.append("")
-                    else:
-                        report.append(f"❌ {file_path}: {stats['error']}")
-                else:
-                    report.append(f"❌ {file_path}: {result['error']}")
-        else:
-            report.append("❌ Test dosyaları analiz edilemedi")
-        
-        # Genel özet
-        if test_results:
-            report.append("📈 GENEL ÖZET")
-            report.append("-" * 20)
-            
-            total_comments = 0
-            all_sentiments = []
-            all_methods = []
-            
-            for result in test_results.values():
-                if "error" not in result:
-                    total_comments += result.get('yorum_sayisi', 0)
-                    all_sentiments.extend([c['analiz'] for c in result.get('sonuclar', [])])
-                    all_methods.extend([c.get('yöntem', 'bilinmiyor') for c in result.get('sonuclar', [])])
-            
-            if total_comments > 0:
-                sentiment_summary = Counter(all_sentiments)
-                method_summary = Counter(all_methods)
-                
-                report.append(f"📊 Toplam Analiz Edilen Yorum: {total_comments}")
-                report.append("🎯 Genel Sentiment Dağılımı:")
-                for sentiment, count in sentiment_summary.most_common():
-                    percentage = (count / total_comments) * 100
-                    report.append(f"   {sentiment}: {count} ({percentage:.1f}%)")
-                
-                report.append("🔧 Genel Yöntem Dağılımı:")
-                for method, count in method_summary.most_common():
-                    percentage = (count / total_comments) * 100
-                    report.append(f"   {method}: {count} ({percentage:.1f}%)")
-        
-        report.append("")
-        report.append("✨ Rapor tamamlandı!")
-        report.append("=" * 60)
-        
-        return "\n".join(report)
-    
-    def save_report_to_file(self, filename: str = "sentiment_analysis_report.txt"):
-        """Raporu dosyaya kaydet"""
-        report = self.generate_detailed_report()
-        
-        try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(report)
-            print(f"✅ Rapor {filename} dosyasına kaydedildi")
-            return True
-        except Exception as e:
-            print(f"❌ Rapor kaydedilemedi: {e}")
-            return False
-
-def main():
-    """Ana fonksiyon"""
-    print("🚀 Sentiment Analiz İstatistik Analizörü Başlatılıyor...")
-    
-    # Analizör oluştur
-    analyzer = SentimentStatisticsAnalyzer()
-    
-    # Rapor oluştur
-    report = analyzer.generate_detailed_report()
-    
-    # Ekrana yazdır
-    print("\n" + report)
-    
-    # Dosyaya kaydet
-    analyzer.save_report_to_file()
-    
-    print("\n🎉 İstatistik analizi tamamlandı!")
-
-if __name__ == "__main__":
-    main()
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sentiment Analiz Sistemi İstatistik Analizörü
+"""
+
+import json
+import time
+import os
+import argparse
+from typing import Dict, List, Any, Optional
+from api_client import SentimentAPIClient
+from statistics_core import ResultColumns, compute_statistics, most_common, result_columns
+from columnar_export import latest_snapshot, read_snapshot
+
+class SentimentStatisticsAnalyzer:
+    def __init__(self, api_url: str = "http://127.0.0.1:8000", batch_size: int = 64, max_concurrency: int = 4):
+        self.api_url = api_url
+        # Bağlantı havuzlu, parçalayan ve yeniden deneyen ortak istemci
+        self.client = SentimentAPIClient(api_url, batch_size=batch_size, max_concurrency=max_concurrency)
+        self.results_cache = {}
+        
+    def analyze_single_comment(self, comment: str) -> Dict[str, Any]:
+        """Tek yorum analizi"""
+        try:
+            return self.client.analyze(comment)
+        except Exception as e:
+            return {"error": str(e)}
+    
+    def analyze_file(self, file_path: str) -> Dict[str, Any]:
+        """Dosyadaki yorumları parçalar halinde /analyze-batch ile analiz et"""
+        try:
+            return self.client.analyze_file(file_path)
+        except Exception as e:
+            return {"error": str(e)}
+    
+    def get_system_health(self) -> Dict[str, Any]:
+        """Sistem sağlık kontrolü"""
+        try:
+            return self.client.health()
+        except Exception as e:
+            return {"error": str(e)}
+    
+    def analyze_snapshot(self, snapshot_path: str) -> Dict[str, Any]:
+        """Parquet anlık görüntüsünü HTTP'ye gitmeden oku"""
+        try:
+            path = snapshot_path
+            if os.path.isdir(snapshot_path):
+                # Anlık görüntü dizini ise en yenisini kullan
+                path = latest_snapshot(snapshot_path) or snapshot_path
+            
+            # Satırlar sözlüğe çevrilmeden doğrudan sütunlara alınır
+            table = read_snapshot(path)
+            columns = ResultColumns.from_table(table)
+            model_ids = [
+                name[:-len("_sentiment")] for name in table.column_names
+                if name.endswith("_sentiment") and table.column(name).null_count < table.num_rows
+            ]
+            return {
+                "dosya_adi": path,
+                "yorum_sayisi": len(columns),
+                "kolonlar": columns,
+                "modeller": sorted(model_ids)
+            }
+        except Exception as e:
+            return {"error": str(e)}
+    
+    def get_server_summary(self) -> Dict[str, Any]:
+        """Sunucunun depo özetini tek GET ile al (yükleme ve yeniden analiz yok)"""
+        try:
+            summary = self.client.statistics_summary()
+            return {
+                "dosya_adi": summary["genel"]["dosya_adi"],
+                "yorum_sayisi": summary["genel"]["toplam_yorum"],
+                "istatistikler": summary
+            }
+        except Exception as e:
+            return {"error": str(e)}
+    
+    def analyze_test_files(self) -> Dict[str, Any]:
+        """Tüm test dosyalarını analiz et"""
+        print("🔍 Test dosyaları analiz ediliyor...")
+        
+        test_files = [
+            "ornek_yorumlar.txt",
+            "test_yorumlar_detayli.txt"
+        ]
+        
+        all_results = {}
+        
+        for file_path in test_files:
+            try:
+                print(f"📁 {file_path} analiz ediliyor...")
+                result = self.analyze_file(file_path)
+                
+                if "error" not in result:
+                    all_results[file_path] = result
+                    print(f"✅ {file_path}: {result['yorum_sayisi']} yorum analiz edildi")
+                else:
+                    print(f"❌ {file_path}: {result['error']}")
+                    
+            except Exception as e:
+                print(f"❌ {file_path} hatası: {e}")
+        
+        return all_results
+    
+    def calculate_statistics(self, results: Dict[str, Any]) -> Dict[str, Any]:
+        """Sonuçlardan istatistik hesapla (sütunlar üzerinde vektörel)"""
+        if results and "istatistikler" in results:
+            # Sunucu özeti zaten hesaplanmış istatistikleri taşır
+            return results["istatistikler"]
+        if not results or ("sonuclar" not in results and "kolonlar" not in results):
+            return {"error": "Geçerli sonuç bulunamadı"}
+        
+        return compute_statistics(result_columns(results), results.get("dosya_adi", "bilinmiyor"))
+    
+    def generate_detailed_report(self, snapshot_path: Optional[str] = None, server_summary: bool = False) -> str:
+        """Detaylı rapor oluştur (snapshot_path verilirse Parquet, server_summary ile sunucu özeti okunur)"""
+        print("📊 Detaylı istatistik raporu oluşturuluyor...")
+        
+        if server_summary:
+            # Sunucudaki artımlı özet - dosya yükleme ve yeniden analiz yok
+            health = self.get_system_health()
+            summary = self.get_server_summary()
+            test_results = {summary.get("dosya_adi", "sunucu"): summary}
+        elif snapshot_path:
+            # Anlık görüntüden oku - sunucuya ve yeniden analize gerek yok
+            snapshot = self.analyze_snapshot(snapshot_path)
+            if "error" in snapshot:
+                health = {"error": snapshot["error"]}
+                test_results = {}
+            else:
+                health = {"status": f"anlık görüntü ({snapshot['dosya_adi']})", "pipelines": snapshot["modeller"]}
+                test_results = {snapshot["dosya_adi"]: snapshot}
+        else:
+            # Sistem sağlığı
+            health = self.get_system_health()
+            
+            # Test dosyalarını analiz et
+            test_results = self.analyze_test_files()
+        
+        # Rapor oluştur
+        report = []
+        report.append("🎭 TÜRKÇE DUYGU ANALİZİ SİSTEMİ - İSTATİSTİK RAPORU")
+        report.append("=" * 60)
+        report.append("")
+        
+        # Sistem durumu
+        report.append("🏥 SİSTEM DURUMU")
+        report.append("-" * 20)
+        if "error" not in health:
+            report.append(f"✅ Durum: {health.get('status', 'bilinmiyor')}")
+            report.append(f"✅ Yüklenen Modeller: {len(health.get('pipelines', []))}")
+            for model_id, model_info in health.get('models', {}).items():
+                report.append(f"   - {model_id}: {model_info.get('name', 'bilinmiyor')}")
+        else:
+            report.append(f"❌ Sistem hatası: {health['error']}")
+        report.append("")
+        
+        # Test sonuçları
+        file_stats = {}
+        if test_results:
+            report.append("📁 TEST DOSYALARI ANALİZİ")
+            report.append("-" * 30)
+            
+            for file_path, result in test_results.items():
+                if "error" not in result:
+                    stats = self.calculate_statistics(result)
+                    if "error" not in stats:
+                        file_stats[file_path] = stats
+                        report.append(f"📄 {file_path}")
+                        report.append(f"   Toplam Yorum: {stats['genel']['toplam_yorum']}")
+                        
+                        # Sentiment dağılımı
+                        report.append("   Sentiment Dağılımı:")
+                        for sentiment, count in stats['sentiment_dagilimi']['sayilar'].items():
+                            percentage = stats['sentiment_dagilimi']['yuzdeler'][sentiment]
+                            report.append(f"     {sentiment}: {count} ({percentage:.1f}%)")
+                        
+                        # Yöntem dağılımı
+                        report.append("   Yöntem Dağılımı:")
+                        for method, count in stats['yontem_dagilimi']['sayilar'].items():
+                            percentage = stats['yontem_dagilimi']['yuzdeler'][method]
+                            report.append(f"     {method}: {count} ({percentage:.1f}%)")
+                        
+                        # Güven skorları
+                        conf_stats = stats['guven_skorlari']
+                        report.append("   Güven Skorları:")
+                        report.append(f"     Ortalama: {conf_stats['ortalama']:.3f}")
+                        report.append(f"     Min-Max: {conf_stats['minimum']:.3f} - {conf_stats['maksimum']:.3f}")
+                        report.append(f"     Standart Sapma: {conf_stats['standart_sapma']:.3f}")
+                        
+                        # Model tutarlılığı
+                        if stats['model_tutarliligi']['toplam_model_analizi'] > 0:
+                            report.append("   Model Tutarlılığı:")
+                            report.append(f"     Genel Tutarlılık: {stats['model_tutarliligi']['tutarlılık_oranı']:.1f}%")
+                            for model, model_stats in stats['model_tutarliligi']['model_bazında'].items():
+                                report.append(f"     {model}: {model_stats['yüzde']:.1f}% tutarlı")
+                        
+                        report.append("")
+                    else:
+                        report.append(f"❌ {file_path}: {stats['error']}")
+                else:
+                    report.append(f"❌ {file_path}: {result['error']}")
+        else:
+            report.append("❌ Test dosyaları analiz edilemedi")
+        
+        # Genel özet
+        if test_results:
+            report.append("📈 GENEL ÖZET")
+            report.append("-" * 20)
+            
+            total_comments = sum(stats['genel']['toplam_yorum'] for stats in file_stats.values())
+            
+            if total_comments > 0:
+                # Dosya sayımlarını topla (Counter ile aynı ilk görülme sırası)
+                sentiment_summary, method_summary = {}, {}
+                for stats in file_stats.values():
+                    for sentiment, count in stats['sentiment_dagilimi']['sayilar'].items():
+                        sentiment_summary[sentiment] = sentiment_summary.get(sentiment, 0) + count
+                    for method, count in stats['yontem_dagilimi']['sayilar'].items():
+                        method_summary[method] = method_summary.get(method, 0) + count
+                
+                report.append(f"📊 Toplam Analiz Edilen Yorum: {total_comments}")
+                report.append("🎯 Genel Sentiment Dağılımı:")
+                for sentiment, count in most_common(sentiment_summary):
+                    percentage = (count / total_comments) * 100
+                    report.append(f"   {sentiment}: {count} ({percentage:.1f}%)")
+                
+                report.append("🔧 Genel Yöntem Dağılımı:")
+                for method, count in most_common(method_summary):
+                    percentage = (count / total_comments) * 100
+                    report.append(f"   {method}: {count} ({percentage:.1f}%)")
+        
+        report.append("")
+        report.append("✨ Rapor tamamlandı!")
+        report.append("=" * 60)
+        
+        return "\n".join(report)
+    
+    def save_report_to_file(self, filename: str = "sentiment_analysis_report.txt",
+                            snapshot_path: Optional[str] = None, server_summary: bool = False):
+        """Raporu dosyaya kaydet"""
+        report = self.generate_detailed_report(snapshot_path, server_summary)
+        
+        try:
+            with open(filename, 'w', encoding='utf-8') as f:
+                f.write(report)
+            print(f"✅ Rapor {filename} dosyasına kaydedildi")
+            return True
+        except Exception as e:
+            print(f"❌ Rapor kaydedilemedi: {e}")
+            return False
+
+def main():
+    """Ana fonksiyon"""
+    parser = argparse.ArgumentParser(description="Sentiment analiz istatistik raporu")
+    parser.add_argument("--api-url", type=str, default="http://127.0.0.1:8000", help="API adresi")
+    parser.add_argument("--snapshot", type=str, default=None,
+                        help="API yerine okunacak Parquet anlık görüntüsü (dosya veya dizin)")
+    parser.add_argument("--server-summary", action="store_true",
+                        help="Dosyaları yeniden analiz etmek yerine sunucunun /statistics/summary özetini kullan")
+    parser.add_argument("--batch-size", type=int, default=64, help="/analyze-batch isteği başına yorum")
+    parser.add_argument("--concurrency", type=int, default=4, help="Aynı anda gönderilecek en fazla istek")
+    args = parser.parse_args()
+    
+    print("🚀 Sentiment Analiz İstatistik Analizörü Başlatılıyor...")
+    
+    # Analizör oluştur
+    analyzer = SentimentStatisticsAnalyzer(args.api_url, args.batch_size, args.concurrency)
+    
+    # Rapor oluştur
+    report = analyzer.generate_detailed_report(args.snapshot, args.server_summary)
+    
+    # Ekrana yazdır
+    print("\n" + report)
+    
+    # Dosyaya kaydet (raporu yeniden oluşturmadan)
+    try:
+        with open("sentiment_analysis_report.txt", 'w', encoding='utf-8') as f:
+            f.write(report)
+        print("✅ Rapor sentiment_analysis_report.txt dosyasına kaydedildi")
+    except Exception as e:
+        print(f"❌ Rapor kaydedilemedi: {e}")
+    
+    print("\n🎉 İstatistik analizi tamamlandı!")
+
+if __name__ == "__main__":
+    main()
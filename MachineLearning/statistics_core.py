@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Vektörel İstatistik Çekirdeği - üç rapor aracının ortak hesaplama katmanı
+
+Sonuç listesi bir kez sütunlara (NumPy dizileri) çevrilir; dağılımlar,
+güven momentleri, histogramlar, uzunluk kovaları ve model tutarlılığı bu
+sütunlar üzerinde np.bincount / maske işlemleriyle hesaplanır. Metin
+değerleri (duygu, yöntem, model) tamsayı koda çevrilir; sayımlar Counter
+ile aynı sırada (ilk görülme) döndürülür.
+
+Parquet anlık görüntülerinden gelen Arrow tabloları satır satır Python
+nesnesine çevrilmeden doğrudan sütunlara alınır (from_table). API sonuç
+listeleri de pyarrow kuruluysa Arrow'un C++ dönüştürücüsüyle aynı yola
+girer; pyarrow yoksa tek geçişli Python döngüsü kullanılır.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+UNKNOWN_METHOD = "bilinmiyor"
+# Kelime sayısına göre uzunluk kovaları: (etiket, alt sınır hariç, üst sınır dahil)
+LENGTH_BUCKETS = (
+    ("Kısa (≤10 kelime)", 0, 10),
+    ("Orta (11-25 kelime)", 10, 25),
+    ("Uzun (>25 kelime)", 25, None),
+)
+# Güven kategorileri: yüksek ≥0.9, orta 0.7-0.9, düşük <0.7
+CONFIDENCE_LEVELS = (0.7, 0.9)
+
+
+def _result_struct(pa):
+    """from_results'ın okuduğu alanlar (sözlükteki diğer anahtarlar dönüştürülmez)"""
+    return pa.struct([
+        ("analiz", pa.string()),
+        ("yöntem", pa.string()),
+        ("güven", pa.float64()),
+        ("yorum", pa.string()),
+        ("model_sonuçları", pa.struct([("consistency", pa.bool_()), ("model_used", pa.string())])),
+    ])
+
+
+class _Encoder:
+    """Değerleri ilk görülme sırasıyla tamsayı kodlara çevirir"""
+
+    def __init__(self):
+        self.codes: Dict[Any, int] = {}
+
+    def __call__(self, value: Any) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.codes)
+        return code
+
+    @property
+    def labels(self) -> List[Any]:
+        return list(self.codes)
+
+
+class ResultColumns:
+    """Analiz sonuçlarının sütunlu gösterimi"""
+
+    def __init__(self, sentiment: np.ndarray, sentiment_labels: List[Any],
+                 method: np.ndarray, method_labels: List[Any],
+                 confidence: np.ndarray, word_count: np.ndarray, has_text: np.ndarray,
+                 has_model: np.ndarray, consistent: np.ndarray,
+                 model: np.ndarray, model_labels: List[Any]):
+        self.sentiment = sentiment
+        self.sentiment_labels = sentiment_labels
+        self.method = method
+        self.method_labels = method_labels
+        self.confidence = confidence
+        self.word_count = word_count
+        self.has_text = has_text
+        self.has_model = has_model
+        self.consistent = consistent
+        self.model = model
+        self.model_labels = model_labels
+
+    def __len__(self) -> int:
+        return len(self.sentiment)
+
+    @classmethod
+    def from_results(cls, results: Iterable[Dict[str, Any]]) -> "ResultColumns":
+        """API sonuç sözlüklerinden sütunlar oluştur
+
+        pyarrow kuruluysa sözlükler tek çağrıda (C++ içinde) Arrow yapı dizisine
+        alınır ve from_table ile aynı vektörel yoldan geçer; yalnızca kullanılan
+        alanlar okunur. pyarrow yoksa veya alan tipleri uymuyorsa _from_rows.
+        """
+        rows = results if isinstance(results, list) else list(results)
+        if not rows:
+            return cls._from_rows(rows)
+        try:
+            import pyarrow as pa
+        except ImportError:
+            return cls._from_rows(rows)
+        try:
+            array = pa.array(rows, type=_result_struct(pa))
+        except (pa.ArrowException, TypeError, ValueError):
+            return cls._from_rows(rows)
+
+        model_data = array.field("model_sonuçları")
+        consistency = model_data.field("consistency")
+        # Döngüdeki koşulun karşılığı: model sonucu var ve "consistency" alanı dolu
+        has_model = (model_data.is_valid().to_numpy(zero_copy_only=False)
+                     & consistency.is_valid().to_numpy(zero_copy_only=False))
+        return cls._from_arrow(
+            array.field("analiz"), array.field("yöntem"), array.field("güven"), array.field("yorum"),
+            model_data.field("model_used"), consistency, has_model
+        )
+
+    @classmethod
+    def _from_rows(cls, results: Iterable[Dict[str, Any]]) -> "ResultColumns":
+        """pyarrow olmadan tek geçişli yedek yol (alanları düz listelere kopyalar)"""
+        sentiment_codes: Dict[Any, int] = {}
+        method_codes: Dict[Any, int] = {}
+        model_codes: Dict[Any, int] = {}
+        sentiment, method, confidence, word_count, has_text, has_model, consistent, model = ([] for _ in range(8))
+        for result in results:
+            value = result["analiz"]
+            sentiment.append(sentiment_codes.setdefault(value, len(sentiment_codes)))
+            value = result.get("yöntem", UNKNOWN_METHOD)
+            method.append(method_codes.setdefault(value, len(method_codes)))
+            confidence.append(result.get("güven", 0) or 0)
+            text = result.get("yorum", "")
+            word_count.append(len(text.split()) if text else 0)
+            has_text.append(bool(text))
+            model_data = result.get("model_sonuçları")
+            if model_data and "consistency" in model_data:
+                has_model.append(True)
+                consistent.append(bool(model_data["consistency"]))
+                value = model_data.get("model_used", UNKNOWN_METHOD)
+                model.append(model_codes.setdefault(value, len(model_codes)))
+            else:
+                has_model.append(False)
+                consistent.append(False)
+                model.append(-1)
+        return cls(
+            np.array(sentiment, dtype=np.int64), list(sentiment_codes),
+            np.array(method, dtype=np.int64), list(method_codes),
+            np.array(confidence, dtype=np.float64), np.array(word_count, dtype=np.int64),
+            np.array(has_text, dtype=bool), np.array(has_model, dtype=bool),
+            np.array(consistent, dtype=bool), np.array(model, dtype=np.int64), list(model_codes),
+        )
+
+    @classmethod
+    def from_table(cls, table) -> "ResultColumns":
+        """columnar_export şemasındaki Arrow tablosundan sütunlar oluştur (satır döngüsü yok)"""
+        model_columns = [name for name in table.column_names if name.endswith("_sentiment")]
+        has_model = np.zeros(table.num_rows, dtype=bool)
+        for name in model_columns:
+            has_model |= table.column(name).is_valid().to_numpy(zero_copy_only=False)
+        return cls._from_arrow(
+            table.column("sentiment"), table.column("method"), table.column("confidence"),
+            table.column("text"), table.column("model_used"), table.column("consistency"), has_model
+        )
+
+    @classmethod
+    def _from_arrow(cls, sentiment, method, confidence, text, model_used, consistency,
+                    has_model: np.ndarray) -> "ResultColumns":
+        """Arrow sütunlarından (Array veya ChunkedArray) vektörel oluşturma"""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        def encode(column, fill: Any = None) -> Tuple[np.ndarray, List[Any]]:
+            column = column.cast("string")
+            if fill is not None:
+                column = pc.fill_null(column, fill)
+            encoded = pc.dictionary_encode(column)
+            if hasattr(encoded, "combine_chunks"):
+                encoded = encoded.combine_chunks()
+            codes = pc.fill_null(encoded.indices, -1).to_numpy(zero_copy_only=False).astype(np.int64)
+            return codes, encoded.dictionary.to_pylist()
+
+        sentiment, sentiment_labels = encode(sentiment)
+        method, method_labels = encode(method, UNKNOWN_METHOD)
+        # Model sonucu olmayan satırlar model etiketlerine girmez
+        model_used = pc.if_else(pa.array(has_model), pc.fill_null(model_used.cast("string"), UNKNOWN_METHOD), None)
+        model, model_labels = encode(model_used)
+        text = pc.fill_null(text, "")
+        has_text = pc.greater(pc.utf8_length(text), 0).to_numpy(zero_copy_only=False)
+        # Arrow baş/son boşluklarda boş parça üretir: önce kırpılır, boş kalan metin
+        # ([""] olarak bölünür) split() gibi 0 kelime sayılır
+        trimmed = pc.utf8_trim_whitespace(text)
+        words = pc.list_value_length(pc.utf8_split_whitespace(trimmed)).to_numpy(zero_copy_only=False)
+        has_words = pc.greater(pc.utf8_length(trimmed), 0).to_numpy(zero_copy_only=False)
+        return cls(
+            sentiment, sentiment_labels, method, method_labels,
+            pc.fill_null(confidence, 0.0).to_numpy(zero_copy_only=False).astype(np.float64),
+            np.where(has_words, words, 0).astype(np.int64),
+            has_text,
+            has_model,
+            pc.fill_null(consistency, False).to_numpy(zero_copy_only=False) & has_model,
+            model, model_labels,
+        )
+
+    @classmethod
+    def concat(cls, parts: Sequence["ResultColumns"]) -> "ResultColumns":
+        """Birden çok sütun kümesini birleştir (kodlar ortak etiketlere yeniden eşlenir)"""
+        def remap(attribute: str, labels_attribute: str) -> Tuple[np.ndarray, List[Any]]:
+            encoder = _Encoder()
+            arrays = []
+            for part in parts:
+                mapping = np.array([encoder(label) for label in getattr(part, labels_attribute)] + [-1],
+                                   dtype=np.int64)
+                # -1 (değer yok) eşleme dizisinin son elemanına düşer
+                arrays.append(mapping[getattr(part, attribute)])
+            return (np.concatenate(arrays) if arrays else np.zeros(0, dtype=np.int64)), encoder.labels
+
+        sentiment, sentiment_labels = remap("sentiment", "sentiment_labels")
+        method, method_labels = remap("method", "method_labels")
+        model, model_labels = remap("model", "model_labels")
+
+        def join(attribute: str, dtype) -> np.ndarray:
+            return np.concatenate([getattr(part, attribute) for part in parts]) if parts else np.zeros(0, dtype)
+
+        return cls(sentiment, sentiment_labels, method, method_labels,
+                   join("confidence", np.float64), join("word_count", np.int64), join("has_text", bool),
+                   join("has_model", bool), join("consistent", bool), model, model_labels)
+
+
+# ----- hesaplamalar -----
+
+def counts_by_label(codes: np.ndarray, labels: List[Any]) -> Dict[Any, int]:
+    """Kod dizisinden {etiket: sayı}, Counter gibi dizide ilk görülme sırasıyla"""
+    values, first, counts = np.unique(codes[codes >= 0], return_index=True, return_counts=True)
+    return {labels[values[i]]: int(counts[i]) for i in np.argsort(first, kind="stable")}
+
+
+def most_common(counts: Dict[Any, int]) -> List[Tuple[Any, int]]:
+    """Counter.most_common ile aynı sıralama (eşitlikte ilk görülen önce)"""
+    return sorted(counts.items(), key=lambda item: -item[1])
+
+
+def distribution(codes: np.ndarray, labels: List[Any], total: Optional[int] = None) -> Dict[str, Dict[Any, float]]:
+    counts = counts_by_label(codes, labels)
+    total = len(codes) if total is None else total
+    return {
+        "sayilar": counts,
+        "yuzdeler": {label: count / total * 100 for label, count in counts.items()} if total else {}
+    }
+
+
+def confidence_moments(confidence: np.ndarray) -> Dict[str, float]:
+    """Ortalama, min, max ve (popülasyon) standart sapma"""
+    if len(confidence) == 0:
+        return {"ortalama": 0, "minimum": 0, "maksimum": 0, "standart_sapma": 0}
+    return {
+        "ortalama": float(confidence.mean()),
+        "minimum": float(confidence.min()),
+        "maksimum": float(confidence.max()),
+        "standart_sapma": float(confidence.std()) if len(confidence) >= 2 else 0
+    }
+
+
+def range_counts(values: np.ndarray, edges: Sequence[float]) -> List[int]:
+    """[edges[i], edges[i+1]) aralıklarındaki değer sayıları (tüm aralıklar sağdan açık)"""
+    edges = np.asarray(edges, dtype=np.float64)
+    bins = np.searchsorted(edges, values, side="right") - 1
+    bins = bins[(bins >= 0) & (bins < len(edges) - 1)]
+    return np.bincount(bins, minlength=len(edges) - 1).tolist()
+
+
+def confidence_levels(confidence: np.ndarray) -> Dict[str, int]:
+    low, high = CONFIDENCE_LEVELS
+    return {
+        "yüksek": int(np.count_nonzero(confidence >= high)),
+        "orta": int(np.count_nonzero((confidence >= low) & (confidence < high))),
+        "düşük": int(np.count_nonzero(confidence < low))
+    }
+
+
+def model_consistency(columns: ResultColumns, include_confidence: bool = False) -> Dict[str, Any]:
+    """Genel ve model bazında tutarlılık"""
+    mask = columns.has_model
+    total = int(np.count_nonzero(mask))
+    if not total:
+        return {"toplam_model_analizi": 0, "tutarlılık_oranı": 0}
+    model = columns.model[mask]
+    consistent = columns.consistent[mask]
+    totals = np.bincount(model, minlength=len(columns.model_labels))
+    consistent_totals = np.bincount(model[consistent], minlength=len(columns.model_labels))
+    per_model = {}
+    for label, model_total, model_consistent in zip(columns.model_labels, totals, consistent_totals):
+        if model_total:
+            per_model[label] = {
+                "tutarlı": int(model_consistent),
+                "toplam": int(model_total),
+                "yüzde": model_consistent / model_total * 100
+            }
+    return {
+        "toplam_model_analizi": total,
+        "tutarlılık_oranı": int(np.count_nonzero(consistent)) / total * 100,
+        "model_bazında": per_model
+    }
+
+
+def length_buckets(columns: ResultColumns) -> List[Dict[str, Any]]:
+    """Uzunluk kovası başına duygu dağılımı ve ortalama güven
+
+    Yalnızca metni, duygusu ve pozitif güveni olan sonuçlar sayılır.
+    """
+    labels = columns.sentiment_labels
+    valid = trend_mask(columns)
+    words = columns.word_count[valid]
+    sentiment = columns.sentiment[valid]
+    confidence = columns.confidence[valid]
+    buckets = []
+    for name, lower, upper in LENGTH_BUCKETS:
+        mask = words > lower
+        if upper is not None:
+            mask &= words <= upper
+        count = int(np.count_nonzero(mask))
+        buckets.append({
+            "kategori": name,
+            "toplam": count,
+            "sayilar": counts_by_label(sentiment[mask], labels),
+            "ortalama_güven": float(confidence[mask].mean()) if count else 0.0
+        })
+    return buckets
+
+
+def trend_confidences(columns: ResultColumns) -> np.ndarray:
+    """Trend analizine giren sonuçların güven skorları (length_buckets ile aynı filtre)"""
+    return columns.confidence[trend_mask(columns)]
+
+
+def trend_mask(columns: ResultColumns) -> np.ndarray:
+    """Metni, duygusu ve pozitif güveni olan satırlar"""
+    # Boş duygu etiketleri ve kodu olmayan (-1) satırlar son elemana (False) düşer
+    non_empty = np.array([bool(label) for label in columns.sentiment_labels] + [False])
+    return columns.has_text & (columns.confidence > 0) & non_empty[columns.sentiment]
+
+
+def compute_statistics(columns: ResultColumns, file_name: str = "bilinmiyor") -> Dict[str, Any]:
+    """Rapor araçlarının ortak istatistik sözlüğü"""
+    total = len(columns)
+    confidence = columns.confidence[columns.confidence > 0]
+    return {
+        "genel": {
+            "toplam_yorum": total,
+            "dosya_adi": file_name
+        },
+        "sentiment_dagilimi": distribution(columns.sentiment, columns.sentiment_labels, total),
+        "yontem_dagilimi": distribution(columns.method, columns.method_labels, total),
+        "guven_skorlari": confidence_moments(confidence),
+        "model_tutarliligi": model_consistency(columns)
+    }
+
+
+def result_columns(results: Dict[str, Any]) -> ResultColumns:
+    """Analiz yanıtının sütunları
+
+    İlk çağrıda "sonuclar" listesinden oluşturulup yanıtta "kolonlar" olarak
+    saklanır; aynı yanıtı kullanan sonraki raporlar listeyi yeniden gezmez.
+    """
+    columns = results.get("kolonlar")
+    if columns is None:
+        columns = results["kolonlar"] = ResultColumns.from_results(results.get("sonuclar", []))
+    return columns
@@ -0,0 +1,605 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Akan (Çevrimiçi) İstatistik Biriktiricileri - sınırsız sonuç akışları için
+
+Sonuçlar belleğe toplanmadan parça parça (varsayılan 10.000 satır) okunur ve
+sabit boyutlu biriktiricilere işlenir:
+    - duygu / yöntem / model sayımları ve uzunluk kovaları (tam)
+    - güven skorları için Welford ortalama/varyans, min ve max (tam)
+    - sabit aralıklı güven histogramı ve güven seviyeleri (tam)
+    - KLL taslağı ile yaklaşık kantiller (sıra hatası ~%1, k=200)
+
+Farklı parçalardan/düğümlerden gelen kısmi biriktiriciler JSON olarak
+kaydedilip birleştirilebilir; sayımlar ve histogramlar birebir, momentler
+Chan formülüyle matematiksel olarak tam birleşir. Yalnızca kantiller
+yaklaşıktır.
+
+Kaynaklar: /export?format=ndjson çıktısı, /jobs/{id}/results/stream çıktısı
+veya doğrudan çalışan API.
+
+Kullanım:
+    python statistics_stream.py export.ndjson                      # dosyadan
+    python statistics_stream.py --api-url http://127.0.0.1:8000    # /export akışından
+    python statistics_stream.py --api-url http://127.0.0.1:8000 --job JOB_ID
+    python statistics_stream.py parca1.ndjson --save parca1.json   # kısmi biriktirici
+    python statistics_stream.py --merge parca1.json parca2.json    # parçaları birleştir
+"""
+
+import argparse
+import json
+import math
+import random
+import sys
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from statistics_core import (CONFIDENCE_LEVELS, LENGTH_BUCKETS, ResultColumns, counts_by_label,
+                             most_common, trend_mask)
+
+DEFAULT_API_URL = "http://127.0.0.1:8000"
+DEFAULT_CHUNK_SIZE = 10000
+DEFAULT_KLL_K = 200
+# Güven histogramı: 0.0-1.0 arası 10 eşit aralık (son aralık 1.0'ı da içerir)
+DEFAULT_HISTOGRAM_EDGES = tuple(round(i / 10, 1) for i in range(11))
+DEFAULT_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95, 0.99)
+STATE_VERSION = 1
+
+
+class Welford:
+    """Birleştirilebilir ortalama/varyans (Welford, parçalar için Chan formülü)"""
+
+    def __init__(self, count: int = 0, mean: float = 0.0, m2: float = 0.0,
+                 minimum: Optional[float] = None, maximum: Optional[float] = None):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+        self.minimum = minimum
+        self.maximum = maximum
+
+    def update(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.minimum = value if self.minimum is None else min(self.minimum, value)
+        self.maximum = value if self.maximum is None else max(self.maximum, value)
+
+    def remove(self, value: float) -> None:
+        """Daha önce eklenmiş bir değeri çıkar (min/max güncellenmez)"""
+        if self.count <= 1:
+            self.count, self.mean, self.m2 = 0, 0.0, 0.0
+            self.minimum = self.maximum = None
+            return
+        count = self.count - 1
+        delta = value - self.mean
+        self.mean -= delta / count
+        self.m2 = max(0.0, self.m2 - delta * (value - self.mean))
+        self.count = count
+
+    def extend(self, values: np.ndarray) -> None:
+        """Bir değer dizisini tek adımda ekle"""
+        if len(values):
+            mean = float(values.mean())
+            self.merge(Welford(len(values), mean, float(((values - mean) ** 2).sum()),
+                               float(values.min()), float(values.max())))
+
+    def merge(self, other: "Welford") -> None:
+        if not other.count:
+            return
+        if not self.count:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.minimum, self.maximum = other.minimum, other.maximum
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    @property
+    def variance(self) -> float:
+        """Popülasyon varyansı (statistics_core ile aynı)"""
+        return self.m2 / self.count if self.count >= 2 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"count": self.count, "mean": self.mean, "m2": self.m2,
+                "minimum": self.minimum, "maximum": self.maximum}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Welford":
+        return cls(data["count"], data["mean"], data["m2"], data["minimum"], data["maximum"])
+
+
+class FixedHistogram:
+    """Sabit sınırlı histogram; aralıklar sağdan açık, son aralık kapalı"""
+
+    def __init__(self, edges: Sequence[float] = DEFAULT_HISTOGRAM_EDGES, counts: Optional[List[int]] = None,
+                 outside: int = 0):
+        self.edges = np.asarray(edges, dtype=np.float64)
+        self.counts = np.zeros(len(self.edges) - 1, dtype=np.int64) if counts is None else np.asarray(counts, dtype=np.int64)
+        self.outside = outside
+
+    def add(self, value: float, delta: int = 1) -> None:
+        """Tek değer ekle (delta=-1 ile çıkar)"""
+        index = len(self.counts) - 1 if value == self.edges[-1] else bisect_right(self.edges, value) - 1
+        if 0 <= index < len(self.counts):
+            self.counts[index] += delta
+        else:
+            self.outside += delta
+
+    def extend(self, values: np.ndarray) -> None:
+        bins = np.searchsorted(self.edges, values, side="right") - 1
+        bins[values == self.edges[-1]] = len(self.counts) - 1
+        valid = (bins >= 0) & (bins < len(self.counts))
+        self.counts += np.bincount(bins[valid], minlength=len(self.counts))
+        self.outside += int(len(values) - np.count_nonzero(valid))
+
+    def merge(self, other: "FixedHistogram") -> None:
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("Farklı sınırlara sahip histogramlar birleştirilemez")
+        self.counts += other.counts
+        self.outside += other.outside
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"edges": self.edges.tolist(), "counts": self.counts.tolist(), "outside": self.outside}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FixedHistogram":
+        return cls(data["edges"], data["counts"], data["outside"])
+
+
+class KLLSketch:
+    """Yaklaşık kantiller için KLL taslağı (Karnin, Lang, Liberty 2016)
+
+    Seviye h'deki her öğe 2^h ağırlık taşır. Kapasitesi dolan seviye
+    sıralanır, rastgele (tek/çift) konumdaki yarısı bir üst seviyeye
+    taşınır. Bellek O(k) ile sınırlıdır; birleştirme seviyeleri ekleyip
+    yeniden sıkıştırır.
+    """
+
+    def __init__(self, k: int = DEFAULT_KLL_K, seed: Optional[int] = None):
+        self.k = k
+        self.count = 0
+        self.levels: List[np.ndarray] = [np.zeros(0, dtype=np.float64)]
+        self._random = random.Random(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(2, int(math.ceil(self.k * (2 / 3) ** depth)))
+
+    def extend(self, values: np.ndarray) -> None:
+        if len(values):
+            self.levels[0] = np.concatenate([self.levels[0], np.asarray(values, dtype=np.float64)])
+            self.count += len(values)
+            self._compress()
+
+    def _compress(self) -> None:
+        # Yeni seviye eklenince alt seviyelerin kapasitesi küçülür; taşan kalmayana kadar dön
+        compacted = True
+        while compacted:
+            compacted = False
+            for level in range(len(self.levels)):
+                items = self.levels[level]
+                if len(items) <= self._capacity(level):
+                    continue
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.zeros(0, dtype=np.float64))
+                items = np.sort(items)
+                # Tek sayıda öğede biri bu seviyede kalır
+                keep, items = (items[-1:], items[:-1]) if len(items) % 2 else (items[:0], items)
+                promoted = items[self._random.randint(0, 1)::2]
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+                self.levels[level] = keep
+                compacted = True
+
+    def merge(self, other: "KLLSketch") -> None:
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.zeros(0, dtype=np.float64))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self._compress()
+
+    def quantiles(self, qs: Sequence[float]) -> List[Optional[float]]:
+        """Verilen oranlar (0-1) için yaklaşık değerler"""
+        if not self.count:
+            return [None for _ in qs]
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(items), 2 ** level, dtype=np.int64)
+                                  for level, items in enumerate(self.levels)])
+        order = np.argsort(values, kind="stable")
+        values, cumulative = values[order], np.cumsum(weights[order])
+        positions = np.searchsorted(cumulative, np.asarray(qs, dtype=np.float64) * cumulative[-1], side="left")
+        return [float(values[min(p, len(values) - 1)]) for p in positions]
+
+    def quantile(self, q: float) -> Optional[float]:
+        return self.quantiles([q])[0]
+
+    def __len__(self) -> int:
+        """Taslakta tutulan öğe sayısı"""
+        return sum(len(items) for items in self.levels)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"k": self.k, "count": self.count, "levels": [items.tolist() for items in self.levels]}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "KLLSketch":
+        sketch = cls(data["k"])
+        sketch.count = data["count"]
+        sketch.levels = [np.asarray(items, dtype=np.float64) for items in data["levels"]]
+        return sketch
+
+
+def _add_counts(target: Dict[Any, int], counts: Dict[Any, int]) -> None:
+    # Yeni etiketler sona eklenir: tek akışta Counter ile aynı (ilk görülme) sıra
+    for label, count in counts.items():
+        target[label] = target.get(label, 0) + count
+
+
+class StreamingStatistics:
+    """compute_statistics ile aynı raporu sabit bellekle üreten biriktirici"""
+
+    def __init__(self, edges: Sequence[float] = DEFAULT_HISTOGRAM_EDGES, k: int = DEFAULT_KLL_K,
+                 seed: Optional[int] = None):
+        self.total = 0
+        self.sentiments: Dict[Any, int] = {}
+        self.methods: Dict[Any, int] = {}
+        self.confidence = Welford()
+        self.histogram = FixedHistogram(edges)
+        self.sketch = KLLSketch(k, seed)
+        self.levels = {"yüksek": 0, "orta": 0, "düşük": 0}
+        # model -> [tutarlı, toplam]
+        self.models: Dict[Any, List[int]] = {}
+        # kova -> {"toplam", "sayilar", "guven_toplami"}
+        self.buckets = {name: {"toplam": 0, "sayilar": {}, "guven_toplami": 0.0} for name, _, _ in LENGTH_BUCKETS}
+
+    # ----- ekleme -----
+
+    def update_columns(self, columns: ResultColumns) -> None:
+        """Bir parçanın sütunlarını biriktiricilere işle"""
+        self.total += len(columns)
+        _add_counts(self.sentiments, counts_by_label(columns.sentiment, columns.sentiment_labels))
+        _add_counts(self.methods, counts_by_label(columns.method, columns.method_labels))
+
+        confidence = columns.confidence[columns.confidence > 0]
+        self.confidence.extend(confidence)
+        self.histogram.extend(confidence)
+        self.sketch.extend(confidence)
+        low, high = CONFIDENCE_LEVELS
+        self.levels["yüksek"] += int(np.count_nonzero(confidence >= high))
+        self.levels["orta"] += int(np.count_nonzero((confidence >= low) & (confidence < high)))
+        self.levels["düşük"] += int(np.count_nonzero(confidence < low))
+
+        mask = columns.has_model
+        if mask.any():
+            model = columns.model[mask]
+            totals = np.bincount(model, minlength=len(columns.model_labels))
+            consistent = np.bincount(model[columns.consistent[mask]], minlength=len(columns.model_labels))
+            for label, model_consistent, model_total in zip(columns.model_labels, consistent, totals):
+                if model_total:
+                    entry = self.models.setdefault(label, [0, 0])
+                    entry[0] += int(model_consistent)
+                    entry[1] += int(model_total)
+
+        valid = trend_mask(columns)
+        words = columns.word_count[valid]
+        sentiment = columns.sentiment[valid]
+        bucket_confidence = columns.confidence[valid]
+        for name, lower, upper in LENGTH_BUCKETS:
+            bucket_mask = words > lower
+            if upper is not None:
+                bucket_mask &= words <= upper
+            bucket = self.buckets[name]
+            bucket["toplam"] += int(np.count_nonzero(bucket_mask))
+            _add_counts(bucket["sayilar"], counts_by_label(sentiment[bucket_mask], columns.sentiment_labels))
+            bucket["guven_toplami"] += float(bucket_confidence[bucket_mask].sum())
+
+    def update(self, results: Iterable[Dict[str, Any]], chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """Sonuç akışını chunk_size'lık parçalarla tüket, işlenen sayıyı döndür"""
+        processed = 0
+        for chunk in chunked(results, chunk_size):
+            self.update_columns(ResultColumns.from_results(chunk))
+            processed += len(chunk)
+        return processed
+
+    def merge(self, other: "StreamingStatistics") -> "StreamingStatistics":
+        """Başka bir parçanın biriktiricisini bu biriktiriciye kat"""
+        self.total += other.total
+        _add_counts(self.sentiments, other.sentiments)
+        _add_counts(self.methods, other.methods)
+        self.confidence.merge(other.confidence)
+        self.histogram.merge(other.histogram)
+        self.sketch.merge(other.sketch)
+        _add_counts(self.levels, other.levels)
+        for label, (model_consistent, model_total) in other.models.items():
+            entry = self.models.setdefault(label, [0, 0])
+            entry[0] += model_consistent
+            entry[1] += model_total
+        for name, bucket in other.buckets.items():
+            target = self.buckets[name]
+            target["toplam"] += bucket["toplam"]
+            _add_counts(target["sayilar"], bucket["sayilar"])
+            target["guven_toplami"] += bucket["guven_toplami"]
+        return self
+
+    # ----- rapor -----
+
+    def summary(self, file_name: str = "akış", quantiles: Sequence[float] = DEFAULT_QUANTILES) -> Dict[str, Any]:
+        """compute_statistics biçimi + histogram, seviyeler, kantiller ve uzunluk kovaları"""
+        total = self.total
+
+        def distribution(counts: Dict[Any, int]) -> Dict[str, Dict[Any, float]]:
+            return {
+                "sayilar": dict(counts),
+                "yuzdeler": {label: count / total * 100 for label, count in counts.items()} if total else {}
+            }
+
+        if self.confidence.count:
+            moments = {
+                "ortalama": self.confidence.mean,
+                "minimum": self.confidence.minimum,
+                "maksimum": self.confidence.maximum,
+                "standart_sapma": self.confidence.std
+            }
+        else:
+            moments = {"ortalama": 0, "minimum": 0, "maksimum": 0, "standart_sapma": 0}
+
+        model_total = sum(entry[1] for entry in self.models.values())
+        if model_total:
+            consistency = {
+                "toplam_model_analizi": model_total,
+                "tutarlılık_oranı": sum(entry[0] for entry in self.models.values()) / model_total * 100,
+                "model_bazında": {
+                    label: {"tutarlı": consistent, "toplam": count, "yüzde": consistent / count * 100}
+                    for label, (consistent, count) in self.models.items()
+                }
+            }
+        else:
+            consistency = {"toplam_model_analizi": 0, "tutarlılık_oranı": 0}
+
+        edges = self.histogram.edges.tolist()
+        return {
+            "genel": {
+                "toplam_yorum": total,
+                "dosya_adi": file_name
+            },
+            "sentiment_dagilimi": distribution(self.sentiments),
+            "yontem_dagilimi": distribution(self.methods),
+            "guven_skorlari": moments,
+            "model_tutarliligi": consistency,
+            "guven_seviyeleri": dict(self.levels),
+            "guven_histogrami": [
+                {"alt": low, "ust": high, "sayi": int(count)}
+                for low, high, count in zip(edges, edges[1:], self.histogram.counts)
+            ],
+            "guven_kantilleri": {
+                f"p{q * 100:g}": value for q, value in zip(quantiles, self.sketch.quantiles(quantiles))
+            },
+            "uzunluk_kovalari": [
+                {
+                    "kategori": name,
+                    "toplam": bucket["toplam"],
+                    "sayilar": dict(bucket["sayilar"]),
+                    "ortalama_güven": bucket["guven_toplami"] / bucket["toplam"] if bucket["toplam"] else 0.0
+                }
+                for name, bucket in self.buckets.items()
+            ]
+        }
+
+    # ----- kalıcılık -----
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON'a yazılabilir kısmi biriktirici"""
+        return {
+            "version": STATE_VERSION,
+            "total": self.total,
+            # Etiketler JSON anahtarı olamayabilir (None); sıralı çiftler olarak sakla
+            "sentiments": list(self.sentiments.items()),
+            "methods": list(self.methods.items()),
+            "confidence": self.confidence.to_dict(),
+            "histogram": self.histogram.to_dict(),
+            "sketch": self.sketch.to_dict(),
+            "levels": self.levels,
+            "models": [[label, consistent, count] for label, (consistent, count) in self.models.items()],
+            "buckets": [
+                [name, bucket["toplam"], list(bucket["sayilar"].items()), bucket["guven_toplami"]]
+                for name, bucket in self.buckets.items()
+            ]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StreamingStatistics":
+        if data.get("version") != STATE_VERSION:
+            raise ValueError(f"Desteklenmeyen biriktirici sürümü: {data.get('version')}")
+        stats = cls(data["histogram"]["edges"], data["sketch"]["k"])
+        stats.total = data["total"]
+        stats.sentiments = {label: count for label, count in data["sentiments"]}
+        stats.methods = {label: count for label, count in data["methods"]}
+        stats.confidence = Welford.from_dict(data["confidence"])
+        stats.histogram = FixedHistogram.from_dict(data["histogram"])
+        stats.sketch = KLLSketch.from_dict(data["sketch"])
+        stats.levels = dict(data["levels"])
+        stats.models = {label: [consistent, count] for label, consistent, count in data["models"]}
+        stats.buckets = {
+            name: {"toplam": count, "sayilar": {label: n for label, n in sayilar}, "guven_toplami": total}
+            for name, count, sayilar, total in data["buckets"]
+        }
+        return stats
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: str) -> "StreamingStatistics":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+# ----- kaynaklar -----
+
+def chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def normalize_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Depo/dışa aktarma kaydını (text/sentiment/...) API sonuç biçimine çevir"""
+    if "analiz" in record:
+        return record
+    return {
+        "yorum": record.get("text", ""),
+        "analiz": record.get("sentiment"),
+        "güven": record.get("confidence"),
+        "yöntem": record.get("method", "bilinmiyor"),
+        "model_sonuçları": record.get("model_results")
+    }
+
+
+def parse_ndjson_lines(lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    for line in lines:
+        line = line.strip()
+        if line:
+            yield normalize_record(json.loads(line))
+
+
+def iter_ndjson_file(path: str) -> Iterator[Dict[str, Any]]:
+    """NDJSON dosyasını satır satır oku ("-" = standart girdi)"""
+    if path == "-":
+        yield from parse_ndjson_lines(sys.stdin)
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        yield from parse_ndjson_lines(f)
+
+
+def iter_api_stream(api_url: str, path: str, params: Optional[Dict[str, Any]] = None,
+                    timeout: float = 60.0) -> Iterator[Dict[str, Any]]:
+    """Çalışan API'nin NDJSON akışını (/export veya /jobs/{id}/results/stream) oku"""
+    import httpx
+
+    with httpx.Client(base_url=api_url.rstrip("/"), timeout=timeout) as client:
+        with client.stream("GET", path, params=params) as response:
+            if response.status_code != 200:
+                response.read()
+                raise RuntimeError(f"HTTP {response.status_code}: {response.text}")
+            yield from parse_ndjson_lines(response.iter_lines())
+
+
+def iter_export(api_url: str, sentiment: Optional[str] = None, method: Optional[str] = None,
+                since: Optional[str] = None, until: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    params = {"format": "ndjson", "sentiment": sentiment, "method": method, "since": since, "until": until}
+    return iter_api_stream(api_url, "/export", {key: value for key, value in params.items() if value is not None})
+
+
+def iter_job_results(api_url: str, job_id: str) -> Iterator[Dict[str, Any]]:
+    # İş sürüyorsa akış tamamlanana kadar bekler
+    return iter_api_stream(api_url, f"/jobs/{job_id}/results/stream", timeout=None)
+
+
+# ----- komut satırı -----
+
+def format_summary(stats: Dict[str, Any]) -> str:
+    """Özeti okunabilir metin olarak biçimlendir"""
+    total = stats["genel"]["toplam_yorum"]
+    lines = [f"📊 Toplam Yorum: {total} ({stats['genel']['dosya_adi']})", "🎯 Sentiment Dağılımı:"]
+    for sentiment, count in most_common(stats["sentiment_dagilimi"]["sayilar"]):
+        lines.append(f"   {sentiment}: {count} ({stats['sentiment_dagilimi']['yuzdeler'][sentiment]:.1f}%)")
+    lines.append("🔧 Yöntem Dağılımı:")
+    for method, count in most_common(stats["yontem_dagilimi"]["sayilar"]):
+        lines.append(f"   {method}: {count} ({stats['yontem_dagilimi']['yuzdeler'][method]:.1f}%)")
+
+    moments = stats["guven_skorlari"]
+    lines.append("📈 Güven Skorları:")
+    lines.append(f"   Ortalama: {moments['ortalama']:.3f}  Standart Sapma: {moments['standart_sapma']:.3f}")
+    lines.append(f"   Min-Max: {moments['minimum']:.3f} - {moments['maksimum']:.3f}")
+    quantiles = ["{}={:.3f}".format(name, value) for name, value in stats["guven_kantilleri"].items()
+                 if value is not None]
+    if quantiles:
+        lines.append(f"   Kantiller (yaklaşık): {'  '.join(quantiles)}")
+    counted = sum(row["sayi"] for row in stats["guven_histogrami"])
+    for row in stats["guven_histogrami"]:
+        if row["sayi"]:
+            bar = "█" * int(row["sayi"] / counted * 30)
+            lines.append(f"   {row['alt']:.1f}-{row['ust']:.1f}: {bar} {row['sayi']}")
+
+    consistency = stats["model_tutarliligi"]
+    if consistency["toplam_model_analizi"]:
+        lines.append(f"🤖 Model Tutarlılığı: {consistency['tutarlılık_oranı']:.1f}%")
+        for model, model_stats in consistency["model_bazında"].items():
+            lines.append(f"   {model}: {model_stats['yüzde']:.1f}% tutarlı ({model_stats['toplam']} analiz)")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Sonuç akışlarından sabit bellekle istatistik üret")
+    parser.add_argument("files", nargs="*", help="NDJSON dosyaları (/export?format=ndjson veya iş sonuçları; - = stdin)")
+    parser.add_argument("--api-url", type=str, default=None, help="Çalışan API adresi (dosya verilmezse /export akışı)")
+    parser.add_argument("--job", type=str, default=None, help="--api-url ile: bu işin sonuç akışını oku")
+    parser.add_argument("--sentiment", type=str, default=None, help="/export filtresi")
+    parser.add_argument("--method", type=str, default=None, help="/export filtresi")
+    parser.add_argument("--since", type=str, default=None, help="/export filtresi (ISO tarih)")
+    parser.add_argument("--until", type=str, default=None, help="/export filtresi (ISO tarih)")
+    parser.add_argument("--merge", nargs="+", default=[], help="Birleştirilecek kısmi biriktirici JSON dosyaları")
+    parser.add_argument("--save", type=str, default=None, help="Kısmi biriktiriciyi bu JSON dosyasına kaydet")
+    parser.add_argument("--output", type=str, default=None, help="Özeti JSON olarak bu dosyaya yaz")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Parça başına sonuç")
+    parser.add_argument("--k", type=int, default=DEFAULT_KLL_K, help="KLL taslak boyutu (büyüdükçe kantiller daha kesin)")
+    args = parser.parse_args()
+
+    if not args.files and not args.merge and not args.api_url:
+        parser.error("NDJSON dosyası, --api-url veya --merge gerekli")
+
+    stats = StreamingStatistics(k=args.k)
+    sources = []
+    for path in args.merge:
+        stats.merge(StreamingStatistics.load(path))
+        sources.append(path)
+        print(f"🔗 {path} birleştirildi")
+
+    try:
+        for path in args.files:
+            count = stats.update(iter_ndjson_file(path), args.chunk_size)
+            sources.append(path)
+            print(f"📁 {path}: {count} sonuç işlendi")
+        if args.api_url and args.job:
+            count = stats.update(iter_job_results(args.api_url, args.job), args.chunk_size)
+            sources.append(f"iş {args.job}")
+            print(f"🌐 İş {args.job}: {count} sonuç işlendi")
+        elif args.api_url and not args.files:
+            count = stats.update(iter_export(args.api_url, args.sentiment, args.method, args.since, args.until),
+                                 args.chunk_size)
+            sources.append(args.api_url)
+            print(f"🌐 {args.api_url}/export: {count} sonuç işlendi")
+    except Exception as e:
+        print(f"❌ Akış okunamadı: {e}")
+        raise SystemExit(1)
+
+    if args.save:
+        stats.save(args.save)
+        print(f"💾 Kısmi biriktirici {args.save} dosyasına kaydedildi")
+
+    summary = stats.summary(", ".join(sources))
+    print("\n" + format_summary(summary))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+        print(f"\n✅ Özet {args.output} dosyasına kaydedildi")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Yorum Deposu Özet İstatistikleri - /statistics/summary için artımlı toplamlar
+
+Yorum deposunun ekleme/silme olaylarıyla güncellenir: duygu, yöntem ve model
+sayımları, güven momentleri (Welford, silmede geri alınır), güven histogramı
+ve seviyeleri, uzunluk kovaları. Özet yalnızca depo değiştiğinde yeniden
+oluşturulur; aradaki istekler önbellekteki sözlüğü alır.
+
+Silinen yorum o anki en küçük/en büyük güven ise min/max bir sonraki özette
+depodan yeniden hesaplanır (nadir, O(n)).
+"""
+
+import threading
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+from statistics_core import CONFIDENCE_LEVELS, LENGTH_BUCKETS, UNKNOWN_METHOD
+from statistics_stream import DEFAULT_HISTOGRAM_EDGES, StreamingStatistics
+
+
+def _add(counts: Dict[Any, int], label: Any, delta: int) -> None:
+    counts[label] = counts.get(label, 0) + delta
+
+
+def _nonzero(counts: Dict[Any, int]) -> Dict[Any, int]:
+    return {label: count for label, count in counts.items() if count}
+
+
+class StoreAggregates(StreamingStatistics):
+    """Depo olaylarıyla artımlı güncellenen, silmeyi destekleyen özet"""
+
+    def __init__(self, source: Optional[Callable[[], Iterable[Dict[str, Any]]]] = None,
+                 edges: Sequence[float] = DEFAULT_HISTOGRAM_EDGES):
+        super().__init__(edges)
+        # Min/max yeniden hesaplanırken canlı yorumları veren fonksiyon
+        self._source = source
+        self._lock = threading.Lock()
+        self._extremes_stale = False
+        self.version = 0
+        self._cached: Optional[Tuple[int, Dict[str, Any]]] = None
+
+    # ----- depo olayları -----
+
+    def add_comment(self, comment: Dict[str, Any]) -> None:
+        with self._lock:
+            self._apply(comment, +1)
+
+    def remove_comment(self, comment: Dict[str, Any]) -> None:
+        with self._lock:
+            self._apply(comment, -1)
+
+    def _apply(self, comment: Dict[str, Any], delta: int) -> None:
+        self.version += 1
+        self.total += delta
+        sentiment = comment.get("sentiment")
+        _add(self.sentiments, sentiment, delta)
+        _add(self.methods, comment.get("method", UNKNOWN_METHOD), delta)
+
+        confidence = comment.get("confidence") or 0
+        if confidence > 0:
+            if delta > 0:
+                self.confidence.update(confidence)
+            else:
+                if confidence <= self.confidence.minimum or confidence >= self.confidence.maximum:
+                    self._extremes_stale = True
+                self.confidence.remove(confidence)
+            self.histogram.add(confidence, delta)
+            low, high = CONFIDENCE_LEVELS
+            level = "yüksek" if confidence >= high else ("orta" if confidence >= low else "düşük")
+            self.levels[level] += delta
+
+        model_results = comment.get("model_results")
+        if model_results and "consistency" in model_results:
+            entry = self.models.setdefault(model_results.get("model_used", UNKNOWN_METHOD), [0, 0])
+            entry[0] += delta if model_results["consistency"] else 0
+            entry[1] += delta
+
+        # Uzunluk kovaları: trend_mask ile aynı filtre (metin, duygu ve pozitif güven)
+        text = comment.get("text") or ""
+        if text and sentiment and confidence > 0:
+            words = len(text.split())
+            for name, lower, upper in LENGTH_BUCKETS:
+                if words > lower and (upper is None or words <= upper):
+                    bucket = self.buckets[name]
+                    bucket["toplam"] += delta
+                    _add(bucket["sayilar"], sentiment, delta)
+                    bucket["guven_toplami"] += delta * confidence
+                    break
+
+    def _refresh_extremes(self) -> None:
+        minimum = maximum = None
+        for comment in self._source():
+            confidence = comment.get("confidence") or 0
+            if confidence > 0:
+                minimum = confidence if minimum is None else min(minimum, confidence)
+                maximum = confidence if maximum is None else max(maximum, confidence)
+        self.confidence.minimum, self.confidence.maximum = minimum, maximum
+        self._extremes_stale = False
+
+    # ----- özet -----
+
+    def summary(self, file_name: str = "yorum deposu", quantiles: Sequence[float] = ()) -> Dict[str, Any]:
+        """Önbellekli özet (depo değişmediyse aynı sözlük döner)"""
+        with self._lock:
+            cached = self._cached
+            if cached is not None and cached[0] == self.version:
+                return cached[1]
+            if self._extremes_stale and self._source is not None:
+                self._refresh_extremes()
+            # Silmeyle sıfıra inen etiketler özetten çıkarılır
+            self.sentiments, self.methods = _nonzero(self.sentiments), _nonzero(self.methods)
+            self.models = {label: entry for label, entry in self.models.items() if entry[1]}
+            for bucket in self.buckets.values():
+                bucket["sayilar"] = _nonzero(bucket["sayilar"])
+            result = super().summary(file_name, quantiles)
+            result["surum"] = self.version
+            self._cached = (self.version, result)
+            return result
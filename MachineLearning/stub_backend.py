@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Çevrimdışı Stub Model Arka Ucu
+
+Hub'dan ~440 MB'lık modelleri indirmek yerine küçük, rastgele başlatılmış
+BERT sınıflandırıcıları yerel bir yapılandırmadan üretir. Modeller ve
+tokenizer gerçek modellerle aynı arayüzle (from_pretrained) diske yazılır;
+böylece API'nin toplu analiz, önbellek ve depo katmanları ağ olmadan test
+ve benchmark edilebilir.
+
+Ağırlıklar sabit tohumla üretilir: aynı yapılandırma her makinede aynı
+çıktıları verir. Etiketler MAPPINGS'teki anahtarlardan gelir, dolayısıyla
+etiket eşleme kodu da gerçek modellerdeki gibi çalışır.
+
+Kullanım:
+    SENTIMENT_BACKEND=stub uvicorn sentiment_api:app
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import string
+import tempfile
+import zlib
+from typing import List, Optional
+
+STUB_DIR = os.environ.get("SENTIMENT_STUB_DIR", "stub_models")
+STUB_SEED = int(os.environ.get("SENTIMENT_STUB_SEED", "1234"))
+
+# Küçük BERT yapılandırması (gerçek model: 12 katman, 768 boyut)
+STUB_CONFIG = {
+    "hidden_size": 32,
+    "num_hidden_layers": 2,
+    "num_attention_heads": 2,
+    "intermediate_size": 64,
+    "max_position_embeddings": 512,
+    # Varsayılan 0.02 ile çıktılar girdiden neredeyse bağımsız olur
+    "initializer_range": 0.5
+}
+
+SPECIAL_TOKENS = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"]
+TURKISH_LETTERS = "çğıöşüÇĞİÖŞÜâîûÂÎÛ"
+
+
+def stub_vocab() -> List[str]:
+    """Karakter düzeyinde WordPiece sözlüğü (her kelime harflerine bölünür)"""
+    characters = string.ascii_letters + TURKISH_LETTERS + string.digits + string.punctuation
+    return SPECIAL_TOKENS + list(characters) + [f"##{char}" for char in characters]
+
+
+def stub_fingerprint(labels: List[str], seed: int) -> str:
+    payload = json.dumps({"labels": labels, "seed": seed, "config": STUB_CONFIG, "vocab": stub_vocab()},
+                         sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:8]
+
+
+def build_stub_model(path: str, labels: List[str], seed: int) -> None:
+    """Tokenizer ve rastgele başlatılmış modeli path dizinine yaz"""
+    import torch
+    from transformers import BertConfig, BertForSequenceClassification, BertTokenizerFast
+
+    os.makedirs(path, exist_ok=True)
+    vocab = stub_vocab()
+    vocab_file = os.path.join(path, "vocab.txt")
+    with open(vocab_file, "w", encoding="utf-8") as f:
+        f.write("\n".join(vocab) + "\n")
+    tokenizer = BertTokenizerFast(vocab_file=vocab_file, do_lower_case=False)
+    tokenizer.save_pretrained(path)
+
+    config = BertConfig(
+        vocab_size=len(vocab),
+        num_labels=len(labels),
+        id2label=dict(enumerate(labels)),
+        label2id={label: index for index, label in enumerate(labels)},
+        **STUB_CONFIG
+    )
+    torch.manual_seed(seed)
+    model = BertForSequenceClassification(config)
+    model.eval()
+    model.save_pretrained(path)
+
+
+def ensure_stub_model(model_id: str, labels: List[str], directory: Optional[str] = None,
+                      seed: Optional[int] = None) -> str:
+    """Stub modelin dizinini döndür; yoksa üret
+
+    Dizin adı yapılandırmanın parmak izini içerir, yapılandırma değişince
+    eski modeller yeniden kullanılmaz.
+    """
+    directory = directory or STUB_DIR
+    # Her model farklı ağırlık alır ama tohum model kimliğinden türetildiği için sabittir
+    model_seed = (STUB_SEED if seed is None else seed) + zlib.crc32(model_id.encode("utf-8"))
+    path = os.path.join(directory, f"{model_id}-{stub_fingerprint(labels, model_seed)}")
+    if not os.path.exists(os.path.join(path, "config.json")):
+        # Geçici dizinde üretip yeniden adlandır: aynı anda başlayan süreçler yarım model görmez
+        os.makedirs(directory, exist_ok=True)
+        staging = tempfile.mkdtemp(prefix=f".{model_id}-", dir=directory)
+        try:
+            build_stub_model(staging, labels, model_seed)
+            os.replace(staging, path)
+        except OSError:
+            if not os.path.exists(os.path.join(path, "config.json")):
+                raise
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+    return path
+
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Akış Halinde Dosya Okuma - yüklenen CSV/TXT dosyalarını parça parça çözümler
+
+İstek gövdesi ham dosya (Content-Type: text/plain, text/csv) veya
+multipart/form-data olabilir. Her iki durumda da dosyanın tamamı belleğe
+alınmaz; yorumlar parçalar geldikçe üretilir.
+"""
+
+import codecs
+import csv
+from typing import AsyncIterator, Iterable, Iterator, List, Optional
+
+try:
+    from python_multipart.multipart import MultipartParser, parse_options_header
+except ImportError:  # eski python-multipart sürümleri
+    from multipart.multipart import MultipartParser, parse_options_header
+
+SUPPORTED_FORMATS = ("csv", "txt")
+
+# Tek bir satırın en fazla boyutu; satır sonu içermeyen gövde belleği doldurmasın
+MAX_LINE_CHARS = 1024 * 1024
+
+# str.splitlines'ın satır sonu saydığı karakterler
+_LINE_BREAKS = "\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029"
+
+
+class UploadFormatError(ValueError):
+    """Desteklenmeyen veya belirlenemeyen dosya formatı"""
+
+
+def detect_format(filename: Optional[str], content_type: str = "") -> Optional[str]:
+    """Dosya adı veya içerik türünden csv/txt formatını bul"""
+    if filename:
+        lowered = filename.lower()
+        for fmt in SUPPORTED_FORMATS:
+            if lowered.endswith("." + fmt):
+                return fmt
+    if "csv" in content_type:
+        return "csv"
+    if content_type.startswith("text/plain"):
+        return "txt"
+    return None
+
+
+class IncrementalLineReader:
+    """Bayt parçalarını UTF-8 olarak çözüp tam satırlara böler
+
+    Yalnızca yeni gelen parça taranır; yarım satır parçalar halinde tutulur
+    ve MAX_LINE_CHARS'ı aşarsa UploadFormatError verilir.
+    """
+
+    def __init__(self, max_line_chars: int = MAX_LINE_CHARS):
+        self.max_line_chars = max_line_chars
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._pending: List[str] = []
+        self._pending_chars = 0
+
+    def feed(self, data: bytes) -> List[str]:
+        return self._split(self._decoder.decode(data))
+
+    def close(self) -> List[str]:
+        lines = self._split(self._decoder.decode(b"", final=True))
+        if self._pending:
+            lines.append(self._take_pending())
+        return lines
+
+    def _split(self, text: str) -> List[str]:
+        if not text:
+            return []
+        lines = text.splitlines(keepends=True)
+        complete = []
+        if self._pending:
+            if self._pending[-1].endswith("\r") and not text.startswith("\n"):
+                # '\r' tek başına satır sonuymuş
+                complete.append(self._take_pending())
+            else:
+                self._append_pending(lines.pop(0))
+                last = self._pending[-1]
+                if last[-1] in _LINE_BREAKS and (lines or not last.endswith("\r")):
+                    complete.append(self._take_pending())
+        # Son satır yarım olabilir ('\r' de '\r\n'nin ilk yarısı olabilir)
+        if lines and (lines[-1][-1] not in _LINE_BREAKS or lines[-1].endswith("\r")):
+            self._append_pending(lines.pop())
+        if len(text) > self.max_line_chars and any(len(line) > self.max_line_chars for line in lines):
+            self._pending, self._pending_chars = [], 0
+            raise UploadFormatError(f"Satır çok uzun (en fazla {self.max_line_chars} karakter)")
+        complete.extend(lines)
+        return complete
+
+    def _append_pending(self, piece: str) -> None:
+        self._pending.append(piece)
+        self._pending_chars += len(piece)
+        if self._pending_chars > self.max_line_chars:
+            self._pending, self._pending_chars = [], 0
+            raise UploadFormatError(f"Satır çok uzun (en fazla {self.max_line_chars} karakter)")
+
+    def _take_pending(self) -> str:
+        line = "".join(self._pending)
+        self._pending, self._pending_chars = [], 0
+        return line
+
+
+def iter_txt_comments(lines: Iterable[str]) -> Iterator[str]:
+    """TXT satırlarından boş olmayan yorumları üret"""
+    for line in lines:
+        line = line.strip()
+        if line:
+            yield line
+
+
+# Tek bir CSV kaydının (tırnak içindeki satır sonları dahil) en fazla boyutu;
+# kapanmamış bir tırnak dosyanın geri kalanını tek kayıtta biriktirmesin
+MAX_CSV_RECORD_CHARS = 1024 * 1024
+
+
+class CsvCommentParser:
+    """CSV satırlarını kayıtlara birleştirip ilk sütunu yorum olarak döndürür
+
+    Tırnak durumu csv modülünün kurallarıyla izlenir: yalnızca alan başındaki
+    tırnak alanı açar, alan ortasındaki tırnak (ör. 5" ekran) düz karakterdir.
+    Açık tırnaklı kayıt MAX_CSV_RECORD_CHARS'ı aşarsa UploadFormatError
+    verilir.
+    """
+
+    def __init__(self, max_record_chars: int = MAX_CSV_RECORD_CHARS):
+        self.max_record_chars = max_record_chars
+        self._pending: List[str] = []
+        self._pending_chars = 0
+        self._in_quotes = False
+        self._line_number = 0
+        self._record_start = 0
+
+    def feed(self, lines: Iterable[str]) -> Iterator[str]:
+        for line in lines:
+            self._line_number += 1
+            if not self._pending:
+                self._record_start = self._line_number
+            self._pending.append(line)
+            self._pending_chars += len(line)
+            if '"' in line:
+                self._in_quotes = self._ends_in_quotes(line, self._in_quotes)
+            if not self._in_quotes:
+                yield from self._flush()
+            elif self._pending_chars > self.max_record_chars:
+                start = self._record_start
+                self._reset()
+                raise UploadFormatError(
+                    f"CSV kaydı çok uzun ({start}. satırdan itibaren): kapanmamış tırnak olabilir")
+
+    def close(self) -> Iterator[str]:
+        if self._pending:
+            yield from self._flush()
+
+    @staticmethod
+    def _ends_in_quotes(line: str, in_quotes: bool) -> bool:
+        """Satır sonunda tırnaklı bir alanın içinde kalınıp kalınmadığı"""
+        i = line.find('"')
+        while i != -1:
+            if in_quotes:
+                if line.startswith('""', i):
+                    # Kaçışlı tırnak
+                    i = line.find('"', i + 2)
+                    continue
+                in_quotes = False
+            elif i == 0 or line[i - 1] == ",":
+                in_quotes = True
+            i = line.find('"', i + 1)
+        return in_quotes
+
+    def _reset(self):
+        self._pending = []
+        self._pending_chars = 0
+        self._in_quotes = False
+
+    def _flush(self) -> Iterator[str]:
+        record = "".join(self._pending)
+        self._reset()
+        for row in csv.reader(record.splitlines(keepends=True)):
+            if row and row[0].strip():
+                yield row[0].strip()
+
+
+class MultipartFileReader:
+    """multipart/form-data gövdesinden ilk dosya parçasının baytlarını akıtır"""
+
+    def __init__(self, content_type: str):
+        _, params = parse_options_header(content_type)
+        boundary = params.get(b"boundary")
+        if not boundary:
+            raise UploadFormatError("multipart sınırı (boundary) bulunamadı")
+        self.filename: Optional[str] = None
+        self.content_type = ""
+        self._chunks: List[bytes] = []
+        self._header_field = b""
+        self._header_value = b""
+        self._headers = {}
+        self._in_file = False
+        self._done = False
+        self._parser = MultipartParser(boundary, {
+            "on_part_begin": self._on_part_begin,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+        })
+
+    def _on_part_begin(self):
+        self._headers = {}
+
+    def _on_header_field(self, data, start, end):
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data, start, end):
+        self._header_value += data[start:end]
+
+    def _on_header_end(self):
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self):
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        if self.filename is None and b"filename" in options:
+            self.filename = options[b"filename"].decode("utf-8", errors="replace")
+            self.content_type = self._headers.get(b"content-type", b"").decode("latin-1")
+            self._in_file = True
+
+    def _on_part_data(self, data, start, end):
+        if self._in_file and not self._done:
+            self._chunks.append(bytes(data[start:end]))
+
+    def _on_part_end(self):
+        if self._in_file:
+            self._in_file = False
+            self._done = True
+
+    def feed(self, data: bytes) -> bytes:
+        """Gövde parçasını işle, dosyaya ait yeni baytları döndür"""
+        self._parser.write(data)
+        chunk = b"".join(self._chunks)
+        self._chunks = []
+        return chunk
+
+
+class UploadCommentStream:
+    """İstek gövdesinden yorumları parça parça üreten akış"""
+
+    def __init__(self, body: AsyncIterator[bytes], content_type: str,
+                 fmt: Optional[str] = None, filename: Optional[str] = None):
+        self._body = body.__aiter__()
+        self._multipart = MultipartFileReader(content_type) if content_type.startswith("multipart/") else None
+        self._content_type = content_type
+        self._buffered: List[bytes] = []
+        self._body_done = False
+        self.filename = filename
+        self.format = fmt.lower() if fmt else None
+        self.bytes_read = 0
+
+    async def _next_file_bytes(self) -> Optional[bytes]:
+        """Sıradaki dosya baytlarını oku (gövde bittiğinde None)"""
+        if self._buffered:
+            return self._buffered.pop(0)
+        while not self._body_done:
+            try:
+                chunk = await self._body.__anext__()
+            except StopAsyncIteration:
+                self._body_done = True
+                break
+            self.bytes_read += len(chunk)
+            data = self._multipart.feed(chunk) if self._multipart else chunk
+            if data:
+                return data
+        return None
+
+    async def start(self) -> str:
+        """Dosya adı ve formatı belli olana kadar oku, formatı döndür"""
+        if self._multipart:
+            while self._multipart.filename is None and not self._body_done:
+                data = await self._next_file_bytes()
+                if data:
+                    self._buffered.append(data)
+            self.filename = self.filename or self._multipart.filename
+            content_type = self._multipart.content_type
+        else:
+            content_type = self._content_type
+        self.format = self.format or detect_format(self.filename, content_type)
+        if self.format not in SUPPORTED_FORMATS:
+            raise UploadFormatError("Sadece .csv ve .txt dosyaları desteklenir")
+        return self.format
+
+    async def comments(self) -> AsyncIterator[str]:
+        """Yorumları dosya okundukça üret"""
+        reader = IncrementalLineReader()
+        csv_parser = CsvCommentParser() if self.format == "csv" else None
+        while True:
+            data = await self._next_file_bytes()
+            lines = reader.feed(data) if data is not None else reader.close()
+            if csv_parser:
+                for comment in csv_parser.feed(lines):
+                    yield comment
+            else:
+                for comment in iter_txt_comments(lines):
+                    yield comment
+            if data is None:
+                break
+        if csv_parser:
+            for comment in csv_parser.close():
+                yield comment